@@ -0,0 +1,9 @@
+"""
+개발 서버 실행 엔트리포인트
+
+사용법: python -m backend.src
+"""
+
+from .main import run_dev_server
+
+run_dev_server()
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database import get_async_session
 from ..lib.settings_manager import SettingsManager, SettingsManagerError
+from ..services.settings_cache import invalidate_settings_cache
 
 
 # API 라우터 생성
@@ -120,6 +121,8 @@ async def update_settings(
             raise HTTPException(status_code=400, detail="업데이트할 필드가 없습니다")
 
         settings = await manager.update_settings(updates)
+        # 변경된 설정이 다음 조회부터 반영되도록 캐시 무효화
+        invalidate_settings_cache()
         return manager.to_dict(settings)
 
     except SettingsManagerError as e:
@@ -130,7 +130,7 @@ async def get_ssl_status_summary(
 
         status_counts = {status.value: 0 for status in SSLStatus}
         for status, in status_result.all():
-            status_counts[status.value] = status_counts.get(status.value, 0) + 1
+            status_counts[status] = status_counts.get(status, 0) + 1
 
         # 만료 임박 통계
         now = datetime.utcnow()
@@ -261,7 +261,7 @@ async def get_ssl_certificates(
                 issued_date=cert.issued_date,
                 expiry_date=cert.expiry_date,
                 fingerprint=cert.fingerprint,
-                status=cert.status.value,
+                status=str(cert.status),
                 days_until_expiry=cert.days_until_expiry(),
                 is_expired=cert.is_expired(),
                 created_at=cert.created_at,
@@ -326,7 +326,7 @@ async def get_ssl_certificate(
             issued_date=cert.issued_date,
             expiry_date=cert.expiry_date,
             fingerprint=cert.fingerprint,
-            status=cert.status.value,
+            status=str(cert.status),
             days_until_expiry=cert.days_until_expiry(),
             is_expired=cert.is_expired(),
             created_at=cert.created_at,
@@ -391,7 +391,7 @@ async def get_ssl_history(
 
             history_entries.append(SSLHistoryEntry(
                 check_date=cert.created_at,
-                status=cert.status.value,
+                status=str(cert.status),
                 issuer=cert.issuer,
                 expiry_date=cert.expiry_date,
                 days_until_expiry=cert.days_until_expiry(),
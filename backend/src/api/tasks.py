@@ -15,6 +15,7 @@ from ..background import (
     get_background_executor,
     submit_ssl_check,
     submit_notification_task,
+    submit_manual_notification,
     TaskStatus,
     TaskPriority
 )
@@ -49,6 +50,13 @@ class SubmitNotificationRequest(BaseModel):
     priority: str = Field("high", description="작업 우선순위 (low, normal, high, critical)")
 
 
+class SubmitManualNotificationRequest(BaseModel):
+    """수동 알림 작업 제출 요청"""
+    notification_type: str = Field(..., description="알림 타입 (expiry, error, test)")
+    website_id: Optional[str] = Field(None, description="대상 웹사이트 ID (expiry, error)")
+    error_message: Optional[str] = Field(None, description="오류 알림 메시지 (error)")
+
+
 class TaskSubmissionResponse(BaseModel):
     """작업 제출 응답"""
     task_id: str = Field(..., description="작업 ID")
@@ -113,6 +121,7 @@ async def trigger_scheduled_job(request: TriggerJobRequest) -> Dict[str, Any]:
     스케줄된 작업 수동 실행
 
     등록된 스케줄 작업을 즉시 실행합니다.
+    작업 완료를 기다리지 않고 task_id를 반환합니다.
     """
     try:
         scheduler = get_scheduler()
@@ -127,6 +136,25 @@ async def trigger_scheduled_job(request: TriggerJobRequest) -> Dict[str, Any]:
         )
 
 
+@router.get("/scheduler/trigger/{task_id}", response_model=Dict[str, Any])
+async def get_triggered_job_result(task_id: str) -> Dict[str, Any]:
+    """
+    수동 실행 작업 결과 조회
+
+    /scheduler/trigger가 반환한 task_id로 작업 진행 상태와 결과를 조회합니다.
+    """
+    scheduler = get_scheduler()
+    result = scheduler.get_trigger_result(task_id)
+
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="작업을 찾을 수 없습니다"
+        )
+
+    return result
+
+
 # 백그라운드 작업 관리 엔드포인트
 
 @router.post("/background/ssl-check", response_model=TaskSubmissionResponse)
@@ -203,6 +231,49 @@ async def submit_notification_task_endpoint(request: SubmitNotificationRequest)
         )
 
 
+@router.post("/background/manual-notification", response_model=TaskSubmissionResponse)
+async def submit_manual_notification_endpoint(
+    request: SubmitManualNotificationRequest
+) -> TaskSubmissionResponse:
+    """
+    수동 알림 작업 제출
+
+    수동 알림(만료/오류/테스트)을 백그라운드에서 발송합니다.
+    DB 조회와 웹훅 발송을 기다리지 않고 task_id를 즉시 반환합니다.
+    """
+    if request.notification_type not in ("expiry", "error", "test"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 알림 타입: {request.notification_type}"
+        )
+
+    if request.notification_type != "test" and not request.website_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="website_id가 필요합니다"
+        )
+
+    try:
+        target_data: Dict[str, Any] = {"website_id": request.website_id}
+        if request.error_message:
+            target_data["error_message"] = request.error_message
+
+        # 작업 제출
+        task_id = submit_manual_notification(request.notification_type, target_data)
+
+        return TaskSubmissionResponse(
+            task_id=task_id,
+            status="submitted",
+            message="수동 알림 작업이 성공적으로 제출되었습니다"
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"수동 알림 작업 제출 실패: {str(e)}"
+        )
+
+
 @router.get("/background/tasks", response_model=List[BackgroundTaskResponse])
 async def list_background_tasks(
     task_status: Optional[str] = Query(None, description="작업 상태 필터"),
@@ -13,7 +13,7 @@ from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Union, Coroutine
 from dataclasses import dataclass, field
 
-from .database import get_async_session
+from .database import with_session
 from .services.ssl_service import SSLService
 from .services.notification_service import NotificationService
 from .services.website_service import WebsiteService
@@ -544,8 +544,8 @@ async def stop_background_executor() -> None:
 
 async def run_ssl_check_task(website_ids: Optional[List[str]] = None) -> Dict[str, Any]:
     """SSL 체크 작업 실행"""
-    async with get_async_session() as session:
-        ssl_service = SSLService(session)
+    async with with_session():
+        ssl_service = SSLService()
 
         if website_ids:
             # 특정 웹사이트들 체크
@@ -560,9 +560,8 @@ async def run_ssl_check_task(website_ids: Optional[List[str]] = None) -> Dict[st
 
 async def run_notification_task(notification_days: Optional[List[int]] = None) -> Dict[str, Any]:
     """만료 알림 작업 실행"""
-    async with get_async_session() as session:
+    async with with_session():
         notification_service = NotificationService(
-            session=session,
             notification_days=notification_days or [30, 14, 7, 3, 1]
         )
 
@@ -570,6 +569,18 @@ async def run_notification_task(notification_days: Optional[List[int]] = None) -
         return result
 
 
+async def run_manual_notification_task(
+    notification_type: str,
+    target_data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """수동 알림 작업 실행"""
+    async with with_session():
+        notification_service = NotificationService()
+
+        sent = await notification_service.send_manual_notification(notification_type, target_data)
+        return {"notification_type": notification_type, "notification_sent": sent}
+
+
 def submit_ssl_check(
     website_ids: Optional[List[str]] = None,
     priority: TaskPriority = TaskPriority.NORMAL
@@ -597,4 +608,22 @@ def submit_notification_task(
         name="SSL Expiry Notifications",
         priority=priority,
         timeout=300.0  # 5분
-    )
\ No newline at end of file
+    )
+
+
+def submit_manual_notification(
+    notification_type: str,
+    target_data: Dict[str, Any],
+    priority: TaskPriority = TaskPriority.HIGH
+) -> str:
+    """수동 알림 작업 제출 (요청 경로에서 DB 조회/웹훅 발송을 기다리지 않음)"""
+    executor = get_background_executor()
+    return executor.submit_task(
+        run_manual_notification_task,
+        notification_type,
+        target_data,
+        name=f"Manual Notification ({notification_type})",
+        priority=priority,
+        max_retries=0,  # 타임아웃 후 재시도하면 같은 알림이 중복 발송되므로 재시도하지 않음
+        timeout=120.0  # 2분
+    )
@@ -4,11 +4,14 @@
 SQLAlchemy 엔진, 세션 관리, 마이그레이션을 담당합니다.
 """
 
+import hashlib
 import os
+import uuid
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import AsyncGenerator, Optional
 
-from sqlalchemy import create_engine, MetaData, text
+from sqlalchemy import create_engine, inspect, MetaData, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
@@ -19,6 +22,7 @@ try:
     # 패키지로 실행될 때 (python -m backend.src.database)
     from .models.website import Base
     from .models.ssl_certificate import SSLCertificate  # Import to register the table
+    from .models.notification_log import NotificationLog  # Import to register the table
 except ImportError:
     # 직접 실행될 때 (python database.py)
     import sys
@@ -27,6 +31,7 @@ except ImportError:
 
     from models.website import Base
     from models.ssl_certificate import SSLCertificate  # Import to register the table
+    from models.notification_log import NotificationLog  # Import to register the table
 
 
 class DatabaseConfig:
@@ -219,8 +224,174 @@ class DatabaseManager:
     async def init_database(self) -> None:
         """데이터베이스 초기화 (테이블 생성 + 인덱스)"""
         await self.create_all_tables()
+        await self._migrate_ssl_status_column()
+        await self._migrate_guid_columns()
+        await self._migrate_fingerprint_column()
+        await self._set_server_defaults()
+        await self._add_expiry_epoch_column()
         await self._create_indexes()
 
+    async def _add_expiry_epoch_column(self) -> None:
+        """기존 ssl_certificates 테이블에 expiry_epoch 컬럼 추가 및 값 채우기"""
+        async with self.async_engine.begin() as conn:
+            try:
+                columns = await conn.run_sync(
+                    lambda sync_conn: {
+                        column["name"]
+                        for column in inspect(sync_conn).get_columns("ssl_certificates")
+                    }
+                )
+                if "expiry_epoch" not in columns:
+                    await conn.execute(text(
+                        "ALTER TABLE ssl_certificates ADD COLUMN expiry_epoch BIGINT"
+                    ))
+                    await conn.execute(text(
+                        "CREATE INDEX IF NOT EXISTS ix_ssl_certificates_expiry_epoch "
+                        "ON ssl_certificates (expiry_epoch)"
+                    ))
+
+                if self.config.is_postgresql:
+                    epoch_sql = "CAST(EXTRACT(EPOCH FROM expiry_date) AS BIGINT)"
+                else:
+                    epoch_sql = "CAST(strftime('%s', expiry_date) AS INTEGER)"
+                await conn.execute(text(
+                    f"UPDATE ssl_certificates SET expiry_epoch = {epoch_sql} "
+                    "WHERE expiry_epoch IS NULL"
+                ))
+            except Exception as e:
+                print(f"expiry_epoch 컬럼 추가 실패: {e}")
+
+    async def _set_server_defaults(self) -> None:
+        """PostgreSQL 기존 테이블에 DB 측 기본값 설정
+
+        UUID 기본 키는 gen_random_uuid()로 생성합니다. ORM 객체는 식별자 맵 등록을 위해
+        Python 기본값(uuid4)을 그대로 사용하고, id를 지정하지 않는 일괄 적재
+        (SSLCertificate.bulk_copy)에서 DB 기본값이 사용됩니다.
+        last_checked는 모델의 server_default와 같이 CURRENT_TIMESTAMP를 기본값으로 사용합니다.
+        """
+        if not self.config.is_postgresql:
+            return
+
+        statements = [
+            "ALTER TABLE websites ALTER COLUMN id SET DEFAULT gen_random_uuid()",
+            "ALTER TABLE ssl_certificates ALTER COLUMN id SET DEFAULT gen_random_uuid()",
+            "ALTER TABLE ssl_certificates ALTER COLUMN last_checked SET DEFAULT CURRENT_TIMESTAMP",
+        ]
+
+        async with self.async_engine.begin() as conn:
+            for statement in statements:
+                try:
+                    await conn.execute(text(statement))
+                except Exception as e:
+                    print(f"기본값 설정 실패: {e}")
+
+    async def _migrate_guid_columns(self) -> None:
+        """SQLite의 UUID 컬럼을 36자 문자열에서 16바이트 바이너리로 변환"""
+        if not self.config.is_sqlite:
+            return
+
+        guid_columns = [
+            ("websites", "id"),
+            ("ssl_certificates", "id"),
+            ("ssl_certificates", "website_id"),
+        ]
+
+        async with self.async_engine.begin() as conn:
+            for table, column in guid_columns:
+                try:
+                    # 아직 문자열로 저장된 행만 변환 (이미 변환된 경우 대상 없음)
+                    result = await conn.execute(text(
+                        f"SELECT rowid, {column} FROM {table} WHERE typeof({column}) = 'text'"
+                    ))
+                    params = [
+                        {"value": uuid.UUID(value).bytes, "rowid": rowid}
+                        for rowid, value in result.all()
+                    ]
+                    if params:
+                        await conn.execute(
+                            text(f"UPDATE {table} SET {column} = :value WHERE rowid = :rowid"),
+                            params,
+                        )
+                        print(f"UUID 컬럼 변환 완료: {table}.{column} ({len(params)}건)")
+                except Exception as e:
+                    print(f"UUID 컬럼 변환 실패 ({table}.{column}): {e}")
+
+    async def _migrate_fingerprint_column(self) -> None:
+        """SSL 인증서 지문 컬럼을 64자 16진수 문자열에서 32바이트 바이너리로 변환
+
+        16진수가 아닌 기존 값(오류 기록용 지문 등)은 SHA-256 해시로 변환하여 고유성을 유지합니다.
+        """
+        async with self.async_engine.begin() as conn:
+            try:
+                if self.config.is_postgresql:
+                    result = await conn.execute(text("""
+                        SELECT data_type FROM information_schema.columns
+                        WHERE table_name = 'ssl_certificates' AND column_name = 'fingerprint'
+                    """))
+                    if result.scalar() == "character varying":
+                        await conn.execute(text(
+                            "ALTER TABLE ssl_certificates DROP CONSTRAINT IF EXISTS ck_ssl_fingerprint_hex"
+                        ))
+                        await conn.execute(text("""
+                            ALTER TABLE ssl_certificates ALTER COLUMN fingerprint TYPE BYTEA
+                            USING CASE
+                                WHEN fingerprint ~ '^[0-9a-f]{64}$' THEN decode(fingerprint, 'hex')
+                                ELSE sha256(convert_to(fingerprint, 'UTF8'))
+                            END
+                        """))
+                    return
+
+                # SQLite: 아직 문자열로 저장된 행만 변환
+                result = await conn.execute(text(
+                    "SELECT rowid, fingerprint FROM ssl_certificates WHERE typeof(fingerprint) = 'text'"
+                ))
+                params = []
+                for rowid, value in result.all():
+                    try:
+                        converted = bytes.fromhex(value)
+                        if len(converted) != 32:
+                            raise ValueError
+                    except ValueError:
+                        converted = hashlib.sha256(value.encode()).digest()
+                    params.append({"value": converted, "rowid": rowid})
+
+                if params:
+                    await conn.execute(
+                        text("UPDATE ssl_certificates SET fingerprint = :value WHERE rowid = :rowid"),
+                        params,
+                    )
+                    print(f"지문 컬럼 변환 완료 ({len(params)}건)")
+            except Exception as e:
+                print(f"지문 컬럼 변환 실패: {e}")
+
+    async def _migrate_ssl_status_column(self) -> None:
+        """SSL 인증서 상태 컬럼을 ENUM(이름 저장)에서 VARCHAR(값 저장)로 변환"""
+        async with self.async_engine.begin() as conn:
+            try:
+                if self.config.is_postgresql:
+                    result = await conn.execute(text("""
+                        SELECT data_type FROM information_schema.columns
+                        WHERE table_name = 'ssl_certificates' AND column_name = 'status'
+                    """))
+                    if result.scalar() == "USER-DEFINED":
+                        # 기존 ENUM 조건을 사용하는 부분 인덱스는 변환 후 다시 생성
+                        await conn.execute(text("DROP INDEX IF EXISTS idx_sslcert_active_valid_expiry"))
+                        await conn.execute(text(
+                            "ALTER TABLE ssl_certificates "
+                            "ALTER COLUMN status TYPE VARCHAR(16) USING lower(status::text)"
+                        ))
+                        await conn.execute(text("DROP TYPE IF EXISTS sslstatus"))
+                        return
+
+                # SQLite 등: 기존 행의 열거형 이름('VALID')을 값('valid')으로 변환
+                # 이미 값으로 저장된 경우 갱신되는 행이 없음
+                await conn.execute(text(
+                    "UPDATE ssl_certificates SET status = lower(status) "
+                    "WHERE status <> lower(status)"
+                ))
+            except Exception as e:
+                print(f"SSL 상태 컬럼 마이그레이션 실패: {e}")
+
     async def _create_indexes(self) -> None:
         """커스텀 인덱스 생성"""
         indexes = [
@@ -234,6 +405,17 @@ class DatabaseManager:
             CREATE INDEX IF NOT EXISTS idx_ssl_website_created_at
             ON ssl_certificates (website_id, created_at DESC)
             """,
+            # 복합 인덱스: 상태 + 만료일 (모델의 __table_args__와 동일, 기존 DB용)
+            """
+            CREATE INDEX IF NOT EXISTS ix_ssl_status_expiry
+            ON ssl_certificates (status, expiry_date)
+            """,
+            # 부분 인덱스: 유효 인증서 만료 알림 조회
+            """
+            CREATE INDEX IF NOT EXISTS idx_sslcert_active_valid_expiry
+            ON ssl_certificates (status, expiry_date)
+            WHERE status = 'valid'
+            """,
         ]
 
         async with self.async_engine.begin() as conn:
@@ -254,6 +436,9 @@ class DatabaseManager:
 # 전역 데이터베이스 관리자 인스턴스
 db_manager = DatabaseManager()
 
+# 작업 단위 공유 세션 (with_session으로 설정, 하위 서비스가 session 인자 없이 사용)
+ctx_session: ContextVar[Optional[AsyncSession]] = ContextVar("ctx_session", default=None)
+
 
 # 의존성 주입용 함수들
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
@@ -266,6 +451,44 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+@asynccontextmanager
+async def with_session() -> AsyncGenerator[AsyncSession, None]:
+    """작업 단위 공유 세션 컨텍스트 매니저 (스케줄러/백그라운드 작업용)
+
+    이미 바깥 범위에서 세션이 설정되어 있으면 그대로 재사용하고,
+    최외곽 범위에서만 세션을 열고 커밋/종료합니다.
+
+    Yields:
+        AsyncSession: 비동기 데이터베이스 세션
+    """
+    session = ctx_session.get()
+    if session is not None:
+        yield session
+        return
+
+    async with db_manager.get_async_session() as session:
+        token = ctx_session.set(session)
+        try:
+            yield session
+        finally:
+            ctx_session.reset(token)
+
+
+def current_session() -> AsyncSession:
+    """with_session으로 설정된 현재 작업 세션 반환
+
+    Returns:
+        AsyncSession: 현재 작업 세션
+
+    Raises:
+        RuntimeError: with_session 범위 밖에서 호출된 경우
+    """
+    session = ctx_session.get()
+    if session is None:
+        raise RuntimeError("활성 세션이 없습니다 (with_session 범위 밖에서 호출됨)")
+    return session
+
+
 def get_async_session_factory():
     """비동기 세션 팩토리 반환
 
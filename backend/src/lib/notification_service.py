@@ -6,25 +6,183 @@ CLI 인터페이스도 제공합니다.
 """
 
 import asyncio
+import copy
+import functools
 import os
 import json
+import random
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any
 import logging
+from dataclasses import dataclass
+from urllib.parse import urlparse
 
 import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, literal
 
 from ..models.website import Website
 from ..models.ssl_certificate import SSLCertificate, SSLStatus
-from ..database import get_async_session, db_manager
+from ..database import current_session, get_async_session, db_manager
 from ..lib.settings_manager import SettingsManager
+from ..services.settings_cache import get_cached_settings
 
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 언어별 만료일 표시 형식
+_EXPIRY_DATE_FORMATS = {
+    "ko": "%Y년 %m월 %d일 %H:%M",
+    "en": "%Y-%m-%d %H:%M",
+}
+
+
+# Teams 웹훅 서킷 브레이커 (연속 실패 시 일정 시간 동안 발송 중단)
+_BREAKER_FAILURE_THRESHOLD = 5
+_BREAKER_OPEN_SECONDS = 60
+_breaker: Dict[str, float] = {"fails": 0, "open_until": 0.0}
+
+# Power Automate가 지원하는 API 버전
+_PA_OLD_API_VERSION = "api-version=1"
+_PA_API_VERSION = "api-version=2024-10-01"
+
+# Teams 웹훅 공유 HTTP 클라이언트 (발송마다 TCP/TLS 연결을 새로 맺지 않고 재사용)
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=8)
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _get_http_client() -> httpx.AsyncClient:
+    """공유 HTTP 클라이언트 반환 (없거나 다른 이벤트 루프에서 만든 경우 새로 생성)
+
+    다른 이벤트 루프에서 만든 기존 클라이언트는 연결 풀이 남지 않도록 종료합니다.
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is not None and not _http_client.is_closed and _http_client_loop is loop:
+        return _http_client
+
+    old_client, old_loop = _http_client, _http_client_loop
+    _http_client = httpx.AsyncClient(limits=_HTTP_LIMITS)
+    _http_client_loop = loop
+
+    if old_client is not None:
+        await _aclose_http_client(old_client, old_loop)
+    return _http_client
+
+
+async def _aclose_http_client(
+    client: httpx.AsyncClient,
+    client_loop: Optional[asyncio.AbstractEventLoop],
+) -> None:
+    """HTTP 클라이언트 종료 (만든 루프가 다른 스레드에서 실행 중이면 그 루프에서 종료)"""
+    if client.is_closed:
+        return
+
+    if (
+        client_loop is not None
+        and client_loop is not asyncio.get_running_loop()
+        and client_loop.is_running()
+    ):
+        asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+        return
+
+    try:
+        await client.aclose()
+    except RuntimeError as e:
+        # 이미 닫힌 루프에 묶인 연결은 정리할 수 없음 (소켓은 GC 시 해제)
+        logger.debug("이전 이벤트 루프의 HTTP 클라이언트 종료 실패: %s", e)
+
+
+async def close_http_client() -> None:
+    """공유 HTTP 클라이언트 종료 (애플리케이션 종료 시 호출)"""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        client, client_loop = _http_client, _http_client_loop
+        _http_client = None
+        _http_client_loop = None
+        await _aclose_http_client(client, client_loop)
+
+
+@functools.lru_cache(maxsize=8)
+def _fix_powerautomate_url(webhook_url: str) -> str:
+    """Power Automate 웹훅 URL의 api-version=1을 2024-10-01로 교체
+
+    웹훅 URL은 사실상 고정값이므로 원본 URL 기준으로 결과를 캐시합니다.
+    """
+    # Power Automate URL인 경우에만 처리
+    if "powerautomate" not in webhook_url and "powerplatform.com" not in webhook_url:
+        return webhook_url
+
+    # 쿼리 중간(api-version=1&)과 끝(api-version=1) 두 경우만 교체
+    fixed_url = webhook_url.replace(_PA_OLD_API_VERSION + "&", _PA_API_VERSION + "&")
+    if fixed_url.endswith(_PA_OLD_API_VERSION):
+        fixed_url = fixed_url[:-len(_PA_OLD_API_VERSION)] + _PA_API_VERSION
+
+    if fixed_url != webhook_url:
+        logger.info("Power Automate API 버전을 1에서 2024-10-01로 자동 수정했습니다")
+
+    return fixed_url
+
+
+# Power Automate 호환용 Adaptive Card 첨부 템플릿 (제목/부제목만 교체해서 사용)
+_ADAPTIVE_CARD_TEMPLATE: Dict[str, Any] = {
+    "contentType": "application/vnd.microsoft.card.adaptive",
+    "content": {
+        "type": "AdaptiveCard",
+        "version": "1.0",
+        "body": [
+            {
+                "type": "TextBlock",
+                "text": "",
+                "weight": "bolder",
+                "size": "large"
+            },
+            {
+                "type": "TextBlock",
+                "text": "",
+                "wrap": True
+            }
+        ]
+    }
+}
+
+
+def _adaptive_card_attachment(
+    title: str,
+    subtitle: str,
+    actions: Optional[List[Dict[str, Any]]] = None,
+    title_color: Optional[str] = None
+) -> Dict[str, Any]:
+    """템플릿을 복사해 Adaptive Card 첨부 생성
+
+    Args:
+        title: 카드 제목
+        subtitle: 카드 부제목
+        actions: Adaptive Card 액션 목록 (있을 때만 추가)
+        title_color: 제목 색상 (예: 'attention', 'good')
+
+    Returns:
+        attachments 배열에 넣을 Adaptive Card 딕셔너리
+    """
+    attachment = copy.deepcopy(_ADAPTIVE_CARD_TEMPLATE)
+    content = attachment["content"]
+    content["body"][0]["text"] = title
+    content["body"][1]["text"] = subtitle
+    if title_color:
+        content["body"][0]["color"] = title_color
+    if actions:
+        content["actions"] = actions
+    return attachment
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_expiry(dt: datetime, lang: str) -> str:
+    """만료일을 알림용 문자열로 변환 (같은 인증서가 매 실행마다 반복되므로 캐시)"""
+    return dt.strftime(_EXPIRY_DATE_FORMATS.get(lang, _EXPIRY_DATE_FORMATS["en"]))
+
 
 class NotificationError(Exception):
     """알림 관련 오류"""
@@ -36,12 +194,31 @@ class TeamsWebhookError(NotificationError):
     pass
 
 
+@dataclass(frozen=True)
+class ExpiringRow:
+    """만료 알림 메시지에 필요한 컬럼만 담은 경량 행"""
+    name: Optional[str]
+    url: str
+    issuer: str
+    expiry_date: datetime
+
+    @classmethod
+    def from_models(cls, website: Website, cert: SSLCertificate) -> "ExpiringRow":
+        """Website/SSLCertificate 객체로부터 생성"""
+        return cls(
+            name=website.name,
+            url=website.url,
+            issuer=cert.issuer,
+            expiry_date=cert.expiry_date,
+        )
+
+
 class NotificationService:
     """Teams 알림 서비스 클래스"""
 
     def __init__(
         self,
-        session: AsyncSession,
+        session: Optional[AsyncSession] = None,
         webhook_url: Optional[str] = None,
         language: str = "ko",
         retry_count: int = 3,
@@ -49,12 +226,14 @@ class NotificationService:
     ):
         """
         Args:
-            session: 데이터베이스 세션
+            session: 데이터베이스 세션 (None이면 with_session으로 설정된 현재 작업 세션)
             webhook_url: Teams 웹훅 URL (None이면 DB 설정에서 로드)
             language: 메시지 언어 ('ko', 'en') - DB 설정에서 로드 가능
             retry_count: 재시도 횟수
             timeout: 타임아웃 (초)
         """
+        if session is None:
+            session = current_session()
         self.session = session
         self.settings_manager = SettingsManager(session)
 
@@ -88,14 +267,7 @@ class NotificationService:
         if not webhook_url:
             return webhook_url
 
-        # Power Automate URL인 경우에만 처리
-        if "powerautomate" in webhook_url or "powerplatform.com" in webhook_url:
-            # api-version=1을 api-version=2024-10-01로 변경
-            if "api-version=1" in webhook_url:
-                webhook_url = webhook_url.replace("api-version=1", "api-version=2024-10-01")
-                logger.info("Power Automate API 버전을 1에서 2024-10-01로 자동 수정했습니다")
-
-        return webhook_url
+        return _fix_powerautomate_url(webhook_url)
 
     def _parse_notification_days(self) -> List[int]:
         """알림 발송 일수 파싱
@@ -120,7 +292,7 @@ class NotificationService:
 
         try:
             # DB에서 설정 조회
-            settings = await self.settings_manager.get_settings()
+            settings = await get_cached_settings(self.session)
 
             # 웹훅 URL이 파라미터로 전달되지 않았으면 DB에서 로드
             if not self.webhook_url and settings.webhook_url:
@@ -131,13 +303,7 @@ class NotificationService:
 
             # 알림 일수 파싱
             if settings.notification_days_before:
-                try:
-                    self.notification_days = [
-                        int(day.strip())
-                        for day in settings.notification_days_before.split(",")
-                    ]
-                except Exception:
-                    pass  # 기본값 유지
+                self.notification_days = list(settings.notification_days_list)
 
             # 언어 설정
             if settings.notification_language:
@@ -168,6 +334,11 @@ class NotificationService:
             return False
 
         try:
+            # 대부분의 날은 만료 임박 인증서가 없으므로 가벼운 존재 확인 후 전체 조회
+            if not await self._has_expiring_certificates():
+                logger.info("만료 임박 인증서가 없습니다")
+                return True
+
             # 만료 임박 인증서 조회
             expiring_certificates = await self._get_expiring_certificates()
 
@@ -188,14 +359,43 @@ class NotificationService:
             logger.error(f"만료 알림 발송 실패: {str(e)}")
             return False
 
+    async def _has_expiring_certificates(self) -> bool:
+        """만료 임박 인증서 존재 여부 확인
+
+        조인 없이 인덱스만으로 판단 가능한 LIMIT 1 조회입니다.
+
+        Returns:
+            알림 대상 기간 내 유효 인증서가 하나라도 있으면 True
+        """
+        if not self.notification_days:
+            return False
+
+        max_days = max(self.notification_days)
+        now = datetime.now(timezone.utc)
+        max_expiry_date = now + timedelta(days=max_days, hours=23, minutes=59, seconds=59)
+
+        exists_stmt = (
+            select(literal(1))
+            .where(
+                and_(
+                    SSLCertificate.status == SSLStatus.VALID,
+                    SSLCertificate.expiry_date >= now,
+                    SSLCertificate.expiry_date <= max_expiry_date
+                )
+            )
+            .limit(1)
+        )
+        return await self.session.scalar(exists_stmt) is not None
+
     async def _get_expiring_certificates(self) -> List[tuple]:
         """만료 임박 인증서 조회
 
         설정된 일수 중 최대값 이하로 남은 모든 인증서를 조회합니다.
         예: notification_days=[187,30,7,1]이면 187일 이하 남은 모든 인증서 조회
+        메시지 구성에 필요한 컬럼만 조회하여 ORM 객체 생성 비용을 줄입니다.
 
         Returns:
-            (웹사이트, SSL인증서, 만료까지남은일수) 튜플 목록
+            (ExpiringRow, 만료까지남은일수) 튜플 목록
         """
         if not self.notification_days:
             return []
@@ -207,7 +407,13 @@ class NotificationService:
         max_expiry_date = now + timedelta(days=max_days, hours=23, minutes=59, seconds=59)
 
         result = await self.session.execute(
-            select(Website, SSLCertificate)
+            select(
+                Website.name,
+                Website.url,
+                SSLCertificate.issuer,
+                SSLCertificate.expiry_date,
+            )
+            .select_from(Website)
             .join(SSLCertificate, Website.id == SSLCertificate.website_id)
             .where(
                 and_(
@@ -222,15 +428,16 @@ class NotificationService:
 
         # 각 인증서의 정확한 남은 일수 계산 (내림 처리 - 사용자 친화적)
         expiring_certs = []
-        for website, cert in result.all():
-            time_remaining = cert.expiry_date - now
+        for mapping in result.mappings().all():
+            row = ExpiringRow(**mapping)
+            time_remaining = row.expiry_date - now
             # 내림: 187.9일 → 187일 (사용자는 "187일 남았다"고 인식)
             days_remaining = time_remaining.days
-            expiring_certs.append((website, cert, days_remaining))
+            expiring_certs.append((row, days_remaining))
 
         return expiring_certs
 
-    def _group_certificates_by_expiry_days(self, certificates: List[tuple]) -> Dict[int, List[tuple]]:
+    def _group_certificates_by_expiry_days(self, certificates: List[tuple]) -> Dict[int, List[ExpiringRow]]:
         """인증서를 만료 일수별로 그룹화
 
         설정된 알림 일수 기준으로 그룹화합니다.
@@ -238,7 +445,7 @@ class NotificationService:
         28일 -> 30일 그룹, 5일 -> 7일 그룹, 1일 -> 1일 그룹
 
         Args:
-            certificates: (웹사이트, SSL인증서, 실제남은일수) 튜플 목록
+            certificates: (ExpiringRow, 실제남은일수) 튜플 목록
 
         Returns:
             알림 일수별로 그룹화된 인증서 딕셔너리
@@ -246,7 +453,7 @@ class NotificationService:
         grouped = {}
         sorted_notification_days = sorted(self.notification_days, reverse=True)  # 큰 값부터
 
-        for website, cert, days_remaining in certificates:
+        for row, days_remaining in certificates:
             # 남은 일수에 맞는 알림 그룹 찾기
             assigned_group = None
             for notification_day in sorted_notification_days:
@@ -257,15 +464,15 @@ class NotificationService:
             if assigned_group is not None:
                 if assigned_group not in grouped:
                     grouped[assigned_group] = []
-                grouped[assigned_group].append((website, cert))
+                grouped[assigned_group].append(row)
 
         return grouped
 
-    async def _send_expiry_notification(self, certificates: List[tuple], days: int) -> bool:
+    async def _send_expiry_notification(self, certificates: List[ExpiringRow], days: int) -> bool:
         """만료 알림 발송
 
         Args:
-            certificates: (웹사이트, SSL인증서) 튜플 목록
+            certificates: 만료 임박 인증서 행 목록
             days: 만료까지 남은 일수
 
         Returns:
@@ -279,22 +486,54 @@ class NotificationService:
             logger.error(f"만료 알림 발송 실패 ({days}일): {str(e)}")
             return False
 
-    async def _create_expiry_message(self, certificates: List[tuple], days: int) -> Dict[str, Any]:
+    async def _create_expiry_message(self, certificates: List[ExpiringRow], days: int) -> Dict[str, Any]:
         """만료 알림 메시지 생성
 
         Args:
-            certificates: (웹사이트, SSL인증서) 튜플 목록
+            certificates: 만료 임박 인증서 행 목록
             days: 만료까지 남은 일수
 
         Returns:
             Teams 메시지 페이로드
         """
+        # 대시보드 URL은 DB 조회가 필요하므로 이벤트 루프에서 먼저 확인
+        dashboard_url = await self._resolve_dashboard_url()
+
         if self.language == "ko":
-            return await self._create_korean_expiry_message(certificates, days)
+            builder = self._create_korean_expiry_message
         else:
-            return await self._create_english_expiry_message(certificates, days)
+            builder = self._create_english_expiry_message
+
+        # 인증서가 많으면 메시지 구성이 CPU 작업이 되므로 스레드로 넘겨 이벤트 루프 블로킹 방지
+        return await asyncio.to_thread(builder, certificates, days, dashboard_url)
+
+    async def _resolve_dashboard_url(self) -> str:
+        """알림에 포함할 대시보드 URL 조회
+
+        우선순위: DB 설정 > 환경변수
+
+        Returns:
+            대시보드 URL (없으면 빈 문자열)
+        """
+        dashboard_url = None
+        try:
+            settings = await get_cached_settings(self.session)
+            dashboard_url = settings.dashboard_url
+            logger.info(f"Dashboard URL from DB: {dashboard_url}")
+        except Exception as e:
+            logger.warning(f"Failed to get dashboard_url from DB: {e}")
+            pass
+
+        if not dashboard_url:
+            dashboard_url = os.getenv("DASHBOARD_URL", "")
+            logger.info(f"Dashboard URL from ENV: {dashboard_url}")
+
+        logger.info(f"Final dashboard_url for notification: {dashboard_url}")
+        return dashboard_url
 
-    async def _create_korean_expiry_message(self, certificates: List[tuple], days: int) -> Dict[str, Any]:
+    def _create_korean_expiry_message(
+        self, certificates: List[ExpiringRow], days: int, dashboard_url: str
+    ) -> Dict[str, Any]:
         """한국어 만료 알림 메시지 생성"""
         # 긴급도 결정
         if days <= 1:
@@ -319,21 +558,20 @@ class NotificationService:
         facts = []
         now = datetime.now(timezone.utc)
 
-        for idx, (website, cert) in enumerate(certificates, 1):
-            from urllib.parse import urlparse
-            parsed = urlparse(website.url)
+        for idx, row in enumerate(certificates, 1):
+            parsed = urlparse(row.url)
             domain = parsed.netloc or parsed.path
 
-            issuer = cert.issuer.split(",")[0] if "," in cert.issuer else cert.issuer
+            issuer = row.issuer.partition(",")[0]
 
             # 남은 일수 계산
-            days_remaining = (cert.expiry_date - now).days
+            days_remaining = (row.expiry_date - now).days
             days_text = f"{days_remaining}일 남음" if days_remaining > 1 else "내일 만료!"
 
             # 도메인 정보 (일반 텍스트 - Teams MessageCard는 Facts에서 마크다운 지원 안함)
             facts.append({
                 "name": f"🌐 [{idx}] {domain}",
-                "value": f"{website.url}"
+                "value": f"{row.url}"
             })
             facts.append({
                 "name": "남은 기간",
@@ -341,7 +579,7 @@ class NotificationService:
             })
             facts.append({
                 "name": "만료일",
-                "value": cert.expiry_date.strftime('%Y년 %m월 %d일 %H:%M')
+                "value": _fmt_expiry(row.expiry_date, "ko")
             })
             facts.append({
                 "name": "발급자",
@@ -364,22 +602,6 @@ class NotificationService:
         }
 
         # 대시보드 링크 추가 (실제 호스트 도메인)
-        # 우선순위: DB 설정 > 환경변수
-        dashboard_url = None
-        try:
-            settings = await self.settings_manager.get_settings()
-            dashboard_url = settings.dashboard_url
-            logger.info(f"Dashboard URL from DB: {dashboard_url}")
-        except Exception as e:
-            logger.warning(f"Failed to get dashboard_url from DB: {e}")
-            pass
-
-        if not dashboard_url:
-            dashboard_url = os.getenv("DASHBOARD_URL", "")
-            logger.info(f"Dashboard URL from ENV: {dashboard_url}")
-
-        logger.info(f"Final dashboard_url for notification: {dashboard_url}")
-
         actions = []
 
         if dashboard_url and dashboard_url != "https://ssl-checker.example.com":
@@ -398,14 +620,14 @@ class NotificationService:
             logger.warning(f"Dashboard URL not added. Value: {dashboard_url}")
 
         # 각 도메인 링크 추가
-        for idx, (website, cert) in enumerate(certificates, 1):
+        for idx, row in enumerate(certificates, 1):
             actions.append({
                 "@type": "OpenUri",
                 "name": f"🔗 [{idx}] 도메인 접속",
                 "targets": [
                     {
                         "os": "default",
-                        "uri": website.url
+                        "uri": row.url
                     }
                 ]
             })
@@ -418,41 +640,23 @@ class NotificationService:
 
         # Power Automate 호환성: attachments 배열 추가
         # Adaptive Card에도 액션 버튼 추가 (Power Automate는 Adaptive Card를 우선 처리함)
-        adaptive_card_actions = self._create_adaptive_card_actions(dashboard_url, certificates)
-
-        adaptive_card_content = {
-            "type": "AdaptiveCard",
-            "version": "1.0",
-            "body": [
-                {
-                    "type": "TextBlock",
-                    "text": title,
-                    "weight": "bolder",
-                    "size": "large"
-                },
-                {
-                    "type": "TextBlock",
-                    "text": subtitle,
-                    "wrap": True
-                }
-            ]
-        }
+        adaptive_card_actions = self._create_adaptive_card_actions(
+            dashboard_url, [row.url for row in certificates]
+        )
 
         # 액션이 있으면 추가
         if adaptive_card_actions:
-            adaptive_card_content["actions"] = adaptive_card_actions
             logger.info(f"Added {len(adaptive_card_actions)} actions to Adaptive Card")
 
         message["attachments"] = [
-            {
-                "contentType": "application/vnd.microsoft.card.adaptive",
-                "content": adaptive_card_content
-            }
+            _adaptive_card_attachment(title, subtitle, adaptive_card_actions)
         ]
 
         return message
 
-    async def _create_english_expiry_message(self, certificates: List[tuple], days: int) -> Dict[str, Any]:
+    def _create_english_expiry_message(
+        self, certificates: List[ExpiringRow], days: int, dashboard_url: str
+    ) -> Dict[str, Any]:
         """영어 만료 알림 메시지 생성"""
         # 긴급도 결정
         if days <= 1:
@@ -477,21 +681,20 @@ class NotificationService:
         facts = []
         now = datetime.now(timezone.utc)
 
-        for idx, (website, cert) in enumerate(certificates, 1):
-            from urllib.parse import urlparse
-            parsed = urlparse(website.url)
+        for idx, row in enumerate(certificates, 1):
+            parsed = urlparse(row.url)
             domain = parsed.netloc or parsed.path
 
-            issuer = cert.issuer.split(",")[0] if "," in cert.issuer else cert.issuer
+            issuer = row.issuer.partition(",")[0]
 
             # 남은 일수 계산
-            days_remaining = (cert.expiry_date - now).days
+            days_remaining = (row.expiry_date - now).days
             days_text = f"{days_remaining} days left" if days_remaining > 1 else "Expires tomorrow!"
 
             # 도메인 정보 (일반 텍스트 - Teams MessageCard는 Facts에서 마크다운 지원 안함)
             facts.append({
                 "name": f"🌐 [{idx}] {domain}",
-                "value": f"{website.url}"
+                "value": f"{row.url}"
             })
             facts.append({
                 "name": "Days Remaining",
@@ -499,7 +702,7 @@ class NotificationService:
             })
             facts.append({
                 "name": "Expiry Date",
-                "value": cert.expiry_date.strftime('%Y-%m-%d %H:%M')
+                "value": _fmt_expiry(row.expiry_date, "en")
             })
             facts.append({
                 "name": "Issuer",
@@ -522,22 +725,6 @@ class NotificationService:
         }
 
         # 대시보드 링크 추가 (실제 호스트 도메인)
-        # 우선순위: DB 설정 > 환경변수
-        dashboard_url = None
-        try:
-            settings = await self.settings_manager.get_settings()
-            dashboard_url = settings.dashboard_url
-            logger.info(f"Dashboard URL from DB: {dashboard_url}")
-        except Exception as e:
-            logger.warning(f"Failed to get dashboard_url from DB: {e}")
-            pass
-
-        if not dashboard_url:
-            dashboard_url = os.getenv("DASHBOARD_URL", "")
-            logger.info(f"Dashboard URL from ENV: {dashboard_url}")
-
-        logger.info(f"Final dashboard_url for notification: {dashboard_url}")
-
         actions = []
 
         if dashboard_url and dashboard_url != "https://ssl-checker.example.com":
@@ -553,14 +740,14 @@ class NotificationService:
             })
 
         # 각 도메인 링크 추가
-        for idx, (website, cert) in enumerate(certificates, 1):
+        for idx, row in enumerate(certificates, 1):
             actions.append({
                 "@type": "OpenUri",
                 "name": f"🔗 [{idx}] Visit Domain",
                 "targets": [
                     {
                         "os": "default",
-                        "uri": website.url
+                        "uri": row.url
                     }
                 ]
             })
@@ -572,37 +759,16 @@ class NotificationService:
             logger.warning("No actions to add to message")
 
         # Power Automate 호환성: attachments 배열 추가
-        message["attachments"] = [
-            {
-                "contentType": "application/vnd.microsoft.card.adaptive",
-                "content": {
-                    "type": "AdaptiveCard",
-                    "version": "1.0",
-                    "body": [
-                        {
-                            "type": "TextBlock",
-                            "text": title,
-                            "weight": "bolder",
-                            "size": "large"
-                        },
-                        {
-                            "type": "TextBlock",
-                            "text": subtitle,
-                            "wrap": True
-                        }
-                    ]
-                }
-            }
-        ]
+        message["attachments"] = [_adaptive_card_attachment(title, subtitle)]
 
         return message
 
-    def _create_adaptive_card_actions(self, dashboard_url: str, websites_data: List[tuple]) -> List[Dict[str, Any]]:
+    def _create_adaptive_card_actions(self, dashboard_url: str, urls: List[str]) -> List[Dict[str, Any]]:
         """Adaptive Card용 액션 버튼 생성
 
         Args:
             dashboard_url: 대시보드 URL
-            websites_data: (website, cert, days_remaining) 튜플 목록 또는 (website, cert) 튜플 목록
+            urls: 도메인 링크로 추가할 웹사이트 URL 목록
 
         Returns:
             Adaptive Card actions 배열
@@ -618,12 +784,11 @@ class NotificationService:
             })
 
         # 각 도메인 링크
-        for idx, item in enumerate(websites_data, 1):
-            website = item[0]  # 첫 번째 요소는 항상 website
+        for idx, url in enumerate(urls, 1):
             actions.append({
                 "type": "Action.OpenUrl",
                 "title": f"🔗 [{idx}] 도메인 접속",
-                "url": website.url
+                "url": url
             })
 
         return actions
@@ -666,11 +831,10 @@ class NotificationService:
         # 인증서 목록을 Facts로 구성 (각 인증서별 정확한 남은 일수 표시)
         facts = []
         for idx, (website, cert, days_remaining) in enumerate(certificates_with_days, 1):
-            from urllib.parse import urlparse
             parsed = urlparse(website.url)
             domain = parsed.netloc or parsed.path
 
-            issuer = cert.issuer.split(",")[0] if "," in cert.issuer else cert.issuer
+            issuer = cert.issuer.partition(",")[0]
 
             # 도메인 정보 및 남은 일수
             days_text = f"{days_remaining}일 남음" if days_remaining > 1 else "내일 만료!"
@@ -686,7 +850,7 @@ class NotificationService:
             })
             facts.append({
                 "name": "만료일",
-                "value": cert.expiry_date.strftime('%Y년 %m월 %d일 %H:%M')
+                "value": _fmt_expiry(cert.expiry_date, "ko")
             })
             facts.append({
                 "name": "발급자",
@@ -712,7 +876,7 @@ class NotificationService:
         # 우선순위: DB 설정 > 환경변수
         dashboard_url = None
         try:
-            settings = await self.settings_manager.get_settings()
+            settings = await get_cached_settings(self.session)
             dashboard_url = settings.dashboard_url
             logger.info(f"Dashboard URL from DB: {dashboard_url}")
         except Exception as e:
@@ -763,36 +927,16 @@ class NotificationService:
 
         # Power Automate 호환성: attachments 배열 추가
         # Adaptive Card에도 액션 버튼 추가 (Power Automate는 Adaptive Card를 우선 처리함)
-        adaptive_card_actions = self._create_adaptive_card_actions(dashboard_url, certificates_with_days)
-
-        adaptive_card_content = {
-            "type": "AdaptiveCard",
-            "version": "1.0",
-            "body": [
-                {
-                    "type": "TextBlock",
-                    "text": title,
-                    "weight": "bolder",
-                    "size": "large"
-                },
-                {
-                    "type": "TextBlock",
-                    "text": subtitle,
-                    "wrap": True
-                }
-            ]
-        }
+        adaptive_card_actions = self._create_adaptive_card_actions(
+            dashboard_url, [website.url for website, _, _ in certificates_with_days]
+        )
 
         # 액션이 있으면 추가
         if adaptive_card_actions:
-            adaptive_card_content["actions"] = adaptive_card_actions
             logger.info(f"Added {len(adaptive_card_actions)} actions to Adaptive Card")
 
         message["attachments"] = [
-            {
-                "contentType": "application/vnd.microsoft.card.adaptive",
-                "content": adaptive_card_content
-            }
+            _adaptive_card_attachment(title, subtitle, adaptive_card_actions)
         ]
 
         return message
@@ -820,11 +964,10 @@ class NotificationService:
         # 인증서 목록을 Facts로 구성 (각 인증서별 정확한 남은 일수 표시)
         facts = []
         for idx, (website, cert, days_remaining) in enumerate(certificates_with_days, 1):
-            from urllib.parse import urlparse
             parsed = urlparse(website.url)
             domain = parsed.netloc or parsed.path
 
-            issuer = cert.issuer.split(",")[0] if "," in cert.issuer else cert.issuer
+            issuer = cert.issuer.partition(",")[0]
 
             # 도메인 정보 및 남은 일수
             days_text = f"{days_remaining} days left" if days_remaining > 1 else "Expires tomorrow!"
@@ -834,7 +977,7 @@ class NotificationService:
             })
             facts.append({
                 "name": "Expiry Date",
-                "value": cert.expiry_date.strftime('%Y-%m-%d %H:%M')
+                "value": _fmt_expiry(cert.expiry_date, "en")
             })
             facts.append({
                 "name": "Issuer",
@@ -860,7 +1003,7 @@ class NotificationService:
         # 우선순위: DB 설정 > 환경변수
         dashboard_url = None
         try:
-            settings = await self.settings_manager.get_settings()
+            settings = await get_cached_settings(self.session)
             dashboard_url = settings.dashboard_url
             logger.info(f"Dashboard URL from DB: {dashboard_url}")
         except Exception as e:
@@ -907,28 +1050,7 @@ class NotificationService:
             logger.warning("No actions to add to message")
 
         # Power Automate 호환성: attachments 배열 추가
-        message["attachments"] = [
-            {
-                "contentType": "application/vnd.microsoft.card.adaptive",
-                "content": {
-                    "type": "AdaptiveCard",
-                    "version": "1.0",
-                    "body": [
-                        {
-                            "type": "TextBlock",
-                            "text": title,
-                            "weight": "bolder",
-                            "size": "large"
-                        },
-                        {
-                            "type": "TextBlock",
-                            "text": subtitle,
-                            "wrap": True
-                        }
-                    ]
-                }
-            }
-        ]
+        message["attachments"] = [_adaptive_card_attachment(title, subtitle)]
 
         return message
 
@@ -936,7 +1058,7 @@ class NotificationService:
         """SSL 오류 즉시 알림 발송
 
         Args:
-            website: 웹사이트 객체
+            website: 웹사이트 객체 (name, url 속성만 사용 - 컬럼 조회 Row도 가능)
             error_message: 오류 메시지
 
         Returns:
@@ -1001,27 +1123,7 @@ class NotificationService:
 
         # Power Automate 호환성: attachments 배열 추가
         message["attachments"] = [
-            {
-                "contentType": "application/vnd.microsoft.card.adaptive",
-                "content": {
-                    "type": "AdaptiveCard",
-                    "version": "1.0",
-                    "body": [
-                        {
-                            "type": "TextBlock",
-                            "text": title,
-                            "weight": "bolder",
-                            "size": "large",
-                            "color": "attention"
-                        },
-                        {
-                            "type": "TextBlock",
-                            "text": subtitle,
-                            "wrap": True
-                        }
-                    ]
-                }
-            }
+            _adaptive_card_attachment(title, subtitle, title_color="attention")
         ]
 
         return message
@@ -1052,31 +1154,82 @@ class NotificationService:
         else:
             logger.warning("Message does NOT have potentialAction field")
 
+        # 웹훅 장애 중에는 재시도/백오프 없이 즉시 실패 처리
+        if time.monotonic() < _breaker["open_until"]:
+            logger.warning("Teams 웹훅 서킷 브레이커 열림 상태: 발송 생략")
+            return False
+
+        success = await self._post_teams_message(message)
+
+        if success:
+            if _breaker["fails"] >= _BREAKER_FAILURE_THRESHOLD:
+                logger.info("Teams 웹훅 서킷 브레이커 닫힘: 발송 복구")
+            _breaker["fails"] = 0
+        else:
+            _breaker["fails"] += 1
+            if _breaker["fails"] >= _BREAKER_FAILURE_THRESHOLD:
+                _breaker["open_until"] = time.monotonic() + _BREAKER_OPEN_SECONDS
+                logger.warning(
+                    f"Teams 웹훅 서킷 브레이커 열림: 연속 {_breaker['fails']}회 실패, "
+                    f"{_BREAKER_OPEN_SECONDS}초 동안 발송 중단"
+                )
+
+        return success
+
+    async def _post_teams_message(self, message: Dict[str, Any]) -> bool:
+        """Teams 웹훅으로 메시지 POST (전송 오류/응답 코드 기반 재시도 포함)
+
+        Args:
+            message: Teams 메시지 페이로드
+
+        Returns:
+            발송 성공 여부
+        """
+        # 연결/타임아웃 등 전송 오류와 429/5xx 응답을 같은 백오프로 재시도
+        client = await _get_http_client()
+
         for attempt in range(self.retry_count):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        self.webhook_url,
-                        json=message,
-                        headers={"Content-Type": "application/json"}
-                    )
+                response = await client.post(
+                    self.webhook_url,
+                    json=message,
+                    headers={"Content-Type": "application/json"},
+                    timeout=self.timeout
+                )
 
-                    if response.status_code in [200, 202]:  # 202 Accepted도 성공으로 처리
-                        logger.info("Teams 알림 발송 성공")
-                        return True
-                    else:
-                        logger.warning(f"Teams 웹훅 응답 오류: {response.status_code} - {response.text}")
-                        logger.debug(f"요청 URL: {self.webhook_url}")
+            except httpx.TransportError as e:
+                logger.warning(
+                    f"Teams 알림 발송 실패 (시도 {attempt + 1}/{self.retry_count}): {str(e)}"
+                )
+                if attempt < self.retry_count - 1:
+                    await asyncio.sleep(2 ** attempt + random.random())  # 지수 백오프 + 지터
+                continue
 
             except httpx.RequestError as e:
-                logger.warning(f"Teams 알림 발송 실패 (시도 {attempt + 1}/{self.retry_count}): {str(e)}")
-                if attempt < self.retry_count - 1:
-                    await asyncio.sleep(2 ** attempt)  # 지수 백오프
+                logger.warning(f"Teams 알림 발송 실패: {str(e)}")
+                return False
 
             except Exception as e:
                 logger.error(f"Teams 알림 발송 오류: {str(e)}")
+                return False
+
+            if response.status_code in [200, 202]:  # 202 Accepted도 성공으로 처리
+                logger.info("Teams 알림 발송 성공")
+                return True
+
+            logger.warning(
+                f"Teams 웹훅 응답 오류 (시도 {attempt + 1}/{self.retry_count}): "
+                f"{response.status_code} - {response.text}"
+            )
+            logger.debug(f"요청 URL: {self.webhook_url}")
+
+            retryable = response.status_code == 429 or response.status_code >= 500
+            if not retryable:
                 break
 
+            if attempt < self.retry_count - 1:
+                await asyncio.sleep(2 ** attempt + random.random())  # 지수 백오프 + 지터
+
         return False
 
     async def test_notification(self) -> bool:
@@ -1118,41 +1271,29 @@ class NotificationService:
 
         # Power Automate 호환성: attachments 배열 추가
         # Adaptive Card에 액션 버튼 추가
-        adaptive_card_content = {
-            "type": "AdaptiveCard",
-            "version": "1.0",
-            "body": [
-                {
-                    "type": "TextBlock",
-                    "text": "🧪 SSL Checker 알림 테스트",
-                    "weight": "bolder",
-                    "size": "large",
-                    "color": "good"
-                },
+        attachment = _adaptive_card_attachment(
+            "🧪 SSL Checker 알림 테스트",
+            "알림 시스템이 정상적으로 작동하고 있습니다.",
+            title_color="good"
+        )
+        adaptive_card_content = attachment["content"]
+        adaptive_card_content["body"].append({
+            "type": "FactSet",
+            "facts": [
                 {
-                    "type": "TextBlock",
-                    "text": "알림 시스템이 정상적으로 작동하고 있습니다.",
-                    "wrap": True
+                    "title": "테스트 시간",
+                    "value": datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
                 },
                 {
-                    "type": "FactSet",
-                    "facts": [
-                        {
-                            "title": "테스트 시간",
-                            "value": datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
-                        },
-                        {
-                            "title": "시스템 상태",
-                            "value": "정상 ✅"
-                        }
-                    ]
+                    "title": "시스템 상태",
+                    "value": "정상 ✅"
                 }
             ]
-        }
+        })
 
         # Dashboard URL 버튼 추가 (있는 경우)
         try:
-            settings = await self.settings_manager.get_settings()
+            settings = await get_cached_settings(self.session)
             dashboard_url = settings.dashboard_url
             if dashboard_url and dashboard_url != "https://ssl-checker.example.com":
                 adaptive_card_content["actions"] = [
@@ -1165,12 +1306,7 @@ class NotificationService:
         except:
             pass
 
-        test_message["attachments"] = [
-            {
-                "contentType": "application/vnd.microsoft.card.adaptive",
-                "content": adaptive_card_content
-            }
-        ]
+        test_message["attachments"] = [attachment]
 
         return await self._send_teams_message(test_message)
 
@@ -4,23 +4,44 @@ FastAPI 메인 애플리케이션
 SSL Certificate Monitoring Dashboard의 메인 웹 애플리케이션입니다.
 """
 
-import asyncio
 import logging
+import logging.handlers
 import os
+import queue
+import time
 from contextlib import asynccontextmanager
 from typing import Dict, Any
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse, FileResponse, Response
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+import orjson
 import uvicorn
 
 # Uvicorn ProxyHeaders 미들웨어 import (프록시 뒤에서 실행될 때 필요)
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
 
+# 캐시 제어 헤더 (실행 환경은 시작 시 한 번만 판별)
+# 개발 환경: 캐시 비활성화 / 운영 환경: 짧은 캐시 시간 (5분)
+_IS_PROD = os.getenv("ENVIRONMENT", "development") == "production"
+
+# 스케줄러 실행 여부 (여러 워커/레플리카 중 한 프로세스에서만 true로 설정)
+_ENABLE_SCHEDULER = os.getenv("ENABLE_SCHEDULER", "true").lower() == "true"
+if _IS_PROD:
+    _CACHE_HEADERS = {"Cache-Control": "public, max-age=300"}
+else:
+    _CACHE_HEADERS = {
+        "Cache-Control": "no-cache, no-store, must-revalidate",
+        "Pragma": "no-cache",
+        "Expires": "0",
+    }
+
+
 # 캐시 제어가 가능한 커스텀 StaticFiles 클래스
 class NoCacheStaticFiles(StaticFiles):
     """
@@ -29,32 +50,132 @@ class NoCacheStaticFiles(StaticFiles):
     """
     async def get_response(self, path: str, scope):
         response = await super().get_response(path, scope)
-        # 개발 환경: 캐시 비활성화
-        # 운영 환경: 짧은 캐시 시간 설정 (5분)
-        if os.getenv("ENVIRONMENT", "development") == "production":
-            response.headers["Cache-Control"] = "public, max-age=300"  # 5분
-        else:
-            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
+        response.headers.update(_CACHE_HEADERS)
+        return response
+
+
+# 요청/응답 로깅 및 HTTPS 리다이렉트 처리 미들웨어
+class LoggingMiddleware:
+    """
+    요청/응답 로깅 및 HTTPS 리다이렉트 처리
+    응답 시작 메시지를 가로채 처리 시간 헤더를 추가하고 Location 헤더를 수정
+    """
+    HTTPS_REDIRECT_DOMAIN = "ssl-monitoring-checking-ssl.d3.clouz.io"
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        request_headers = Headers(scope=scope)
+
+        # CORS preflight는 로깅/응답 래핑 없이 바로 전달
+        # (CachedCORSMiddleware가 라우터를 거치지 않고 캐시된 응답으로 처리)
+        if method == "OPTIONS" and "access-control-request-method" in request_headers:
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        path = scope["path"]
+
+        # 요청 로깅
+        # 지연 포맷팅: 로그 레벨이 INFO보다 높으면 문자열을 만들지 않음
+        logger.info("요청 시작: %s %s", method, path)
+        # 프록시 헤더는 디버그 로그에서만 확인
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "프록시 헤더: Proto: %s, Host: %s",
+                request_headers.get("x-forwarded-proto", ""),
+                request_headers.get("x-forwarded-host", "")
+            )
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                process_time = time.perf_counter() - start_time
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+
+                # 307 리다이렉트의 경우 Location 헤더를 HTTPS로 수정
+                if status_code == 307 and "location" in headers:
+                    location = headers["location"]
+                    # 프록시 헤더는 리다이렉트 응답에서만 확인
+                    forwarded_proto = request_headers.get("x-forwarded-proto", "")
+
+                    # X-Forwarded-Proto가 https이거나, 알려진 HTTPS 도메인인 경우
+                    if forwarded_proto == "https" or self.HTTPS_REDIRECT_DOMAIN in location:
+                        if location.startswith("http://"):
+                            new_location = location.replace("http://", "https://", 1)
+                            headers["location"] = new_location
+                            logger.info("리다이렉트 URL 수정: %s -> %s", location, new_location)
+
+                # 응답 로깅
+                logger.info(
+                    "요청 완료: %s %s - 상태: %s - 소요시간: %.3f초",
+                    method, path, status_code, process_time
+                )
+
+                # 응답 헤더에 처리 시간 추가
+                headers["X-Process-Time"] = str(process_time)
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            process_time = time.perf_counter() - start_time
+            logger.error(
+                "요청 처리 중 오류: %s %s - 소요시간: %.3f초 - 오류: %s",
+                method, path, process_time, e
+            )
+            raise
+
+
+# Preflight 응답을 재사용하는 커스텀 CORS 미들웨어
+class CachedCORSMiddleware(CORSMiddleware):
+    """
+    같은 (Origin, 메서드, 요청 헤더) 조합의 preflight 응답을 캐시하는 CORS 미들웨어
+    Starlette는 preflight마다 헤더 딕셔너리 복사와 응답 객체 생성을 반복하므로
+    한 번 만든 응답을 그대로 재전송
+    """
+    PREFLIGHT_CACHE_SIZE = 256
+
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        self._preflight_cache: Dict[tuple, Response] = {}
+        # Origin 허용 여부를 리스트 순회 대신 집합 조회로 확인
+        self._origin_set = frozenset(self.allow_origins)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all_origins or origin in self._origin_set:
+            return True
+        return self.allow_origin_regex is not None and bool(
+            self.allow_origin_regex.fullmatch(origin)
+        )
+
+    def preflight_response(self, request_headers) -> Response:
+        key = (
+            request_headers["origin"],
+            request_headers["access-control-request-method"],
+            request_headers.get("access-control-request-headers"),
+        )
+        response = self._preflight_cache.get(key)
+        if response is None:
+            response = super().preflight_response(request_headers)
+            # 임의의 요청 헤더 조합으로 캐시가 무한히 커지지 않도록 제한
+            if len(self._preflight_cache) < self.PREFLIGHT_CACHE_SIZE:
+                self._preflight_cache[key] = response
         return response
 
-try:
-    # 패키지로 실행될 때 (python -m backend.src.main)
-    from .database import init_db, close_db
-    from .api import websites, ssl, health, tasks, settings
-    from .scheduler import start_scheduler, stop_scheduler
-    from .background import start_background_executor, stop_background_executor
-except ImportError:
-    # 직접 실행될 때 (python main.py)
-    import sys
-    import os
-    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-    from database import init_db, close_db
-    from api import websites, ssl, health, tasks, settings
-    from scheduler import start_scheduler, stop_scheduler
-    from background import start_background_executor, stop_background_executor
+from .database import init_db, close_db
+from .api import websites, ssl, health, tasks, settings
+from .scheduler import start_scheduler, stop_scheduler
+from .background import start_background_executor, stop_background_executor
+from .lib.notification_service import close_http_client
 
 
 # 로깅 설정
@@ -77,17 +198,82 @@ handler.setFormatter(KSTFormatter(
     "%(asctime)s KST - %(name)s - %(levelname)s - %(message)s"
 ))
 
+# 요청 처리 경로에서는 큐에 넣기만 하고, 실제 출력(write)은 리스너 스레드에서 처리
+log_queue: queue.Queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_queue, handler)
+
 logging.basicConfig(
     level=logging.INFO,
-    handlers=[handler]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
 logger = logging.getLogger(__name__)
 
 
+# 프론트엔드 파일 경로 (요청마다 다시 계산하지 않도록 모듈 로드 시 한 번만 계산)
+_CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Docker 환경: /app/src/main.py -> /app
+# 로컬 환경: backend/src/main.py -> project_root
+if _CURRENT_DIR.startswith("/app/src"):
+    _PROJECT_ROOT = "/app"
+else:
+    _PROJECT_ROOT = os.path.dirname(os.path.dirname(_CURRENT_DIR))
+
+FRONTEND_DIR = os.path.join(_PROJECT_ROOT, "frontend", "src")
+FRONTEND_INDEX_PATH = os.path.join(FRONTEND_DIR, "index.html")
+_FRONTEND_INDEX_EXISTS = os.path.exists(FRONTEND_INDEX_PATH)
+SETTINGS_PAGE_PATH = os.path.join(FRONTEND_DIR, "settings.html")
+_SETTINGS_PAGE_EXISTS = os.path.exists(SETTINGS_PAGE_PATH)
+
+
+# 고정 JSON 응답 (내용이 바뀌지 않으므로 시작 시 한 번만 직렬화)
+_ROOT_FALLBACK_BYTES = orjson.dumps({
+    "message": "SSL Certificate Monitor API",
+    "version": "1.0.0",
+    "status": "running",
+    "docs_url": "/api/docs",
+    "health_check": "/api/health",
+    "note": "Frontend dashboard not found",
+    "debug": {
+        "current_dir": _CURRENT_DIR,
+        "project_root": _PROJECT_ROOT,
+        "frontend_path": FRONTEND_INDEX_PATH,
+        "exists": _FRONTEND_INDEX_EXISTS
+    }
+})
+
+_API_INFO_BYTES = orjson.dumps({
+    "title": "SSL Certificate Monitor API",
+    "version": "1.0.0",
+    "description": "웹사이트 SSL 인증서 모니터링 및 알림 시스템 API",
+    "endpoints": {
+        "websites": "/api/websites",
+        "ssl": "/api/ssl",
+        "health": "/api/health",
+        "tasks": "/api/tasks",
+        "settings": "/api/settings",
+        "documentation": "/api/docs"
+    },
+    "features": [
+        "웹사이트 SSL 인증서 모니터링",
+        "만료 임박 알림",
+        "일괄 SSL 체크",
+        "상세 SSL 정보 조회",
+        "시스템 헬스체크",
+        "실시간 메트릭",
+        "자동 스케줄링",
+        "백그라운드 작업 관리"
+    ]
+})
+
+
 # 애플리케이션 라이프사이클 관리
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 시작/종료 시 실행되는 코드"""
+    # 로그 출력 리스너 시작
+    log_listener.start()
+
     # 시작 시 실행
     logger.info("SSL Certificate Monitor 시작 중...")
 
@@ -100,9 +286,12 @@ async def lifespan(app: FastAPI):
         await start_background_executor()
         logger.info("백그라운드 작업 실행기 시작 완료")
 
-        # 스케줄러 시작
-        await start_scheduler()
-        logger.info("스케줄러 시작 완료")
+        # 스케줄러 시작 (워커/레플리카가 여러 개면 한 프로세스에서만 ENABLE_SCHEDULER=true)
+        if _ENABLE_SCHEDULER:
+            await start_scheduler()
+            logger.info("스케줄러 시작 완료")
+        else:
+            logger.info("ENABLE_SCHEDULER=false: 이 프로세스에서는 스케줄러를 실행하지 않습니다")
 
         yield
 
@@ -118,10 +307,16 @@ async def lifespan(app: FastAPI):
         await stop_background_executor()
         logger.info("백그라운드 작업 실행기 종료 완료")
 
+        # 알림 발송용 공유 HTTP 클라이언트 종료
+        await close_http_client()
+
         # 데이터베이스 연결 종료
         await close_db()
         logger.info("데이터베이스 연결 종료 완료")
 
+        # 남은 로그를 모두 출력한 뒤 리스너 종료
+        log_listener.stop()
+
 
 # FastAPI 애플리케이션 생성
 app = FastAPI(
@@ -131,6 +326,8 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    # orjson 기반 직렬화 (표준 json 대비 CPU 사용량 감소)
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -140,14 +337,22 @@ app = FastAPI(
 app.add_middleware(ProxyHeadersMiddleware, trusted_hosts="*")
 
 # CORS 미들웨어 설정
-CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:8080,https://ssl-monitoring-checking-ssl.d3.clouz.io,https://postgresql-checking-ssl.d3.clouz.io").split(",")
+CORS_ORIGINS = frozenset(
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:8080,https://ssl-monitoring-checking-ssl.d3.clouz.io,https://postgresql-checking-ssl.d3.clouz.io").split(",")
+    if origin.strip()
+)
+
+# Preflight 응답 캐시 시간 (초) - 브라우저가 이 시간 동안 OPTIONS 요청을 생략
+CORS_MAX_AGE = int(os.getenv("CORS_MAX_AGE", "86400"))
 
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=CORS_ORIGINS,
+    CachedCORSMiddleware,
+    allow_origins=list(CORS_ORIGINS),
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    max_age=CORS_MAX_AGE,
 )
 
 
@@ -155,10 +360,9 @@ app.add_middleware(
 # 참고: Kubernetes 환경에서는 내부 Service 통신을 위해 "*" 허용 필요
 ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS", "*").split(",")
 
-app.add_middleware(
-    TrustedHostMiddleware,
-    allowed_hosts=ALLOWED_HOSTS if ALLOWED_HOSTS != ["*"] else ["*"],
-)
+# 와일드카드인 경우 검사할 것이 없으므로 미들웨어 자체를 등록하지 않음
+if ALLOWED_HOSTS != ["*"]:
+    app.add_middleware(TrustedHostMiddleware, allowed_hosts=ALLOWED_HOSTS)
 
 
 # API 라우터 등록
@@ -173,16 +377,18 @@ app.include_router(settings.router)
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """HTTP 예외 처리"""
-    logger.warning(f"HTTP {exc.status_code} 오류 발생: {exc.detail} - {request.url}")
+    # request.url은 호출마다 URL 객체를 다시 만들므로 scope의 경로 문자열을 그대로 사용
+    path = request.scope["path"]
+    logger.warning("HTTP %s 오류 발생: %s - %s", exc.status_code, exc.detail, path)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": True,
             "status_code": exc.status_code,
             "message": exc.detail,
             "timestamp": "",
-            "path": str(request.url.path)
+            "path": path
         }
     )
 
@@ -190,226 +396,66 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """일반 예외 처리"""
-    logger.error(f"예상치 못한 오류 발생: {str(exc)} - {request.url}", exc_info=True)
+    path = request.scope["path"]
+    logger.error("예상치 못한 오류 발생: %s - %s", exc, path, exc_info=True)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": True,
             "status_code": 500,
             "message": "내부 서버 오류가 발생했습니다",
             "timestamp": "",
-            "path": str(request.url.path)
+            "path": path
         }
     )
 
 
-# 요청/응답 로깅 및 리다이렉트 수정 미들웨어
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """요청/응답 로깅 및 HTTPS 리다이렉트 처리"""
-    start_time = asyncio.get_event_loop().time()
+# 요청/응답 로깅 및 리다이렉트 수정 미들웨어 (순수 ASGI)
+# BaseHTTPMiddleware는 요청마다 태스크와 메모리 스트림을 추가로 만들므로 send만 감싸서 처리
+app.add_middleware(LoggingMiddleware)
 
-    # 프록시 헤더 확인
-    forwarded_proto = request.headers.get("x-forwarded-proto", "")
-    forwarded_host = request.headers.get("x-forwarded-host", "")
 
-    # 요청 로깅
-    logger.info(f"요청 시작: {request.method} {request.url.path} (Proto: {forwarded_proto}, Host: {forwarded_host})")
+# API 정보 엔드포인트
+@app.get("/api")
+async def api_info():
+    """API 정보 제공"""
+    return Response(content=_API_INFO_BYTES, media_type="application/json")
 
-    try:
-        response = await call_next(request)
-        process_time = asyncio.get_event_loop().time() - start_time
-
-        # 307 리다이렉트의 경우 Location 헤더를 HTTPS로 수정
-        if response.status_code == 307 and "location" in response.headers:
-            location = response.headers["location"]
-
-            # X-Forwarded-Proto가 https이거나, 알려진 HTTPS 도메인인 경우
-            if forwarded_proto == "https" or "ssl-monitoring-checking-ssl.d3.clouz.io" in location:
-                if location.startswith("http://"):
-                    new_location = location.replace("http://", "https://", 1)
-                    response.headers["location"] = new_location
-                    logger.info(f"리다이렉트 URL 수정: {location} -> {new_location}")
-
-        # 응답 로깅
-        logger.info(
-            f"요청 완료: {request.method} {request.url.path} "
-            f"- 상태: {response.status_code} - 소요시간: {process_time:.3f}초"
-        )
 
-        # 응답 헤더에 처리 시간 추가
-        response.headers["X-Process-Time"] = str(process_time)
+# 정적 파일 서빙 (프론트엔드용)
+# HTML 페이지는 명시적 라우트(FileResponse), JS 등 자산은 경로 접두사가 있는 StaticFiles 마운트로 제공
+# "/"에 디렉토리를 마운트하면 모든 경로와 일치해 /api/websites -> /api/websites/
+# 슬래시 리다이렉트가 동작하지 않으므로 루트 마운트는 사용하지 않음
+logger.info(f"프론트엔드 파일 경로: {FRONTEND_INDEX_PATH} (존재: {_FRONTEND_INDEX_EXISTS})")
 
-        return response
+if os.path.exists(FRONTEND_DIR):
+    _FRONTEND_JS_DIR = os.path.join(FRONTEND_DIR, "js")
+    if os.path.exists(_FRONTEND_JS_DIR):
+        app.mount("/js", NoCacheStaticFiles(directory=_FRONTEND_JS_DIR), name="js")
 
-    except Exception as e:
-        process_time = asyncio.get_event_loop().time() - start_time
-        logger.error(
-            f"요청 처리 중 오류: {request.method} {request.url.path} "
-            f"- 소요시간: {process_time:.3f}초 - 오류: {str(e)}"
-        )
-        raise
+    app.mount("/static", NoCacheStaticFiles(directory=FRONTEND_DIR), name="static")
+    logger.info(f"정적 파일 서빙 설정 완료 (캐시 제어): {FRONTEND_DIR}")
+else:
+    logger.warning(f"프론트엔드 디렉토리를 찾을 수 없음: {FRONTEND_DIR}")
 
 
 # 루트 엔드포인트 - 프론트엔드 서빙
 @app.get("/")
 async def root():
-    """루트 엔드포인트 - 프론트엔드 대시보드 제공"""
-    try:
-        import os
-        # 프로젝트 루트 디렉토리 찾기
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-
-        # Docker 환경: /app/src/main.py -> /app
-        # 로컬 환경: backend/src/main.py -> project_root
-        if current_dir.startswith("/app/src"):
-            # Docker 컨테이너 환경
-            project_root = "/app"
-        else:
-            # 로컬 개발 환경
-            project_root = os.path.dirname(os.path.dirname(current_dir))
-
-        frontend_path = os.path.join(project_root, "frontend", "src", "index.html")
-
-        logger.info(f"현재 디렉토리: {current_dir}")
-        logger.info(f"프로젝트 루트: {project_root}")
-        logger.info(f"프론트엔드 파일 경로: {frontend_path}")
-
-        if os.path.exists(frontend_path):
-            # HTML 파일에 캐시 제어 헤더 추가
-            response = FileResponse(frontend_path)
-            if os.getenv("ENVIRONMENT", "development") == "production":
-                response.headers["Cache-Control"] = "public, max-age=300"
-            else:
-                response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-                response.headers["Pragma"] = "no-cache"
-                response.headers["Expires"] = "0"
-            return response
-        else:
-            # 프론트엔드 파일이 없는 경우 API 정보 반환
-            return {
-                "message": "SSL Certificate Monitor API",
-                "version": "1.0.0",
-                "status": "running",
-                "docs_url": "/api/docs",
-                "health_check": "/api/health",
-                "note": "Frontend dashboard not found",
-                "debug": {
-                    "current_dir": current_dir,
-                    "project_root": project_root,
-                    "frontend_path": frontend_path,
-                    "exists": os.path.exists(frontend_path)
-                }
-            }
-    except Exception as e:
-        logger.warning(f"프론트엔드 파일 서빙 실패: {e}")
-        return {
-            "message": "SSL Certificate Monitor API",
-            "version": "1.0.0",
-            "status": "running",
-            "docs_url": "/api/docs",
-            "health_check": "/api/health",
-            "error": str(e)
-        }
+    """루트 엔드포인트 - 프론트엔드 대시보드 제공 (없으면 API 정보)"""
+    if _FRONTEND_INDEX_EXISTS:
+        return FileResponse(FRONTEND_INDEX_PATH, headers=_CACHE_HEADERS)
+    return Response(content=_ROOT_FALLBACK_BYTES, media_type="application/json")
 
 
 # 설정 페이지 엔드포인트
 @app.get("/settings.html")
 async def settings_page():
     """설정 페이지 제공"""
-    try:
-        import os
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-
-        # Docker 환경 vs 로컬 환경 구분
-        if current_dir.startswith("/app/src"):
-            project_root = "/app"
-        else:
-            project_root = os.path.dirname(os.path.dirname(current_dir))
-
-        settings_path = os.path.join(project_root, "frontend", "src", "settings.html")
-
-        logger.info(f"설정 페이지 경로: {settings_path}")
-
-        if os.path.exists(settings_path):
-            # HTML 파일에 캐시 제어 헤더 추가
-            response = FileResponse(settings_path)
-            if os.getenv("ENVIRONMENT", "development") == "production":
-                response.headers["Cache-Control"] = "public, max-age=300"
-            else:
-                response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-                response.headers["Pragma"] = "no-cache"
-                response.headers["Expires"] = "0"
-            return response
-        else:
-            raise HTTPException(status_code=404, detail="Settings page not found")
-    except Exception as e:
-        logger.warning(f"설정 페이지 서빙 실패: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-# API 정보 엔드포인트
-@app.get("/api")
-async def api_info():
-    """API 정보 제공"""
-    return {
-        "title": "SSL Certificate Monitor API",
-        "version": "1.0.0",
-        "description": "웹사이트 SSL 인증서 모니터링 및 알림 시스템 API",
-        "endpoints": {
-            "websites": "/api/websites",
-            "ssl": "/api/ssl",
-            "health": "/api/health",
-            "tasks": "/api/tasks",
-            "settings": "/api/settings",
-            "documentation": "/api/docs"
-        },
-        "features": [
-            "웹사이트 SSL 인증서 모니터링",
-            "만료 임박 알림",
-            "일괄 SSL 체크",
-            "상세 SSL 정보 조회",
-            "시스템 헬스체크",
-            "실시간 메트릭",
-            "자동 스케줄링",
-            "백그라운드 작업 관리"
-        ]
-    }
-
-
-# 정적 파일 서빙 (프론트엔드용)
-try:
-    import os
-    # 프로젝트 루트 디렉토리 찾기
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-
-    # Docker 환경 vs 로컬 환경 구분
-    if current_dir.startswith("/app/src"):
-        project_root = "/app"
-    else:
-        project_root = os.path.dirname(os.path.dirname(current_dir))
-
-    frontend_path = os.path.join(project_root, "frontend", "src")
-
-    if os.path.exists(frontend_path):
-        # JavaScript, CSS 등 정적 파일을 위한 마운트 (캐시 제어 적용)
-        js_path = os.path.join(frontend_path, "js")
-        if os.path.exists(js_path):
-            app.mount("/js", NoCacheStaticFiles(directory=js_path), name="js")
-            logger.info(f"JavaScript 파일 서빙 설정 (캐시 제어): {js_path}")
-
-        css_path = os.path.join(frontend_path, "css")
-        if os.path.exists(css_path):
-            app.mount("/css", NoCacheStaticFiles(directory=css_path), name="css")
-            logger.info(f"CSS 파일 서빙 설정 (캐시 제어): {css_path}")
-
-        app.mount("/static", NoCacheStaticFiles(directory=frontend_path), name="static")
-        logger.info(f"정적 파일 서빙 설정 완료 (캐시 제어): {frontend_path}")
-    else:
-        logger.warning(f"프론트엔드 디렉토리를 찾을 수 없음: {frontend_path}")
-except Exception as e:
-    logger.warning(f"정적 파일 서빙 설정 실패: {e}")
+    if not _SETTINGS_PAGE_EXISTS:
+        raise HTTPException(status_code=404, detail="Settings page not found")
+    return FileResponse(SETTINGS_PAGE_PATH, headers=_CACHE_HEADERS)
 
 
 # 개발용 서버 실행
@@ -421,7 +467,45 @@ def run_dev_server():
         port=8080,
         reload=True,
         log_level="info",
-        access_log=True
+        # LoggingMiddleware가 요청마다 로그를 남기므로 운영 환경에서는 액세스 로그 중복 방지
+        access_log=not _IS_PROD,
+        # C 기반 이벤트 루프 / HTTP 파서 (uvicorn[standard]에 포함)
+        loop="uvloop",
+        http="httptools"
+    )
+
+
+def run_prod_server():
+    """
+    운영용 서버 실행 (컨테이너 CMD에서 호출)
+
+    환경 변수:
+        WORKERS: 워커 프로세스 수 (기본 1)
+            워커마다 lifespan에서 스케줄러가 시작되므로, 2 이상이면 ENABLE_SCHEDULER=false로
+            두고 스케줄러는 별도의 단일 프로세스에서 실행해야 SSL 체크/알림이 중복되지 않음
+        LIMIT_CONCURRENCY: 동시 처리 최대 연결 수, 초과 시 503 반환 (기본 1000)
+        BACKLOG: 대기 연결 큐 크기 (기본 2048)
+    """
+    workers = int(os.getenv("WORKERS", "1"))
+    if workers > 1 and _ENABLE_SCHEDULER:
+        logger.warning(
+            f"WORKERS={workers}: 워커마다 스케줄러가 실행되어 SSL 체크/알림이 중복됩니다 "
+            f"(ENABLE_SCHEDULER=false 권장)"
+        )
+
+    uvicorn.run(
+        # 컨테이너(src.main)와 로컬(backend.src.main) 모두 현재 모듈 경로 사용
+        f"{__name__}:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8080")),
+        workers=workers,
+        limit_concurrency=int(os.getenv("LIMIT_CONCURRENCY", "1000")),
+        backlog=int(os.getenv("BACKLOG", "2048")),
+        log_level="info",
+        # LoggingMiddleware가 요청 로그를 남기므로 액세스 로그 비활성화
+        access_log=False,
+        loop="uvloop",
+        http="httptools"
     )
 
 
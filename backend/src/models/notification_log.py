@@ -0,0 +1,167 @@
+"""
+NotificationLog 모델
+
+알림 발송 기록을 관리하는 엔티티입니다.
+오류 알림은 웹사이트별 하루 1건만 기록되도록 DB 유니크 인덱스로 보장합니다.
+"""
+
+import uuid
+from datetime import date, datetime
+from typing import Iterable, Set
+
+from sqlalchemy import Date, DateTime, ForeignKey, Index, String, delete, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+
+try:
+    # 패키지로 실행될 때 (python -m backend.src.models.notification_log)
+    from .website import Base, GUID
+except ImportError:
+    # 직접 실행될 때 (python notification_log.py)
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    from website import Base, GUID
+
+
+class NotificationLog(Base):
+    """알림 발송 기록 엔티티
+
+    Attributes:
+        id: UUID primary key (자동 생성)
+        website_id: 대상 웹사이트 ID
+        notification_type: 알림 타입 ('error', 'expiry')
+        sent_on: 발송 날짜 (일 단위 중복 방지 키)
+        sent_at: 발송 시각 (DB 시계 기준)
+    """
+
+    __tablename__ = "notification_log"
+
+    __table_args__ = (
+        # 오류 알림은 웹사이트별 하루 1건 - INSERT ... ON CONFLICT DO NOTHING으로 발송 권한을 원자적으로 획득
+        Index(
+            "ux_notification_log_error_daily",
+            "website_id",
+            "sent_on",
+            unique=True,
+            postgresql_where=text("notification_type = 'error'"),
+            sqlite_where=text("notification_type = 'error'"),
+        ),
+    )
+
+    # Primary Key
+    id: Mapped[uuid.UUID] = mapped_column(
+        GUID(),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+
+    # Foreign Key to Website
+    website_id: Mapped[uuid.UUID] = mapped_column(
+        GUID(),
+        ForeignKey("websites.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    notification_type: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+    )
+
+    sent_on: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+    )
+
+    sent_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=text("CURRENT_TIMESTAMP"),
+    )
+
+    @classmethod
+    async def claim_daily(
+        cls,
+        session: AsyncSession,
+        notification_type: str,
+        website_ids: Iterable[uuid.UUID],
+        sent_on: date,
+    ) -> Set[uuid.UUID]:
+        """웹사이트별 당일 발송 기록을 한 번의 INSERT로 선점
+
+        이미 같은 날 기록이 있는 웹사이트는 충돌로 건너뛰므로,
+        조회 후 판단(SELECT-then-INSERT) 사이의 경쟁 없이 발송 대상이 결정됩니다.
+
+        Args:
+            session: 비동기 세션
+            notification_type: 알림 타입
+            website_ids: 대상 웹사이트 ID 목록
+            sent_on: 발송 날짜
+
+        Returns:
+            새로 기록된(발송해야 하는) 웹사이트 ID 집합
+
+        Raises:
+            ValueError: ON CONFLICT를 지원하지 않는 DB인 경우
+        """
+        values = [
+            {
+                "id": uuid.uuid4(),
+                "website_id": website_id,
+                "notification_type": notification_type,
+                "sent_on": sent_on,
+            }
+            for website_id in website_ids
+        ]
+        if not values:
+            return set()
+
+        dialect_name = session.bind.dialect.name
+        if dialect_name == "postgresql":
+            stmt = pg_insert(cls).values(values)
+        elif dialect_name == "sqlite":
+            stmt = sqlite_insert(cls).values(values)
+        else:
+            raise ValueError(f"ON CONFLICT를 지원하지 않는 DB입니다: {dialect_name}")
+
+        result = await session.execute(
+            stmt.on_conflict_do_nothing().returning(cls.website_id)
+        )
+        return set(result.scalars().all())
+
+    @classmethod
+    async def release_daily(
+        cls,
+        session: AsyncSession,
+        notification_type: str,
+        website_ids: Iterable[uuid.UUID],
+        sent_on: date,
+    ) -> None:
+        """발송에 실패한 웹사이트의 당일 기록 삭제 (다음 실행에서 재시도 가능하도록)
+
+        Args:
+            session: 비동기 세션
+            notification_type: 알림 타입
+            website_ids: 대상 웹사이트 ID 목록
+            sent_on: 발송 날짜
+        """
+        website_ids = list(website_ids)
+        if not website_ids:
+            return
+
+        await session.execute(
+            delete(cls).where(
+                cls.notification_type == notification_type,
+                cls.sent_on == sent_on,
+                cls.website_id.in_(website_ids),
+            )
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<NotificationLog(website_id={self.website_id}, "
+            f"type='{self.notification_type}', sent_on={self.sent_on})>"
+        )
@@ -5,17 +5,36 @@
 """
 
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, Boolean, DateTime, Integer, Text
+from functools import cached_property
+from typing import Tuple
+
+from sqlalchemy import Column, String, Boolean, DateTime, Integer, Text, CheckConstraint
 from sqlalchemy.orm import validates
 
 from ..database import Base
 
 
+DEFAULT_NOTIFICATION_DAYS = "30,7,1"
+SUPPORTED_LANGUAGES = frozenset(("ko", "en"))
+
+
 class Settings(Base):
     """시스템 설정 모델 (싱글톤)"""
 
     __tablename__ = "settings"
 
+    # 정수 범위는 DB 제약 조건으로 검증 (API 요청 모델에서도 동일 범위 검증)
+    __table_args__ = (
+        CheckConstraint(
+            "ssl_timeout_seconds BETWEEN 1 AND 60",
+            name="ck_settings_ssl_timeout_range"
+        ),
+        CheckConstraint(
+            "max_concurrent_checks BETWEEN 1 AND 20",
+            name="ck_settings_max_concurrent_range"
+        ),
+    )
+
     # Primary Key (항상 1로 고정하여 싱글톤 보장)
     id = Column(Integer, primary_key=True, default=1)
 
@@ -32,7 +51,7 @@ class Settings(Base):
     notification_days_before = Column(
         String(100),
         nullable=False,
-        default="30,7,1",
+        default=DEFAULT_NOTIFICATION_DAYS,
         comment="알림 발송 일수 (쉼표 구분)"
     )
     notification_language = Column(
@@ -81,38 +100,39 @@ class Settings(Base):
     @validates("notification_days_before")
     def validate_notification_days(self, key, value):
         """알림 일수 검증"""
+        # 값이 바뀌면 파싱 캐시 무효화
+        self.__dict__.pop("notification_days_list", None)
+
         if not value:
-            return "30,7,1"
+            return DEFAULT_NOTIFICATION_DAYS
 
         # 쉼표로 분리하여 숫자인지 확인
         try:
-            days = [int(day.strip()) for day in value.split(",")]
+            days = tuple(int(day.strip()) for day in value.split(","))
             if not all(day > 0 for day in days):
                 raise ValueError("알림 일수는 양수여야 합니다")
-            return value
         except (ValueError, AttributeError):
-            return "30,7,1"
+            return DEFAULT_NOTIFICATION_DAYS
+
+        # 검증 중 파싱한 결과를 그대로 캐시에 저장 (다시 분리하지 않도록)
+        self.__dict__["notification_days_list"] = days
+        return value
 
     @validates("notification_language")
     def validate_language(self, key, value):
         """언어 검증"""
-        if value not in ["ko", "en"]:
-            return "ko"
-        return value
-
-    @validates("ssl_timeout_seconds")
-    def validate_timeout(self, key, value):
-        """타임아웃 검증"""
-        if not isinstance(value, int) or value < 1 or value > 60:
-            return 10
-        return value
+        return value if value in SUPPORTED_LANGUAGES else "ko"
 
-    @validates("max_concurrent_checks")
-    def validate_concurrent_checks(self, key, value):
-        """동시 체크 수 검증"""
-        if not isinstance(value, int) or value < 1 or value > 20:
-            return 5
-        return value
+    @cached_property
+    def notification_days_list(self) -> Tuple[int, ...]:
+        """알림 발송 일수 목록 (한 번만 파싱하여 재사용)"""
+        try:
+            return tuple(
+                int(day.strip())
+                for day in (self.notification_days_before or DEFAULT_NOTIFICATION_DAYS).split(",")
+            )
+        except ValueError:
+            return tuple(int(day) for day in DEFAULT_NOTIFICATION_DAYS.split(","))
 
     def __repr__(self):
         return f"<Settings(id={self.id}, notification_enabled={self.notification_enabled})>"
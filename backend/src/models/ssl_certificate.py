@@ -4,20 +4,31 @@ SSL Certificate 모델
 SSL 인증서 정보 및 상태를 추적하는 엔티티입니다.
 """
 
+import re
+import time
 import uuid
-from datetime import datetime
-from enum import Enum
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from enum import StrEnum
+from typing import Iterable, List, Optional
 
 from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
     DateTime,
-    Enum as SQLEnum,
     ForeignKey,
+    Index,
+    LargeBinary,
     String,
+    TypeDecorator,
+    case,
+    insert,
     text,
 )
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
+from sqlalchemy.orm import Mapped, joinedload, mapped_column, relationship, validates
 from sqlalchemy.ext.declarative import declarative_base
 
 try:
@@ -32,8 +43,47 @@ except ImportError:
     from website import Base, GUID
 
 
-class SSLStatus(Enum):
-    """SSL 인증서 상태 열거형"""
+# SHA-256 지문 형식 (64자 소문자 16진수)
+_FINGERPRINT_RE = re.compile(r"[0-9a-f]{64}")
+
+_SECONDS_PER_DAY = 86400
+
+
+class HexBinary(TypeDecorator):
+    """16진수 문자열을 원시 바이트로 저장하는 타입 (PostgreSQL BYTEA / SQLite BLOB)
+
+    Python에서는 기존처럼 16진수 문자열로 다루고, DB에는 절반 크기의 바이트로 저장합니다.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, bytes):
+            return value
+        return bytes.fromhex(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return value
+        if isinstance(value, str):
+            return value
+        return bytes(value).hex()
+
+
+def _to_epoch(value: datetime) -> int:
+    """datetime을 UNIX 타임스탬프(초)로 변환 (타임존 없는 값은 UTC로 간주)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+class SSLStatus(StrEnum):
+    """SSL 인증서 상태 열거형
+
+    문자열 열거형이므로 DB에는 값 문자열이 그대로 저장되고,
+    조회된 문자열과도 바로 비교할 수 있습니다.
+    """
 
     VALID = "valid"  # 정상 인증서
     INVALID = "invalid"  # 유효하지 않은 인증서
@@ -43,6 +93,13 @@ class SSLStatus(Enum):
     UNKNOWN = "unknown"  # 상태 불명
 
 
+# 상태 -> 표시 문자열 (열거형 멤버와 DB에서 읽은 문자열 모두 같은 키로 조회됨)
+_STATUS_STR = {status: status.value for status in SSLStatus}
+
+# 항상 'critical' 긴급도인 상태
+_STATUS_CRITICAL = frozenset({SSLStatus.INVALID, SSLStatus.REVOKED})
+
+
 class SSLCertificate(Base):
     """SSL 인증서 엔티티
 
@@ -63,6 +120,40 @@ class SSLCertificate(Base):
 
     __tablename__ = "ssl_certificates"
 
+    # bulk_copy로 적재하는 컬럼 (created_at은 서버 기본값 사용)
+    _BULK_COLUMNS = (
+        "id",
+        "website_id",
+        "issuer",
+        "subject",
+        "serial_number",
+        "issued_date",
+        "expiry_date",
+        "expiry_epoch",
+        "fingerprint",
+        "status",
+        "last_checked",
+        "error_message",
+    )
+
+    # upsert_many 한 문장당 최대 행 수
+    # (SQLite 바인드 파라미터 한도 32766 / 컬럼 12개 이내로 유지)
+    UPSERT_BATCH_SIZE = 1000
+
+    __table_args__ = (
+        # 만료 알림 쿼리 (status = 'valid' AND expiry_date 범위)를 한 번의 범위 스캔으로 처리
+        # 선두 컬럼이 status이므로 상태별 필터링에도 사용됨
+        Index("ix_ssl_status_expiry", "status", "expiry_date"),
+        # bulk_copy 등 @validates를 거치지 않는 적재 경로도 DB에서 검증
+        CheckConstraint("expiry_date > issued_date", name="ck_ssl_expiry_after_issue"),
+        # 16진수 형식은 저장 시 bytes.fromhex로 검증되므로 DB에서는 길이(32바이트)만 확인
+        CheckConstraint("length(fingerprint) = 32", name="ck_ssl_fingerprint_len"),
+    )
+
+    # 서버 기본값(created_at, last_checked)을 INSERT/UPDATE의 RETURNING으로 함께 로드
+    # (비동기 세션에서 flush 후 접근해도 추가 SELECT/지연 로딩이 발생하지 않음)
+    __mapper_args__ = {"eager_defaults": True}
+
     # Primary Key
     id: Mapped[uuid.UUID] = mapped_column(
         GUID(),
@@ -106,25 +197,38 @@ class SSLCertificate(Base):
         index=True,  # 만료 알림 쿼리 최적화
     )
 
+    # 만료일의 UNIX 타임스탬프 (만료 판정을 datetime 연산 대신 숫자 비교로 처리)
+    expiry_epoch: Mapped[Optional[int]] = mapped_column(
+        BigInteger,
+        nullable=True,
+        index=True,
+    )
+
     # 인증서 지문 (고유 식별)
+    # SHA-256 원시 32바이트로 저장 (64자 문자열 대비 유니크 인덱스 크기 절반)
     fingerprint: Mapped[str] = mapped_column(
-        String(128),
+        HexBinary(32),
         nullable=False,
         unique=True,  # 같은 인증서 중복 방지
     )
 
     # 상태 정보
+    # DB ENUM 대신 VARCHAR 사용 (행마다 enum 변환을 하지 않도록)
     status: Mapped[SSLStatus] = mapped_column(
-        SQLEnum(SSLStatus),
+        String(16),
         nullable=False,
-        default=SSLStatus.UNKNOWN,
-        index=True,  # 상태별 필터링 최적화
+        default=SSLStatus.UNKNOWN.value,
     )
 
+    # 체크 시각은 DB 시계 기준 (INSERT/UPDATE 시 Python 측 datetime 생성 없음)
+    # default는 INSERT 문에 CURRENT_TIMESTAMP를 직접 넣으므로 DB 기본값이 없는
+    # 기존 SQLite 테이블(_set_server_defaults는 PostgreSQL 전용)에서도 동작함
     last_checked: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.utcnow,
+        default=text("CURRENT_TIMESTAMP"),
+        server_default=text("CURRENT_TIMESTAMP"),
+        onupdate=text("CURRENT_TIMESTAMP"),
         index=True,  # 배치 처리 최적화
     )
 
@@ -145,7 +249,8 @@ class SSLCertificate(Base):
     website = relationship(
         "Website",
         back_populates="ssl_certificates",
-        lazy="select",
+        # 암묵적 지연 로딩(N+1) 금지 - 필요한 곳에서 joinedload로 명시적으로 로드
+        lazy="raise",
     )
 
     def __init__(
@@ -182,7 +287,6 @@ class SSLCertificate(Base):
         self.fingerprint = fingerprint
         self.status = status
         self.error_message = error_message
-        self.last_checked = datetime.utcnow()
 
     @validates("expiry_date")
     def validate_expiry_date(self, key: str, expiry_date: datetime) -> datetime:
@@ -202,6 +306,7 @@ class SSLCertificate(Base):
             if expiry_date <= self.issued_date:
                 raise ValueError("만료일은 발급일보다 미래여야 합니다")
 
+        self.expiry_epoch = _to_epoch(expiry_date)
         return expiry_date
 
     @validates("fingerprint")
@@ -226,72 +331,91 @@ class SSLCertificate(Base):
         if len(fingerprint) != 64:
             raise ValueError("지문은 64자 16진수여야 합니다")
 
-        try:
-            int(fingerprint, 16)
-        except ValueError:
+        # 정수 변환 없이 정규식으로 16진수 여부만 확인
+        if not _FINGERPRINT_RE.fullmatch(fingerprint):
             raise ValueError("지문은 유효한 16진수여야 합니다")
 
         return fingerprint
 
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
         """인증서가 만료되었는지 확인
 
+        Args:
+            now: 기준 시각 (None이면 현재 시각)
+
         Returns:
             만료 여부
         """
-        from datetime import timezone
-        return datetime.now(timezone.utc) > self.expiry_date
+        if now is None:
+            if self.expiry_epoch is not None:
+                return time.time() > self.expiry_epoch
+            now = datetime.now(timezone.utc)
+        return now > self.expiry_date
 
-    def is_expiring_soon(self, days: int = 30) -> bool:
+    def is_expiring_soon(self, days: int = 30, now: Optional[datetime] = None) -> bool:
         """인증서가 곧 만료되는지 확인
 
         Args:
             days: 확인할 일수
+            now: 기준 시각 (None이면 현재 시각)
 
         Returns:
             곧 만료 여부
         """
-        from datetime import timedelta, timezone
-
-        threshold = datetime.now(timezone.utc) + timedelta(days=days)
-        return self.expiry_date <= threshold
+        if now is None:
+            if self.expiry_epoch is not None:
+                return self.expiry_epoch <= time.time() + days * _SECONDS_PER_DAY
+            now = datetime.now(timezone.utc)
+        return self.expiry_date <= now + timedelta(days=days)
 
-    def days_until_expiry(self) -> int:
+    def days_until_expiry(self, now: Optional[datetime] = None) -> int:
         """만료까지 남은 일수
 
+        Args:
+            now: 기준 시각 (None이면 현재 시각)
+
         Returns:
             만료까지 남은 일수 (음수면 이미 만료됨)
         """
-        from datetime import timezone
-        delta = self.expiry_date - datetime.now(timezone.utc)
-        return delta.days
+        if now is None:
+            if self.expiry_epoch is not None:
+                # timedelta.days와 같은 내림 계산
+                return int((self.expiry_epoch - time.time()) // _SECONDS_PER_DAY)
+            now = datetime.now(timezone.utc)
+        return (self.expiry_date - now).days
 
     def update_status_based_on_expiry(self) -> None:
         """만료일을 기준으로 상태 업데이트"""
         if self.is_expired():
             self.status = SSLStatus.EXPIRED
-        elif self.status == SSLStatus.EXPIRED and not self.is_expired():
+        elif self.status == SSLStatus.EXPIRED:
             # 만료에서 복구된 경우 (시스템 시간 변경 등)
             self.status = SSLStatus.VALID
 
     def update_check_time(self) -> None:
-        """마지막 체크 시간 업데이트"""
-        from datetime import timezone
-        self.last_checked = datetime.now(timezone.utc)
+        """마지막 체크 시간 업데이트 (flush 시 UPDATE ... SET last_checked = CURRENT_TIMESTAMP)"""
+        self.last_checked = text("CURRENT_TIMESTAMP")
 
-    def get_notification_urgency(self) -> str:
+    def get_notification_urgency(self, now: Optional[datetime] = None) -> str:
         """알림 긴급도 반환
 
+        Args:
+            now: 기준 시각 (None이면 현재 시각)
+
         Returns:
             긴급도 ('critical', 'warning', 'info', 'none')
         """
-        if self.status in [SSLStatus.INVALID, SSLStatus.REVOKED]:
+        if self.status in _STATUS_CRITICAL:
             return "critical"
 
-        if self.is_expired():
+        # 만료 여부와 남은 일수를 같은 시각 기준으로 계산
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        if self.is_expired(now):
             return "critical"
 
-        days_left = self.days_until_expiry()
+        days_left = self.days_until_expiry(now)
         if days_left <= 1:
             return "critical"
         elif days_left <= 7:
@@ -301,11 +425,48 @@ class SSLCertificate(Base):
         else:
             return "none"
 
+    @classmethod
+    def with_website(cls):
+        """웹사이트를 함께 로드하는 쿼리 옵션
+
+        website 관계는 lazy="raise"이므로 cert.website가 필요한 쿼리는 이 옵션을 사용합니다.
+        website_id가 NOT NULL이므로 INNER JOIN으로 한 번에 조회합니다.
+        (대량 목록 조회에서 조인으로 행이 커지는 경우 selectinload(SSLCertificate.website) 사용)
+
+        사용 예: select(SSLCertificate).options(SSLCertificate.with_website())
+        """
+        return joinedload(cls.website, innerjoin=True)
+
+    @classmethod
+    def urgency_expression(cls, now: Optional[datetime] = None):
+        """알림 긴급도 SQL 표현식 (get_notification_urgency와 같은 기준)
+
+        now()는 불변 함수가 아니어서 생성 컬럼으로 저장할 수 없으므로,
+        조회 시점의 CASE 식으로 계산합니다. expiry_date 인덱스로 필터링/정렬할 수 있습니다.
+
+        Args:
+            now: 기준 시각 (None이면 현재 시각)
+
+        Returns:
+            'critical' / 'warning' / 'info' / 'none'을 반환하는 CASE 식
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        # days_until_expiry()는 내림 계산이므로 "남은 일수 <= N"은 "만료일 < now + (N+1)일"과 같음
+        return case(
+            (cls.status.in_(_STATUS_CRITICAL), "critical"),
+            (cls.expiry_date < now + timedelta(days=2), "critical"),
+            (cls.expiry_date < now + timedelta(days=8), "warning"),
+            (cls.expiry_date < now + timedelta(days=31), "info"),
+            else_="none",
+        )
+
     def __repr__(self) -> str:
         """문자열 표현"""
         return (
             f"<SSLCertificate(id={self.id}, website_id={self.website_id}, "
-            f"subject='{self.subject}', status={self.status.value}, "
+            f"subject='{self.subject}', status={_STATUS_STR[self.status]}, "
             f"expiry_date={self.expiry_date})>"
         )
 
@@ -313,9 +474,9 @@ class SSLCertificate(Base):
         """사용자 친화적 문자열 표현"""
         days_left = self.days_until_expiry()
         if days_left > 0:
-            return f"{self.subject} (만료 {days_left}일 남음, {self.status.value})"
+            return f"{self.subject} (만료 {days_left}일 남음, {_STATUS_STR[self.status]})"
         else:
-            return f"{self.subject} (만료됨, {self.status.value})"
+            return f"{self.subject} (만료됨, {_STATUS_STR[self.status]})"
 
     def to_dict(self) -> dict:
         """딕셔너리로 변환 (JSON 직렬화용)
@@ -323,6 +484,8 @@ class SSLCertificate(Base):
         Returns:
             SSL 인증서 정보 딕셔너리
         """
+        # 파생 필드가 모두 같은 시각을 기준으로 계산되도록 한 번만 조회
+        now = datetime.now(timezone.utc)
         return {
             "id": str(self.id),
             "website_id": str(self.website_id),
@@ -332,12 +495,12 @@ class SSLCertificate(Base):
             "issued_date": self.issued_date.isoformat() if self.issued_date else None,
             "expiry_date": self.expiry_date.isoformat() if self.expiry_date else None,
             "fingerprint": self.fingerprint,
-            "status": self.status.value,
+            "status": _STATUS_STR[self.status],
             "last_checked": self.last_checked.isoformat() if self.last_checked else None,
             "created_at": self.created_at.isoformat() if self.created_at else None,
-            "days_until_expiry": self.days_until_expiry(),
-            "is_expired": self.is_expired(),
-            "notification_urgency": self.get_notification_urgency(),
+            "days_until_expiry": self.days_until_expiry(now),
+            "is_expired": self.is_expired(now),
+            "notification_urgency": self.get_notification_urgency(now),
         }
 
     @classmethod
@@ -366,4 +529,178 @@ class SSLCertificate(Base):
             expiry_date=cert_info["expiry_date"],
             fingerprint=cert_info["fingerprint"],
             status=status,
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def _bulk_record(cls, row: dict, now: datetime) -> tuple:
+        """ORM을 거치지 않는 적재 경로용 행 검증 및 _BULK_COLUMNS 순서의 튜플 생성
+
+        Args:
+            row: 인증서 정보 딕셔너리
+            now: last_checked 기본값
+
+        Returns:
+            _BULK_COLUMNS 순서의 값 튜플 (id가 없으면 None)
+
+        Raises:
+            ValueError: 지문 또는 만료일이 유효하지 않은 경우
+        """
+        # @validates를 거치지 않으므로 전송 전에 한 번만 검증
+        fingerprint = row["fingerprint"].strip().lower()
+        if not _FINGERPRINT_RE.fullmatch(fingerprint):
+            raise ValueError(f"지문은 64자 16진수여야 합니다: {row['fingerprint']}")
+        if row["expiry_date"] <= row["issued_date"]:
+            raise ValueError("만료일은 발급일보다 미래여야 합니다")
+
+        return (
+            row.get("id"),
+            row["website_id"],
+            row["issuer"],
+            row["subject"],
+            row["serial_number"],
+            row["issued_date"],
+            row["expiry_date"],
+            _to_epoch(row["expiry_date"]),
+            bytes.fromhex(fingerprint),
+            str(row.get("status", SSLStatus.VALID)),
+            row.get("last_checked") or now,
+            row.get("error_message"),
+        )
+
+    @classmethod
+    def _upsert_statement(cls, dialect_name: str, values: List[dict]):
+        """지문(fingerprint) 충돌 시 체크 결과만 갱신하는 INSERT ... ON CONFLICT 문 생성
+
+        Args:
+            dialect_name: DB 방언 이름 (postgresql / sqlite)
+            values: 컬럼별 값 딕셔너리 목록
+
+        Returns:
+            실행할 INSERT 문
+        """
+        if dialect_name == "postgresql":
+            stmt = pg_insert(cls).values(values)
+        elif dialect_name == "sqlite":
+            stmt = sqlite_insert(cls).values(values)
+        else:
+            raise ValueError(f"ON CONFLICT를 지원하지 않는 DB입니다: {dialect_name}")
+
+        return stmt.on_conflict_do_update(
+            index_elements=[cls.fingerprint],
+            set_={
+                "last_checked": stmt.excluded.last_checked,
+                "status": stmt.excluded.status,
+                "error_message": stmt.excluded.error_message,
+            },
+        )
+
+    @classmethod
+    async def async_upsert(
+        cls,
+        session: AsyncSession,
+        cert_info: dict,
+    ) -> None:
+        """인증서 정보를 한 번의 쿼리로 저장 (이미 있는 지문이면 체크 결과만 갱신)
+
+        조회 후 삽입/갱신을 결정하는 대신 INSERT ... ON CONFLICT DO UPDATE로 처리합니다.
+        커밋은 호출 측에서 수행합니다.
+
+        Args:
+            session: 비동기 DB 세션
+            cert_info: 인증서 정보 (website_id, issuer, subject, serial_number, issued_date,
+                expiry_date, fingerprint, 선택: status, last_checked, error_message)
+
+        Raises:
+            ValueError: 지문 또는 만료일이 유효하지 않은 경우
+        """
+        await cls.upsert_many(session, [cert_info])
+
+    @classmethod
+    async def upsert_many(
+        cls,
+        session: AsyncSession,
+        rows: Iterable[dict],
+        batch_size: int = UPSERT_BATCH_SIZE,
+    ) -> int:
+        """인증서 정보 목록을 배치 단위 INSERT ... ON CONFLICT DO UPDATE로 저장
+
+        커밋은 호출 측에서 수행합니다.
+
+        Args:
+            session: 비동기 DB 세션
+            rows: 인증서 정보 딕셔너리 목록 (async_upsert의 cert_info와 같은 형식)
+            batch_size: 한 문장에 담을 최대 행 수
+
+        Returns:
+            처리된 행 수
+
+        Raises:
+            ValueError: 지문 또는 만료일이 유효하지 않은 경우
+        """
+        now = datetime.now(timezone.utc)
+        values = []
+        for row in rows:
+            record = dict(zip(cls._BULK_COLUMNS, cls._bulk_record(row, now)))
+            record["id"] = record["id"] or uuid.uuid4()
+            values.append(record)
+
+        dialect_name = session.bind.dialect.name
+        for start in range(0, len(values), batch_size):
+            await session.execute(
+                cls._upsert_statement(dialect_name, values[start:start + batch_size])
+            )
+
+        return len(values)
+
+    @classmethod
+    async def bulk_copy(
+        cls,
+        conn: AsyncConnection,
+        rows: Iterable[dict],
+    ) -> int:
+        """인증서 정보를 ORM 단위 작업 없이 일괄 적재
+
+        PostgreSQL에서는 COPY 프로토콜(asyncpg copy_records_to_table)로 전송하고,
+        그 외 DB에서는 단일 트랜잭션 내 executemany로 삽입합니다.
+
+        Args:
+            conn: 비동기 DB 연결 (트랜잭션은 호출 측에서 관리)
+            rows: 인증서 정보 딕셔너리 목록
+                (website_id, issuer, subject, serial_number, issued_date, expiry_date, fingerprint,
+                 선택: id, status, last_checked, error_message)
+
+        Returns:
+            적재된 행 수
+
+        Raises:
+            ValueError: 지문 또는 만료일이 유효하지 않은 경우
+        """
+        now = datetime.now(timezone.utc)
+        records = [cls._bulk_record(row, now) for row in rows]
+
+        if not records:
+            return 0
+
+        is_postgresql = conn.dialect.name == "postgresql"
+        columns = cls._BULK_COLUMNS
+        if is_postgresql and all(record[0] is None for record in records):
+            # id는 DB의 gen_random_uuid() 기본값으로 생성 (Python에서 UUID를 만들지 않음)
+            columns = columns[1:]
+            records = [record[1:] for record in records]
+        else:
+            records = [(record[0] or uuid.uuid4(),) + record[1:] for record in records]
+
+        if is_postgresql:
+            raw_conn = await conn.get_raw_connection()
+            await raw_conn.driver_connection.copy_records_to_table(
+                cls.__tablename__,
+                records=records,
+                columns=columns,
+            )
+        else:
+            await conn.execute(
+                insert(cls.__table__),
+                [dict(zip(columns, record)) for record in records],
+            )
+
+        return len(records)
@@ -4,30 +4,58 @@ Website 모델
 모니터링 대상 웹사이트 정보를 관리하는 엔티티입니다.
 """
 
+import re
 import uuid
+from functools import lru_cache
 from datetime import datetime
 from typing import Optional
-from urllib.parse import urlparse
 
-from sqlalchemy import Boolean, DateTime, String, text, TypeDecorator, CHAR
+from sqlalchemy import Boolean, DateTime, String, text, TypeDecorator, BINARY
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
 
+# URL에서 netloc(도메인[:포트])과 경로를 한 번에 추출 (urlparse 대체)
+_URL_RE = re.compile(
+    r"^(?:[a-z][a-z0-9+.\-]*:)?//(?P<netloc>[^/?#]*)(?P<path>[^?#]*)",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=2048)
+def _extract_domain(url: str) -> str:
+    """URL에서 표시용 도메인 추출 (같은 모니터링 대상 URL이 반복되므로 결과 캐시)
+
+    Args:
+        url: 대상 URL
+
+    Returns:
+        추출된 도메인명
+    """
+    try:
+        match = _URL_RE.match(url)
+        return Website._domain_from_netloc(match.group("netloc") if match else "")
+    except Exception:
+        return "Unknown Domain"
+
 
 class GUID(TypeDecorator):
-    """범용 UUID 타입 (SQLite/PostgreSQL 호환)"""
+    """범용 UUID 타입 (SQLite/PostgreSQL 호환)
+
+    PostgreSQL은 네이티브 UUID, 그 외 DB는 16바이트 바이너리로 저장합니다.
+    (36자 문자열 대비 행/인덱스 크기가 절반 이하이고 비교가 바이트 비교로 끝남)
+    """
 
-    impl = CHAR
+    impl = BINARY
     cache_ok = True
 
     def load_dialect_impl(self, dialect):
         if dialect.name == 'postgresql':
             return dialect.type_descriptor(UUID())
         else:
-            return dialect.type_descriptor(CHAR(36))
+            return dialect.type_descriptor(BINARY(16))
 
     def process_bind_param(self, value, dialect):
         if value is None:
@@ -36,8 +64,8 @@ class GUID(TypeDecorator):
             return str(value)
         else:
             if isinstance(value, uuid.UUID):
-                return str(value)
-            return value
+                return value.bytes
+            return uuid.UUID(value).bytes
 
     def process_result_value(self, value, dialect):
         if value is None:
@@ -45,6 +73,8 @@ class GUID(TypeDecorator):
         else:
             if isinstance(value, uuid.UUID):
                 return value
+            if isinstance(value, bytes):
+                return uuid.UUID(bytes=value)
             return uuid.UUID(value)
 
 
@@ -63,6 +93,9 @@ class Website(Base):
 
     __tablename__ = "websites"
 
+    # 서버 기본값(created_at, updated_at)을 INSERT/UPDATE의 RETURNING으로 함께 로드
+    __mapper_args__ = {"eager_defaults": True}
+
     # Primary Key
     id: Mapped[uuid.UUID] = mapped_column(
         GUID(),
@@ -95,7 +128,7 @@ class Website(Base):
         DateTime(timezone=True),
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
-        onupdate=datetime.utcnow,
+        onupdate=text("CURRENT_TIMESTAMP"),
     )
 
     # 활성화 상태
@@ -111,7 +144,8 @@ class Website(Base):
         "SSLCertificate",
         back_populates="website",
         cascade="all, delete-orphan",
-        lazy="select",
+        # 암묵적 지연 로딩(N+1) 금지 - 필요한 곳에서 selectinload로 명시적으로 로드
+        lazy="raise",
     )
 
     def __init__(self, url: str, name: Optional[str] = None, is_active: bool = True):
@@ -123,7 +157,8 @@ class Website(Base):
             is_active: 활성화 상태
         """
         self.url = url
-        self.name = name or self._extract_domain_from_url(url)
+        # URL 검증 시 추출한 netloc을 재사용 (다시 파싱하지 않음)
+        self.name = name or self._domain_from_netloc(self._parsed_url[1])
         self.is_active = is_active
 
     @validates("url")
@@ -154,20 +189,26 @@ class Website(Base):
         if url.startswith("http://"):
             url = url.replace("http://", "https://", 1)
 
-        try:
-            parsed = urlparse(url)
-            if not parsed.netloc:
-                raise ValueError("유효한 도메인이 필요합니다")
+        match = _URL_RE.match(url)
+        netloc = match.group("netloc") if match else ""
+        path = match.group("path") if match else ""
+
+        if not netloc:
+            raise ValueError("유효하지 않은 URL 형식입니다: 유효한 도메인이 필요합니다")
 
-            # 경로가 있는지 확인 (루트 도메인만 허용)
-            if parsed.path and parsed.path != "/":
-                raise ValueError("경로를 포함한 URL은 허용되지 않습니다. 루트 도메인만 사용하세요")
+        # 경로가 있는지 확인 (루트 도메인만 허용)
+        if path and path != "/":
+            raise ValueError(
+                "유효하지 않은 URL 형식입니다: "
+                "경로를 포함한 URL은 허용되지 않습니다. 루트 도메인만 사용하세요"
+            )
 
-            # 기본 포트가 아닌 경우 허용 (예: https://example.com:8443)
-            return url.rstrip("/")  # 끝에 있는 슬래시 제거
+        # 기본 포트가 아닌 경우 허용 (예: https://example.com:8443)
+        url = url.rstrip("/")  # 끝에 있는 슬래시 제거
 
-        except Exception as e:
-            raise ValueError(f"유효하지 않은 URL 형식입니다: {str(e)}")
+        # 이름 기본값 생성 시 재사용 (검증된 URL, netloc)
+        self._parsed_url = (url, netloc)
+        return url
 
     @validates("name")
     def validate_name(self, key: str, name: Optional[str]) -> Optional[str]:
@@ -197,21 +238,31 @@ class Website(Base):
         Returns:
             추출된 도메인명
         """
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc
+        # 검증 시 파싱한 URL과 같으면 결과 재사용
+        parsed_url = self.__dict__.get("_parsed_url")
+        if parsed_url is not None and parsed_url[0] == url:
+            return self._domain_from_netloc(parsed_url[1])
+
+        return _extract_domain(url)
 
-            # 포트 번호 제거
-            if ":" in domain:
-                domain = domain.split(":")[0]
+    @staticmethod
+    def _domain_from_netloc(netloc: str) -> str:
+        """netloc에서 표시용 도메인 생성
+
+        Args:
+            netloc: URL의 netloc (도메인[:포트])
+
+        Returns:
+            추출된 도메인명
+        """
+        # 포트 번호 제거
+        domain = netloc.split(":", 1)[0]
 
-            # www. 제거
-            if domain.startswith("www."):
-                domain = domain[4:]
+        # www. 제거
+        if domain.startswith("www."):
+            domain = domain[4:]
 
-            return domain.title()  # 첫 글자 대문자
-        except Exception:
-            return "Unknown Domain"
+        return domain.title()  # 첫 글자 대문자
 
     def update_url(self, new_url: str) -> None:
         """URL 업데이트 (자동으로 이름도 업데이트)
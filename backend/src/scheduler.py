@@ -5,10 +5,16 @@ APScheduler 설정 및 주간 SSL 체크 스케줄러
 """
 
 import asyncio
+import functools
 import logging
 import os
-from datetime import datetime, time
-from typing import Optional, Dict, Any, List
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -17,7 +23,7 @@ from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, JobExecution
 from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.executors.asyncio import AsyncIOExecutor
 
-from .database import get_async_session
+from .database import db_manager, with_session
 from .services.ssl_service import SSLService, SSLServiceError
 from .services.notification_service import NotificationService, NotificationServiceError
 
@@ -25,6 +31,22 @@ from .services.notification_service import NotificationService, NotificationServ
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 스케줄 기준 시간대 (한국 시간)
+SCHEDULER_TZ = ZoneInfo("Asia/Seoul")
+
+# 요일 표시 (0=월요일, 6=일요일)
+_WEEKDAY_KR: Tuple[str, ...] = ("월", "화", "수", "목", "금", "토", "일")
+
+# 종료 시 실행 중인 작업을 기다리는 최대 시간 (초) - 초과 시 취소
+SHUTDOWN_TIMEOUT = 30
+
+# 스케줄 작업 외에 API 요청용으로 남겨둘 DB 연결 수
+POOL_HEADROOM = 2
+
+# 수동 실행 결과 보관 개수 및 보관 시간 (초)
+TRIGGER_RESULT_MAX = 128
+TRIGGER_RESULT_TTL = 3600
+
 
 class SchedulerService:
     """SSL 모니터링 스케줄러 서비스"""
@@ -35,7 +57,7 @@ class SchedulerService:
         weekly_check_time: str = "09:00",  # 09:00 AM
         notification_check_interval: int = 24,  # 24시간마다
         teams_webhook_url: Optional[str] = None,
-        max_concurrent_jobs: int = 3
+        max_concurrent_jobs: Optional[int] = None
     ):
         """
         Args:
@@ -43,7 +65,7 @@ class SchedulerService:
             weekly_check_time: 주간 체크 시간 (HH:MM 형식)
             notification_check_interval: 알림 체크 간격 (시간)
             teams_webhook_url: Teams 웹훅 URL
-            max_concurrent_jobs: 최대 동시 실행 작업 수
+            max_concurrent_jobs: 주간 체크의 최대 동시 SSL 체크 수 (None이면 MAX_CONCURRENT_CHECKS 환경변수)
         """
         self.weekly_check_day = weekly_check_day
         self.weekly_check_time = weekly_check_time
@@ -51,6 +73,23 @@ class SchedulerService:
         self.teams_webhook_url = teams_webhook_url or os.getenv("TEAMS_WEBHOOK_URL")
         self.max_concurrent_jobs = max_concurrent_jobs
 
+        # 트리거는 생성 시 한 번만 구성 (재등록 시 시간 문자열 파싱/시간대 조회 반복 없음)
+        hour, minute = map(int, weekly_check_time.split(':'))
+        self._weekly_trigger = CronTrigger(
+            day_of_week=weekly_check_day,
+            hour=hour,
+            minute=minute,
+            timezone=SCHEDULER_TZ
+        )
+        self._expiry_trigger = IntervalTrigger(
+            hours=notification_check_interval,
+            timezone=SCHEDULER_TZ
+        )
+        self._health_trigger = IntervalTrigger(
+            hours=1,
+            timezone=SCHEDULER_TZ
+        )
+
         # 스케줄러 설정
         self.scheduler = AsyncIOScheduler(
             jobstores={
@@ -60,10 +99,12 @@ class SchedulerService:
                 'default': AsyncIOExecutor()
             },
             job_defaults={
-                'coalesce': False,  # 놓친 실행을 누적하지 않음
-                'max_instances': 1,  # 같은 작업은 하나만 동시 실행
-                'misfire_grace_time': 30  # 30초 안에 실행되지 않으면 skip
-            }
+                'coalesce': True,  # 밀린 실행은 한 번으로 합침 (재배포 후 인터벌 작업 몰림 방지)
+                'max_instances': 1,  # 같은 작업은 하나만 동시 실행 (모든 작업이 같은 DB 행을 다룸)
+                'misfire_grace_time': 300  # 이벤트 루프가 바빠도 5분 안이면 실행
+            },
+            # 트리거와 같은 ZoneInfo 객체 사용 (생성 시 tzlocal로 로컬 시간대를 조회하지 않음)
+            timezone=SCHEDULER_TZ
         )
 
         # 이벤트 리스너 등록
@@ -72,6 +113,20 @@ class SchedulerService:
             EVENT_JOB_EXECUTED | EVENT_JOB_ERROR
         )
 
+        # 작업 ID -> 실행 함수 (trigger_job_now에서 분기 없이 조회)
+        self._handlers: Dict[str, Callable[[], Awaitable[Dict[str, Any]]]] = {
+            'weekly_ssl_check': self._run_weekly_ssl_check,
+            'expiry_notifications': self._run_expiry_notifications,
+            'scheduler_health_check': self._run_health_check,
+        }
+
+        # 수동 실행 작업: 진행 중 (task_id -> Task), 완료 (task_id -> (완료 시각, 결과))
+        self._pending: Dict[str, asyncio.Task] = {}
+
+        # 실행 중인 작업 태스크 (스케줄 실행 포함, _job_scope에서 등록/해제)
+        self._inflight: Set[asyncio.Task] = set()
+        self._results: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
         self._is_running = False
 
     async def start(self) -> None:
@@ -92,6 +147,9 @@ class SchedulerService:
             # 헬스체크 작업 등록
             await self._schedule_health_check()
 
+            # 연결 풀 용량 확인
+            self._check_pool_capacity()
+
             # 스케줄러 시작
             self.scheduler.start()
             self._is_running = True
@@ -102,6 +160,24 @@ class SchedulerService:
             logger.error(f"스케줄러 시작 실패: {e}")
             raise
 
+    def _check_pool_capacity(self) -> None:
+        """DB 연결 풀이 스케줄 작업 동시 실행을 감당할 수 있는지 확인
+
+        각 작업은 with_session으로 연결 하나만 사용하고(사이트별 동시 체크도 같은 세션 공유),
+        같은 작업은 동시에 하나만 실행되므로 필요한 연결 수는 작업 수 + API 요청용 여유분입니다.
+        """
+        config = db_manager.config
+        if config.is_sqlite:
+            return
+
+        capacity = config.pool_size + config.max_overflow
+        required = len(self._handlers) + POOL_HEADROOM
+        if capacity < required:
+            logger.warning(
+                f"DB 연결 풀 용량 부족: pool_size + max_overflow = {capacity}, "
+                f"필요 {required} (DB_POOL_SIZE/DB_MAX_OVERFLOW 조정 필요)"
+            )
+
     async def stop(self) -> None:
         """스케줄러 종료"""
         if not self._is_running:
@@ -111,8 +187,13 @@ class SchedulerService:
         try:
             logger.info("SSL 모니터링 스케줄러 종료 중...")
 
-            # 대기 중인 작업들이 완료될 때까지 대기
-            self.scheduler.shutdown(wait=True)
+            # 새 작업 실행을 멈추고, 실행 중인 작업은 제한 시간 동안만 대기한 뒤 종료
+            # (AsyncIOExecutor.shutdown은 wait 값과 관계없이 실행 중인 작업을 취소하므로
+            #  먼저 일시정지 후 대기하고, wait=True는 이벤트 루프를 막으므로 사용하지 않음)
+            self.scheduler.pause()
+            await self._drain_inflight()
+            self.scheduler.shutdown(wait=False)
+
             self._is_running = False
 
             logger.info("SSL 모니터링 스케줄러 종료 완료")
@@ -121,32 +202,37 @@ class SchedulerService:
             logger.error(f"스케줄러 종료 실패: {e}")
             raise
 
+    async def _drain_inflight(self) -> None:
+        """실행 중인 작업 완료 대기 (SHUTDOWN_TIMEOUT 초과 시 취소)"""
+        tasks = self._inflight | set(self._pending.values())
+        if not tasks:
+            return
+
+        done, pending = await asyncio.wait(tasks, timeout=SHUTDOWN_TIMEOUT)
+        if pending:
+            logger.warning(f"종료 대기 시간 초과: 실행 중인 작업 {len(pending)}개 취소")
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
     async def _schedule_weekly_ssl_check(self) -> None:
         """주간 SSL 체크 작업 스케줄링"""
         try:
-            # 시간 파싱
-            hour, minute = map(int, self.weekly_check_time.split(':'))
-
-            # 크론 트리거 생성 (매주 지정된 요일과 시간에 실행)
-            trigger = CronTrigger(
-                day_of_week=self.weekly_check_day,
-                hour=hour,
-                minute=minute,
-                timezone='Asia/Seoul'  # 한국 시간 기준
-            )
-
-            # 작업 등록
+            # 작업 등록 (매주 지정된 요일과 시간에 실행)
             self.scheduler.add_job(
                 self._run_weekly_ssl_check,
-                trigger=trigger,
+                trigger=self._weekly_trigger,
                 id='weekly_ssl_check',
                 name='주간 SSL 인증서 체크',
-                replace_existing=True
+                replace_existing=True,
+                coalesce=False,  # 주간 체크는 늦더라도 매 회차 실행
+                misfire_grace_time=3600  # 1시간 안이면 늦게라도 실행
             )
 
             logger.info(
-                f"주간 SSL 체크 작업 등록 완료: 매주 {['월', '화', '수', '목', '금', '토', '일'][self.weekly_check_day]}요일 "
-                f"{self.weekly_check_time}"
+                "주간 SSL 체크 작업 등록 완료: 매주 %s요일 %s",
+                _WEEKDAY_KR[self.weekly_check_day],
+                self.weekly_check_time
             )
 
         except Exception as e:
@@ -156,16 +242,10 @@ class SchedulerService:
     async def _schedule_expiry_notifications(self) -> None:
         """만료 알림 체크 작업 스케줄링"""
         try:
-            # 인터벌 트리거 생성 (지정된 시간마다 실행)
-            trigger = IntervalTrigger(
-                hours=self.notification_check_interval,
-                timezone='Asia/Seoul'
-            )
-
-            # 작업 등록
+            # 작업 등록 (지정된 시간마다 실행)
             self.scheduler.add_job(
                 self._run_expiry_notifications,
-                trigger=trigger,
+                trigger=self._expiry_trigger,
                 id='expiry_notifications',
                 name='SSL 만료 알림 체크',
                 replace_existing=True
@@ -180,16 +260,10 @@ class SchedulerService:
     async def _schedule_health_check(self) -> None:
         """스케줄러 헬스체크 작업 등록"""
         try:
-            # 매시간 헬스체크 실행
-            trigger = IntervalTrigger(
-                hours=1,
-                timezone='Asia/Seoul'
-            )
-
-            # 작업 등록
+            # 작업 등록 (매시간 헬스체크 실행)
             self.scheduler.add_job(
                 self._run_health_check,
-                trigger=trigger,
+                trigger=self._health_trigger,
                 id='scheduler_health_check',
                 name='스케줄러 헬스체크',
                 replace_existing=True
@@ -201,67 +275,78 @@ class SchedulerService:
             logger.error(f"헬스체크 작업 등록 실패: {e}")
             raise
 
+    @asynccontextmanager
+    async def _job_scope(self, job_type: str, label: str) -> AsyncIterator[Dict[str, Any]]:
+        """작업 실행 기록 컨텍스트 매니저
+
+        시작/종료 시각과 소요시간을 기록한 결과 딕셔너리를 제공합니다.
+        블록에서 발생한 예외는 기록(status=failed, error)만 하고 전파하지 않습니다.
+
+        Args:
+            job_type: 결과에 기록할 작업 유형
+            label: 로그에 사용할 작업 이름
+
+        Yields:
+            작업 결과 딕셔너리 (블록에서 result/status를 채움)
+        """
+        # 소요시간은 단조 시계로 측정 (시스템 시계 조정에 영향받지 않음)
+        loop = asyncio.get_running_loop()
+        mono_start = loop.time()
+        start_time = datetime.now(timezone.utc)
+        record: Dict[str, Any] = {"job_type": job_type, "status": "completed"}
+
+        # 종료 시 대기/취소할 수 있도록 현재 태스크 등록
+        task = asyncio.current_task()
+        self._inflight.add(task)
+
+        try:
+            yield record
+        except Exception as e:
+            logger.error(f"{label} 실패: {e}")
+            record["status"] = "failed"
+            record["error"] = str(e)
+        finally:
+            self._inflight.discard(task)
+            duration = loop.time() - mono_start
+            record["start_time"] = start_time.isoformat()
+            record["end_time"] = (start_time + timedelta(seconds=duration)).isoformat()
+            record["duration_seconds"] = duration
+
     async def _run_weekly_ssl_check(self) -> Dict[str, Any]:
         """주간 SSL 체크 실행"""
         logger.info("주간 SSL 체크 작업 시작")
-        start_time = datetime.utcnow()
 
-        try:
-            async with get_async_session() as session:
-                ssl_service = SSLService(session)
+        async with self._job_scope("weekly_ssl_check", "주간 SSL 체크") as record:
+            # 작업 전체가 하나의 세션을 공유 (하위 서비스는 ctx_session에서 세션을 가져옴)
+            async with with_session():
+                ssl_service = SSLService()
 
                 # 모든 활성 웹사이트의 SSL 인증서 체크
+                # 최근 확인된 안정적인 인증서는 건너뛰고 재확인이 필요한 웹사이트만 체크
                 result = await ssl_service.bulk_ssl_check(
                     active_only=True,
-                    max_concurrent=self.max_concurrent_jobs
+                    max_concurrent=self.max_concurrent_jobs,
+                    due_only=True
                 )
 
-                end_time = datetime.utcnow()
-                duration = (end_time - start_time).total_seconds()
-
-                logger.info(
-                    f"주간 SSL 체크 완료: {result['successful_checks']}/{result['total_websites']} 성공, "
-                    f"소요시간: {duration:.2f}초"
-                )
-
-                return {
-                    "job_type": "weekly_ssl_check",
-                    "status": "completed",
-                    "start_time": start_time.isoformat(),
-                    "end_time": end_time.isoformat(),
-                    "duration_seconds": duration,
-                    "result": result
-                }
-
-        except Exception as e:
-            end_time = datetime.utcnow()
-            duration = (end_time - start_time).total_seconds()
-
-            logger.error(f"주간 SSL 체크 실패: {e}")
+            record["result"] = result
+            logger.info(
+                f"주간 SSL 체크 완료: {result['successful_checks']}/{result['total_websites']} 성공, "
+                f"소요시간: {result['processing_time_seconds']:.2f}초"
+            )
 
-            return {
-                "job_type": "weekly_ssl_check",
-                "status": "failed",
-                "start_time": start_time.isoformat(),
-                "end_time": end_time.isoformat(),
-                "duration_seconds": duration,
-                "error": str(e)
-            }
+        return record
 
     async def _run_expiry_notifications(self) -> Dict[str, Any]:
         """만료 알림 체크 실행"""
         logger.info("SSL 만료 알림 체크 작업 시작")
-        start_time = datetime.utcnow()
 
-        try:
-            async with get_async_session() as session:
+        async with self._job_scope("expiry_notifications", "만료 알림 체크") as record:
+            async with with_session():
                 # NotificationLib을 사용하여 DB 설정에서 알림 일수를 자동 로드
                 from .lib.notification_service import NotificationService as NotificationLib
 
-                notification_lib = NotificationLib(
-                    session=session,
-                    webhook_url=self.teams_webhook_url
-                )
+                notification_lib = NotificationLib(webhook_url=self.teams_webhook_url)
 
                 # DB 설정 로드 (알림 일수 포함)
                 await notification_lib._load_settings_from_db()
@@ -269,101 +354,63 @@ class SchedulerService:
                 # 만료 임박 인증서 알림 발송
                 success = await notification_lib.check_and_send_expiry_notifications()
 
-                end_time = datetime.utcnow()
-                duration = (end_time - start_time).total_seconds()
-
-                logger.info(
-                    f"만료 알림 체크 완료: 소요시간: {duration:.2f}초, 성공: {success}"
-                )
-
-                return {
-                    "job_type": "expiry_notifications",
-                    "status": "completed" if success else "failed",
-                    "start_time": start_time.isoformat(),
-                    "end_time": end_time.isoformat(),
-                    "duration_seconds": duration,
-                    "result": {
-                        "success": success,
-                        "notification_days": notification_lib.notification_days
-                    }
-                }
-
-        except Exception as e:
-            end_time = datetime.utcnow()
-            duration = (end_time - start_time).total_seconds()
-
-            logger.error(f"만료 알림 체크 실패: {e}")
-
-            return {
-                "job_type": "expiry_notifications",
-                "status": "failed",
-                "start_time": start_time.isoformat(),
-                "end_time": end_time.isoformat(),
-                "duration_seconds": duration,
-                "error": str(e)
+            record["status"] = "completed" if success else "failed"
+            record["result"] = {
+                "success": success,
+                "notification_days": notification_lib.notification_days
             }
+            logger.info(f"만료 알림 체크 완료: 성공: {success}")
+
+        return record
 
     async def _run_health_check(self) -> Dict[str, Any]:
         """스케줄러 헬스체크 실행"""
         logger.debug("스케줄러 헬스체크 시작")
-        start_time = datetime.utcnow()
 
-        try:
+        async with self._job_scope("health_check", "스케줄러 헬스체크") as record:
             # 스케줄러 상태 확인
-            running_jobs = len(self.scheduler.get_jobs())
-            next_run_times = []
+            # 잡 스토어 스냅샷은 한 번만 조회
+            jobs = self.scheduler.get_jobs()
+            running_jobs = len(jobs)
+            health = {
+                "running_jobs": running_jobs,
+                "scheduler_running": self.scheduler.running
+            }
 
-            for job in self.scheduler.get_jobs():
-                if job.next_run_time:
-                    next_run_times.append({
+            # 작업별 다음 실행 시각은 DEBUG 로그가 켜져 있을 때만 생성
+            # (전체 상세 정보는 get_job_status에서 필요할 때 조회)
+            if logger.isEnabledFor(logging.DEBUG):
+                health["next_run_times"] = [
+                    {
                         "job_id": job.id,
                         "job_name": job.name,
                         "next_run_time": job.next_run_time.isoformat()
-                    })
-
-            end_time = datetime.utcnow()
-            duration = (end_time - start_time).total_seconds()
+                    }
+                    for job in jobs
+                    if job.next_run_time
+                ]
 
+            record["result"] = health
             logger.debug(f"스케줄러 헬스체크 완료: {running_jobs}개 작업 실행 중")
 
-            return {
-                "job_type": "health_check",
-                "status": "completed",
-                "start_time": start_time.isoformat(),
-                "end_time": end_time.isoformat(),
-                "duration_seconds": duration,
-                "result": {
-                    "running_jobs": running_jobs,
-                    "next_run_times": next_run_times,
-                    "scheduler_running": self.scheduler.running
-                }
-            }
+        return record
 
-        except Exception as e:
-            end_time = datetime.utcnow()
-            duration = (end_time - start_time).total_seconds()
-
-            logger.error(f"스케줄러 헬스체크 실패: {e}")
+    def _job_listener(self, event: JobExecutionEvent) -> None:
+        """작업 이벤트 리스너
 
-            return {
-                "job_type": "health_check",
-                "status": "failed",
-                "start_time": start_time.isoformat(),
-                "end_time": end_time.isoformat(),
-                "duration_seconds": duration,
-                "error": str(e)
-            }
+        로그 레벨이 꺼져 있으면 메시지를 만들지 않도록 %-포맷 인자로 전달합니다.
+        """
+        # 이 서비스가 등록한 작업만 기록
+        if event.job_id not in self._handlers:
+            return
 
-    def _job_listener(self, event: JobExecutionEvent) -> None:
-        """작업 이벤트 리스너"""
         if event.exception:
-            logger.error(
-                f"스케줄된 작업 실행 실패: {event.job_id} - {event.exception}"
-            )
+            logger.error("스케줄된 작업 실행 실패: %s - %s", event.job_id, event.exception)
         else:
             logger.info(
-                f"스케줄된 작업 실행 완료: {event.job_id} - "
-                f"소요시간: {event.scheduled_run_time}"
+                "스케줄된 작업 실행 완료: %s - 예정 실행 시각: %s",
+                event.job_id,
+                event.scheduled_run_time
             )
 
     def get_job_status(self) -> Dict[str, Any]:
@@ -374,15 +421,16 @@ class SchedulerService:
                 "jobs": []
             }
 
-        jobs = []
-        for job in self.scheduler.get_jobs():
-            jobs.append({
+        jobs = [
+            {
                 "id": job.id,
                 "name": job.name,
                 "next_run_time": job.next_run_time.isoformat() if job.next_run_time else None,
                 "trigger": str(job.trigger),
                 "func": job.func.__name__
-            })
+            }
+            for job in self.scheduler.get_jobs()
+        ]
 
         return {
             "scheduler_running": self.scheduler.running,
@@ -390,29 +438,46 @@ class SchedulerService:
             "total_jobs": len(jobs)
         }
 
+    def register_handler(
+        self,
+        job_id: str,
+        handler: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> None:
+        """수동 실행(trigger_job_now) 대상 작업 함수 등록
+
+        Args:
+            job_id: 작업 ID (스케줄러에 등록된 작업 ID와 동일)
+            handler: 작업 결과 딕셔너리를 반환하는 코루틴 함수
+        """
+        self._handlers[job_id] = handler
+
     async def trigger_job_now(self, job_id: str) -> Dict[str, Any]:
-        """특정 작업을 즉시 실행"""
+        """특정 작업을 즉시 실행
+
+        작업 완료를 기다리지 않고 task_id를 바로 반환합니다.
+        결과는 get_trigger_result(task_id)로 조회합니다.
+        """
         try:
             job = self.scheduler.get_job(job_id)
             if not job:
                 raise ValueError(f"작업을 찾을 수 없습니다: {job_id}")
 
+            handler = self._handlers.get(job_id)
+            if handler is None:
+                raise ValueError(f"지원하지 않는 작업입니다: {job_id}")
+
             logger.info(f"작업 수동 실행: {job_id}")
 
-            # 작업 함수 직접 호출
-            if job_id == 'weekly_ssl_check':
-                result = await self._run_weekly_ssl_check()
-            elif job_id == 'expiry_notifications':
-                result = await self._run_expiry_notifications()
-            elif job_id == 'scheduler_health_check':
-                result = await self._run_health_check()
-            else:
-                raise ValueError(f"지원하지 않는 작업입니다: {job_id}")
+            # 백그라운드 태스크로 실행 (HTTP 요청이 작업 완료까지 대기하지 않음)
+            task_id = uuid.uuid4().hex
+            task = asyncio.create_task(handler())
+            self._pending[task_id] = task
+            task.add_done_callback(lambda done: self._store_trigger_result(task_id, done))
 
             return {
                 "triggered": True,
                 "job_id": job_id,
-                "result": result
+                "task_id": task_id
             }
 
         except Exception as e:
@@ -424,27 +489,72 @@ class SchedulerService:
             }
 
 
-# 전역 스케줄러 인스턴스
-_scheduler_instance: Optional[SchedulerService] = None
+    def _store_trigger_result(self, task_id: str, task: asyncio.Task) -> None:
+        """완료된 수동 실행 작업의 결과 보관"""
+        self._pending.pop(task_id, None)
+
+        if task.cancelled():
+            result = {"status": "cancelled"}
+        elif task.exception() is not None:
+            result = {"status": "failed", "error": str(task.exception())}
+        else:
+            result = task.result()
+
+        self._results[task_id] = (time.monotonic(), result)
+        self._prune_trigger_results()
+
+    def _prune_trigger_results(self) -> None:
+        """만료되었거나 보관 개수를 넘은 수동 실행 결과 정리 (오래된 순)"""
+        expire_before = time.monotonic() - TRIGGER_RESULT_TTL
+        while self._results:
+            task_id, (finished_at, _) = next(iter(self._results.items()))
+            if finished_at >= expire_before and len(self._results) <= TRIGGER_RESULT_MAX:
+                break
+            del self._results[task_id]
+
+    def get_trigger_result(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """수동 실행 작업 상태/결과 조회
+
+        Args:
+            task_id: trigger_job_now가 반환한 작업 ID
+
+        Returns:
+            작업 상태 및 결과 (알 수 없거나 만료된 task_id면 None)
+        """
+        if task_id in self._pending:
+            return {"task_id": task_id, "status": "running"}
+
+        self._prune_trigger_results()
+        entry = self._results.get(task_id)
+        if entry is None:
+            return None
+
+        return {"task_id": task_id, "status": "finished", "result": entry[1]}
+
+
+# 시작/종료 직렬화 (동시에 호출되어도 스케줄러가 한 번만 시작되도록)
+_startup_lock = asyncio.Lock()
 
 
+@functools.cache
 def get_scheduler() -> SchedulerService:
-    """스케줄러 인스턴스 반환"""
-    global _scheduler_instance
-    if _scheduler_instance is None:
-        _scheduler_instance = SchedulerService()
-    return _scheduler_instance
+    """스케줄러 인스턴스 반환 (프로세스당 하나)"""
+    return SchedulerService()
 
 
 async def start_scheduler() -> None:
     """스케줄러 시작 (애플리케이션 시작 시 호출)"""
-    scheduler = get_scheduler()
-    await scheduler.start()
+    async with _startup_lock:
+        scheduler = get_scheduler()
+        if not scheduler._is_running:
+            await scheduler.start()
 
 
 async def stop_scheduler() -> None:
     """스케줄러 종료 (애플리케이션 종료 시 호출)"""
-    global _scheduler_instance
-    if _scheduler_instance:
-        await _scheduler_instance.stop()
-        _scheduler_instance = None
\ No newline at end of file
+    async with _startup_lock:
+        if get_scheduler.cache_info().currsize:
+            scheduler = get_scheduler()
+            if scheduler._is_running:
+                await scheduler.stop()
+            get_scheduler.cache_clear()
@@ -6,22 +6,45 @@ SSL 서비스와 연동하여 만료 알림을 자동화합니다.
 """
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 import logging
 
+from sqlalchemy import and_, or_, select
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.website import Website
 from ..models.ssl_certificate import SSLCertificate, SSLStatus
-from ..lib.notification_service import NotificationService as NotificationLib
+from ..models.notification_log import NotificationLog
+from ..lib.notification_service import NotificationService as NotificationLib, ExpiringRow
 from .ssl_service import SSLService
-from ..database import get_async_session
+from ..database import current_session, get_async_session
 
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 오류 알림 동시 발송 수 (Teams 웹훅 rate limit 고려)
+ERROR_NOTIFICATION_CONCURRENCY = 8
+
+_SECONDS_PER_DAY = 86400
+
+# 수동 알림 대상(웹사이트 + 최신 인증서) 조회 캐시 - UI 재시도 등 짧은 간격의 반복 조회용
+WEBSITE_SSL_CACHE_MAX = 256
+WEBSITE_SSL_CACHE_TTL = 30  # 초
+
+# 캐시된 객체는 세션에서 분리된 상태로 재사용되므로 읽기 전용으로만 사용
+_website_ssl_cache: "OrderedDict[uuid.UUID, Tuple[float, Tuple[Website, SSLCertificate]]]" = OrderedDict()
+
+
+def invalidate_website_ssl_cache(website_id: uuid.UUID) -> None:
+    """웹사이트 SSL 조회 캐시 항목 제거 (웹사이트 수정/비활성화/삭제 및 SSL 재체크 후 호출)"""
+    _website_ssl_cache.pop(website_id, None)
+
 
 class NotificationServiceError(Exception):
     """알림 서비스 관련 오류"""
@@ -33,129 +56,121 @@ class NotificationService:
 
     def __init__(
         self,
-        session: AsyncSession,
+        session: Optional[AsyncSession] = None,
         webhook_url: Optional[str] = None,
         language: str = "ko",
         notification_days: List[int] = None
     ):
         """
         Args:
-            session: 데이터베이스 세션
+            session: 데이터베이스 세션 (None이면 with_session으로 설정된 현재 작업 세션)
             webhook_url: Teams 웹훅 URL
             language: 메시지 언어
             notification_days: 알림 발송 일수 목록
         """
+        if session is None:
+            session = current_session()
         self.session = session
         self.notification_lib = NotificationLib(session, webhook_url, language)
         self.ssl_service = SSLService(session)
         self.notification_days = notification_days or [30, 7, 1]
 
+        # get_notification_settings 결과 캐시 (설정 변경 시 무효화)
+        self._settings_snapshot: Optional[Dict[str, Any]] = None
+
     async def run_scheduled_notifications(self) -> Dict[str, Any]:
         """스케줄된 알림 실행 (주간 체크와 함께)
 
         Returns:
             알림 실행 결과
         """
+        # 실행 기준 시각은 한 번만 읽어 하위 체크에 전달 (한 실행 안에서 기준 시각 일관성 유지)
+        now = datetime.utcnow()
+        started_at = now.isoformat()  # 성공/실패 결과에 같은 실행 시각 문자열 사용
+
         try:
             logger.info("스케줄된 알림 실행 시작")
 
             # 1. 만료 임박 인증서 감지
             expiring_certificates = await self.ssl_service.detect_expiring_certificates(
-                self.notification_days
+                self.notification_days, now
+            )
+
+            # 2. 각 일수별로 알림 발송 (일수별 Teams 요청을 동시에 전송)
+            buckets = [(days, certs) for days, certs in expiring_certificates.items() if certs]
+            send_results = await asyncio.gather(
+                *(self._send_expiry_notifications_for_day(certs, days) for days, certs in buckets),
+                return_exceptions=True
             )
 
-            # 2. 각 일수별로 알림 발송
             notification_results = []
             total_notifications_sent = 0
 
-            for days, certs in expiring_certificates.items():
-                if certs:
-                    try:
-                        # 일수별 알림 발송
-                        success = await self._send_expiry_notifications_for_day(certs, days)
-                        if success:
-                            total_notifications_sent += 1
+            for (days, certs), success in zip(buckets, send_results):
+                if isinstance(success, Exception):
+                    logger.error("%s일 만료 알림 발송 실패: %s", days, success)
+                    notification_results.append({
+                        "days": days,
+                        "certificate_count": len(certs),
+                        "notification_sent": False,
+                        "error": str(success)
+                    })
+                    continue
 
-                        notification_results.append({
-                            "days": days,
-                            "certificate_count": len(certs),
-                            "notification_sent": success
-                        })
+                if success:
+                    total_notifications_sent += 1
 
-                        logger.info(f"{days}일 만료 알림 처리: {len(certs)}개 인증서")
+                notification_results.append({
+                    "days": days,
+                    "certificate_count": len(certs),
+                    "notification_sent": success
+                })
 
-                    except Exception as e:
-                        logger.error(f"{days}일 만료 알림 발송 실패: {str(e)}")
-                        notification_results.append({
-                            "days": days,
-                            "certificate_count": len(certs),
-                            "notification_sent": False,
-                            "error": str(e)
-                        })
+                logger.info("%s일 만료 알림 처리: %d개 인증서", days, len(certs))
 
             # 3. SSL 오류 알림 체크 및 발송
-            error_notifications = await self._check_and_send_ssl_error_notifications()
+            error_notifications = await self._check_and_send_ssl_error_notifications(now)
 
             result = {
-                "execution_time": datetime.utcnow().isoformat(),
+                "execution_time": started_at,
                 "expiry_notifications": notification_results,
                 "error_notifications": error_notifications,
                 "total_notifications_sent": total_notifications_sent,
                 "success": True
             }
 
-            logger.info(f"스케줄된 알림 실행 완료: {total_notifications_sent}개 알림 발송")
+            logger.info("스케줄된 알림 실행 완료: %d개 알림 발송", total_notifications_sent)
             return result
 
         except Exception as e:
-            logger.error(f"스케줄된 알림 실행 실패: {str(e)}")
+            logger.error("스케줄된 알림 실행 실패: %s", e)
             return {
-                "execution_time": datetime.utcnow().isoformat(),
+                "execution_time": started_at,
                 "success": False,
                 "error": str(e)
             }
 
     async def _send_expiry_notifications_for_day(
         self,
-        certificates: List[Dict[str, Any]],
+        certificates: List[Tuple[Website, SSLCertificate]],
         days: int
     ) -> bool:
         """특정 일수의 만료 임박 인증서에 대한 알림 발송
 
         Args:
-            certificates: 인증서 정보 목록
+            certificates: (웹사이트, 인증서) 목록 (detect_expiring_certificates 결과)
             days: 만료까지 남은 일수
 
         Returns:
             발송 성공 여부
         """
         try:
-            # 웹사이트와 인증서 정보 추출
-            website_cert_pairs = []
-            for cert_info in certificates:
-                website_data = cert_info["website"]
-                ssl_cert_data = cert_info["ssl_certificate"]
-
-                # Website 객체 재구성
-                website = Website(
-                    url=website_data["url"],
-                    name=website_data["name"]
-                )
-                website.id = website_data["id"]
-
-                # SSLCertificate 객체 재구성
-                ssl_cert = SSLCertificate(
-                    website_id=website.id,
-                    issuer=ssl_cert_data["issuer"],
-                    subject=ssl_cert_data["subject"],
-                    serial_number=ssl_cert_data["serial_number"],
-                    issued_date=datetime.fromisoformat(ssl_cert_data["issued_date"]),
-                    expiry_date=datetime.fromisoformat(ssl_cert_data["expiry_date"]),
-                    fingerprint=ssl_cert_data["fingerprint"],
-                    status=SSLStatus(ssl_cert_data["status"])
-                )
-
-                website_cert_pairs.append((website, ssl_cert))
+            # 메시지에 필요한 컬럼만 추출 (클래스 속성 조회를 루프 밖으로)
+            from_models = ExpiringRow.from_models
+            website_cert_pairs = [
+                from_models(website, ssl_cert)
+                for website, ssl_cert in certificates
+            ]
 
             # 알림 발송
             return await self.notification_lib._send_expiry_notification(
@@ -163,24 +178,34 @@ class NotificationService:
             )
 
         except Exception as e:
-            logger.error(f"만료 알림 발송 실패 ({days}일): {str(e)}")
+            logger.error("만료 알림 발송 실패 (%s일): %s", days, e)
             return False
 
-    async def _check_and_send_ssl_error_notifications(self) -> Dict[str, Any]:
+    async def _check_and_send_ssl_error_notifications(
+        self,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """SSL 오류 알림 체크 및 발송
 
+        Args:
+            now: 기준 시각 (UTC, None이면 현재 시각)
+
         Returns:
             오류 알림 결과
         """
         try:
             # 최근 SSL 체크에서 오류가 발생한 웹사이트 조회
-            from sqlalchemy import select, and_
-
             # 최근 1시간 내에 invalid 상태로 변경된 인증서 조회
-            one_hour_ago = datetime.utcnow() - timedelta(hours=1)
-
-            result = await self.session.execute(
-                select(Website, SSLCertificate)
+            if now is None:
+                now = datetime.utcnow()
+            one_hour_ago = now - timedelta(hours=1)
+
+            # 결과 전체를 적재하지 않고 스트리밍하며 웹사이트별 최신 오류 건만 보관
+            # 읽기 전용이므로 ORM 객체 대신 메시지에 필요한 컬럼만 Row로 조회 (identity map 적재 없음)
+            error_cases_found = 0
+            latest: Dict[uuid.UUID, Row] = {}
+            async for row in await self.session.stream(
+                select(Website.id, Website.name, Website.url, SSLCertificate.status)
                 .join(SSLCertificate, Website.id == SSLCertificate.website_id)
                 .where(
                     and_(
@@ -190,39 +215,53 @@ class NotificationService:
                     )
                 )
                 .order_by(SSLCertificate.last_checked.desc())
+            ):
+                error_cases_found += 1
+                latest.setdefault(row.id, row)
+
+            # 웹사이트별 당일 발송 기록을 한 번의 INSERT ... ON CONFLICT DO NOTHING으로 선점
+            # (이미 오늘 알림을 보낸 웹사이트는 충돌로 제외 - 조회 후 판단 사이의 경쟁 없음)
+            sent_on = now.date()
+            claimed = await NotificationLog.claim_daily(
+                self.session, "error", latest.keys(), sent_on
             )
+            if claimed:
+                # 발송 전에 선점 기록을 바로 커밋 - 여러 워커가 동시에 실행돼도 다른 워커는
+                # 커밋된 기록과 충돌해 즉시 건너뜀 (웹훅 발송 동안 유니크 인덱스 대기/행 잠금 없음)
+                await self.session.commit()
+            targets = [latest[website_id] for website_id in latest if website_id in claimed]
 
-            error_cases = result.all()
-            notifications_sent = 0
+            # 웹훅 rate limit을 넘지 않도록 동시 발송 수 제한
+            semaphore = asyncio.Semaphore(ERROR_NOTIFICATION_CONCURRENCY)
 
-            for website, ssl_cert in error_cases:
-                try:
-                    # 이미 알림을 보냈는지 확인 (중복 방지)
-                    if not await self._should_send_error_notification(website, ssl_cert):
-                        continue
+            async def send_one(row: Row) -> bool:
+                async with semaphore:
+                    try:
+                        # 오류 알림 발송 (Row의 name/url 속성을 웹사이트 정보로 사용)
+                        error_message = f"SSL 인증서 검증 실패 (상태: {row.status})"
+                        return await self.notification_lib.send_ssl_error_notification(
+                            row, error_message
+                        )
 
-                    # 오류 알림 발송
-                    error_message = f"SSL 인증서 검증 실패 (상태: {ssl_cert.status.value})"
-                    success = await self.notification_lib.send_ssl_error_notification(
-                        website, error_message
-                    )
+                    except Exception as e:
+                        logger.error("SSL 오류 알림 발송 실패: %s - %s", row.url, e)
+                        return False
 
-                    if success:
-                        notifications_sent += 1
-                        # 알림 발송 기록 (중복 방지용)
-                        await self._record_error_notification_sent(website, ssl_cert)
+            results = await asyncio.gather(*(send_one(row) for row in targets))
 
-                except Exception as e:
-                    logger.error(f"SSL 오류 알림 발송 실패: {website.url} - {str(e)}")
+            # 발송 실패 건은 선점 기록을 한 번에 해제 (다음 실행에서 재시도)
+            failed_ids = [row.id for row, success in zip(targets, results) if not success]
+            await NotificationLog.release_daily(self.session, "error", failed_ids, sent_on)
+            notifications_sent = len(targets) - len(failed_ids)
 
             return {
-                "error_cases_found": len(error_cases),
+                "error_cases_found": error_cases_found,
                 "notifications_sent": notifications_sent,
                 "success": True
             }
 
         except Exception as e:
-            logger.error(f"SSL 오류 알림 체크 실패: {str(e)}")
+            logger.error("SSL 오류 알림 체크 실패: %s", e)
             return {
                 "error_cases_found": 0,
                 "notifications_sent": 0,
@@ -230,66 +269,6 @@ class NotificationService:
                 "error": str(e)
             }
 
-    async def _should_send_error_notification(
-        self,
-        website: Website,
-        ssl_cert: SSLCertificate
-    ) -> bool:
-        """오류 알림을 발송해야 하는지 확인
-
-        Args:
-            website: 웹사이트 객체
-            ssl_cert: SSL 인증서 객체
-
-        Returns:
-            알림 발송 여부
-        """
-        try:
-            # 같은 웹사이트에 대해 최근 24시간 내에 오류 알림을 보냈는지 확인
-            # 실제 구현에서는 별도의 notification_log 테이블을 사용할 수 있음
-            # 여기서는 간단히 하루에 한 번만 보내도록 제한
-
-            from sqlalchemy import select, and_
-
-            twenty_four_hours_ago = datetime.utcnow() - timedelta(hours=24)
-
-            # 최근 24시간 내 같은 웹사이트의 invalid 인증서 수 확인
-            result = await self.session.execute(
-                select(SSLCertificate)
-                .where(
-                    and_(
-                        SSLCertificate.website_id == website.id,
-                        SSLCertificate.status == SSLStatus.INVALID,
-                        SSLCertificate.last_checked >= twenty_four_hours_ago
-                    )
-                )
-                .limit(1)
-            )
-
-            first_invalid = result.scalar_one_or_none()
-
-            # 현재 인증서가 첫 번째 invalid 인증서인 경우에만 알림 발송
-            return first_invalid and first_invalid.id == ssl_cert.id
-
-        except Exception as e:
-            logger.error(f"오류 알림 발송 여부 확인 실패: {str(e)}")
-            return False
-
-    async def _record_error_notification_sent(
-        self,
-        website: Website,
-        ssl_cert: SSLCertificate
-    ):
-        """오류 알림 발송 기록
-
-        Args:
-            website: 웹사이트 객체
-            ssl_cert: SSL 인증서 객체
-        """
-        # 실제 구현에서는 notification_log 테이블에 기록
-        # 현재는 로그만 남김
-        logger.info(f"오류 알림 발송 기록: {website.url} - {ssl_cert.id}")
-
     async def send_manual_notification(
         self,
         notification_type: str,
@@ -310,9 +289,7 @@ class NotificationService:
 
             elif notification_type == "expiry":
                 # 수동 만료 알림
-                website_id = target_data.get("website_id")
-                if not website_id:
-                    raise NotificationServiceError("website_id가 필요합니다")
+                website_id = self._parse_website_id(target_data)
 
                 website_info = await self._get_website_with_ssl(website_id)
                 if not website_info:
@@ -322,17 +299,14 @@ class NotificationService:
                 days_until_expiry = ssl_cert.days_until_expiry()
 
                 return await self.notification_lib._send_expiry_notification(
-                    [(website, ssl_cert)], days_until_expiry
+                    [ExpiringRow.from_models(website, ssl_cert)], days_until_expiry
                 )
 
             elif notification_type == "error":
                 # 수동 오류 알림
-                website_id = target_data.get("website_id")
+                website_id = self._parse_website_id(target_data)
                 error_message = target_data.get("error_message", "수동 오류 알림")
 
-                if not website_id:
-                    raise NotificationServiceError("website_id가 필요합니다")
-
                 website_info = await self._get_website_with_ssl(website_id)
                 if not website_info:
                     raise NotificationServiceError("웹사이트를 찾을 수 없습니다")
@@ -346,24 +320,49 @@ class NotificationService:
                 raise NotificationServiceError(f"지원하지 않는 알림 타입: {notification_type}")
 
         except Exception as e:
-            logger.error(f"수동 알림 발송 실패: {notification_type} - {str(e)}")
+            logger.error("수동 알림 발송 실패: %s - %s", notification_type, e)
             raise NotificationServiceError(f"수동 알림 발송 실패: {str(e)}")
 
-    async def _get_website_with_ssl(self, website_id: str) -> Optional[tuple]:
-        """웹사이트와 최신 SSL 인증서 조회
+    @staticmethod
+    def _parse_website_id(target_data: Dict[str, Any]) -> uuid.UUID:
+        """수동 알림 대상 website_id 검증 (입력 경계에서 한 번만 UUID로 변환)
 
         Args:
-            website_id: 웹사이트 ID
+            target_data: 알림 대상 데이터
 
         Returns:
-            (Website, SSLCertificate) 튜플 또는 None
+            웹사이트 UUID
+
+        Raises:
+            NotificationServiceError: website_id가 없거나 UUID 형식이 아닌 경우
         """
+        website_id = target_data.get("website_id")
+        if not website_id:
+            raise NotificationServiceError("website_id가 필요합니다")
+        if isinstance(website_id, uuid.UUID):
+            return website_id
+
         try:
-            from sqlalchemy import select
-            import uuid
+            return uuid.UUID(str(website_id))
+        except ValueError:
+            raise NotificationServiceError(f"유효하지 않은 website_id: {website_id}")
 
-            website_uuid = uuid.UUID(website_id)
+    async def _get_website_with_ssl(self, website_uuid: uuid.UUID) -> Optional[tuple]:
+        """웹사이트와 최신 SSL 인증서 조회 (TTL LRU 캐시 사용)
 
+        Args:
+            website_uuid: 웹사이트 ID
+
+        Returns:
+            (Website, SSLCertificate) 튜플 또는 None
+        """
+        now = time.monotonic()
+        cached = _website_ssl_cache.get(website_uuid)
+        if cached is not None and cached[0] > now:
+            _website_ssl_cache.move_to_end(website_uuid)
+            return cached[1]
+
+        try:
             result = await self.session.execute(
                 select(Website, SSLCertificate)
                 .join(SSLCertificate, Website.id == SSLCertificate.website_id)
@@ -372,79 +371,143 @@ class NotificationService:
                 .limit(1)
             )
 
-            return result.first()
+            row = result.first()
+            if row is None:
+                # 없는 결과는 캐시하지 않음 (곧 등록/체크될 수 있음)
+                _website_ssl_cache.pop(website_uuid, None)
+                return None
+
+            website_ssl = tuple(row)
+            _website_ssl_cache[website_uuid] = (now + WEBSITE_SSL_CACHE_TTL, website_ssl)
+            _website_ssl_cache.move_to_end(website_uuid)
+            while len(_website_ssl_cache) > WEBSITE_SSL_CACHE_MAX:
+                _website_ssl_cache.popitem(last=False)
+
+            return website_ssl
 
         except Exception as e:
-            logger.error(f"웹사이트 SSL 정보 조회 실패: {website_id} - {str(e)}")
+            logger.error("웹사이트 SSL 정보 조회 실패: %s - %s", website_uuid, e)
             return None
 
+    async def iter_notification_history(
+        self,
+        days: int = 7,
+        notification_type: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """알림 히스토리를 한 건씩 생성 (전체 목록을 메모리에 만들지 않음)
+
+        StreamingResponse 등으로 결과를 바로 흘려보낼 때 사용합니다.
+
+        Args:
+            days: 조회할 일수
+            notification_type: 알림 타입 필터 ('error', 'expiry')
+            limit: 최대 결과 수 (None이면 전체)
+            offset: 건너뛸 결과 수
+
+        Yields:
+            알림 히스토리 항목
+        """
+        # 실제 구현에서는 notification_log 테이블에서 조회
+        # 현재는 최근 SSL 체크 기록을 기반으로 추정
+        now = datetime.utcnow()
+        since_date = now - timedelta(days=days)
+
+        # 만료 임박(30일 이내) 또는 오류 상태인 경우 알림 히스토리로 간주 - DB에서 필터링
+        is_error = SSLCertificate.status == SSLStatus.INVALID
+        is_expiry = and_(
+            SSLCertificate.status != SSLStatus.INVALID,
+            or_(
+                SSLCertificate.status == SSLStatus.EXPIRED,
+                SSLCertificate.expiry_date <= now + timedelta(days=30)
+            )
+        )
+        if notification_type == "error":
+            notify_condition = is_error
+        elif notification_type == "expiry":
+            notify_condition = is_expiry
+        elif notification_type is None:
+            notify_condition = or_(is_error, is_expiry)
+        else:
+            return
+
+        # 남은 시간(초)과 알림 긴급도는 행마다 Python에서 계산하지 않고 DB에서 함께 조회
+        # (같은 기준 시각, expiry_epoch 정수 뺄셈 + get_notification_urgency와 같은 CASE 식)
+        now_utc = now.replace(tzinfo=timezone.utc)
+        seconds_left = (SSLCertificate.expiry_epoch - int(now_utc.timestamp())).label("seconds_left")
+        urgency = SSLCertificate.urgency_expression(now_utc).label("urgency")
+
+        # 최근 SSL 체크 기록 조회
+        query = (
+            select(Website, SSLCertificate, seconds_left, urgency)
+            .join(SSLCertificate, Website.id == SSLCertificate.website_id)
+            .where(
+                and_(
+                    Website.is_active == True,
+                    SSLCertificate.last_checked >= since_date,
+                    notify_condition
+                )
+            )
+            .order_by(SSLCertificate.last_checked.desc())
+            .offset(offset)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+
+        # 결과 전체를 먼저 적재하지 않고 DB 커서에서 한 행씩 변환해 전달
+        async for website, ssl_cert, cert_seconds_left, cert_urgency in await self.session.stream(query):
+            if ssl_cert.status == SSLStatus.INVALID:
+                notif_type = "error"
+                message = f"SSL 인증서 오류 (상태: {ssl_cert.status})"
+            else:
+                notif_type = "expiry"
+                # days_until_expiry()와 같은 내림 계산 (expiry_epoch가 없는 기존 행은 Python 계산)
+                if cert_seconds_left is not None:
+                    days_left = cert_seconds_left // _SECONDS_PER_DAY
+                else:
+                    days_left = ssl_cert.days_until_expiry(now_utc)
+                message = f"SSL 인증서 만료 알림 ({days_left}일 남음)"
+
+            yield {
+                "website": website.to_dict(),
+                "ssl_certificate": ssl_cert.to_dict(),
+                "notification_type": notif_type,
+                "message": message,
+                "timestamp": ssl_cert.last_checked.isoformat(),
+                "urgency": cert_urgency
+            }
+
     async def get_notification_history(
         self,
         days: int = 7,
-        notification_type: Optional[str] = None
+        notification_type: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> List[Dict[str, Any]]:
-        """알림 히스토리 조회
+        """알림 히스토리 조회 (iter_notification_history 결과를 목록으로 수집)
 
         Args:
             days: 조회할 일수
-            notification_type: 알림 타입 필터
+            notification_type: 알림 타입 필터 ('error', 'expiry')
+            limit: 최대 결과 수 (None이면 전체)
+            offset: 건너뛸 결과 수
 
         Returns:
-            알림 히스토리 목록
+            알림 히스토리 목록 (조회 실패 시 빈 목록)
         """
         try:
-            # 실제 구현에서는 notification_log 테이블에서 조회
-            # 현재는 최근 SSL 체크 기록을 기반으로 추정
-
-            from sqlalchemy import select, and_
-
-            since_date = datetime.utcnow() - timedelta(days=days)
-
-            # 최근 SSL 체크 기록 조회
-            result = await self.session.execute(
-                select(Website, SSLCertificate)
-                .join(SSLCertificate, Website.id == SSLCertificate.website_id)
-                .where(
-                    and_(
-                        Website.is_active == True,
-                        SSLCertificate.last_checked >= since_date
-                    )
-                )
-                .order_by(SSLCertificate.last_checked.desc())
-            )
-
-            history = []
-            for website, ssl_cert in result.all():
-                # 만료 임박 또는 오류 상태인 경우 알림 히스토리로 간주
-                should_notify = (
-                    ssl_cert.is_expiring_soon(30) or
-                    ssl_cert.status in [SSLStatus.INVALID, SSLStatus.EXPIRED]
+            history = [
+                item async for item in self.iter_notification_history(
+                    days, notification_type, limit, offset
                 )
+            ]
 
-                if should_notify:
-                    if ssl_cert.status == SSLStatus.INVALID:
-                        notif_type = "error"
-                        message = f"SSL 인증서 오류 (상태: {ssl_cert.status.value})"
-                    else:
-                        notif_type = "expiry"
-                        days_left = ssl_cert.days_until_expiry()
-                        message = f"SSL 인증서 만료 알림 ({days_left}일 남음)"
-
-                    if notification_type is None or notification_type == notif_type:
-                        history.append({
-                            "website": website.to_dict(),
-                            "ssl_certificate": ssl_cert.to_dict(),
-                            "notification_type": notif_type,
-                            "message": message,
-                            "timestamp": ssl_cert.last_checked.isoformat(),
-                            "urgency": ssl_cert.get_notification_urgency()
-                        })
-
-            logger.info(f"알림 히스토리 조회 완료: {len(history)}개 ({days}일간)")
+            logger.info("알림 히스토리 조회 완료: %d개 (%s일간)", len(history), days)
             return history
 
         except Exception as e:
-            logger.error(f"알림 히스토리 조회 실패: {str(e)}")
+            logger.error("알림 히스토리 조회 실패: %s", e)
             return []
 
     async def get_notification_settings(self) -> Dict[str, Any]:
@@ -453,14 +516,19 @@ class NotificationService:
         Returns:
             현재 알림 설정
         """
-        return {
-            "notification_enabled": self.notification_lib.notification_enabled,
-            "webhook_url_configured": bool(self.notification_lib.webhook_url),
-            "language": self.notification_lib.language,
-            "notification_days": self.notification_days,
-            "retry_count": self.notification_lib.retry_count,
-            "timeout": self.notification_lib.timeout
-        }
+        # 설정 스냅샷은 update_notification_settings에서 무효화될 때까지 재사용
+        if self._settings_snapshot is None:
+            self._settings_snapshot = {
+                "notification_enabled": self.notification_lib.notification_enabled,
+                "webhook_url_configured": bool(self.notification_lib.webhook_url),
+                "language": self.notification_lib.language,
+                "notification_days": self.notification_days,
+                "retry_count": self.notification_lib.retry_count,
+                "timeout": self.notification_lib.timeout
+            }
+
+        # 호출자가 수정해도 스냅샷이 바뀌지 않도록 얕은 복사본 반환
+        return dict(self._settings_snapshot)
 
     async def update_notification_settings(self, settings: Dict[str, Any]) -> bool:
         """알림 설정 업데이트
@@ -471,6 +539,9 @@ class NotificationService:
         Returns:
             업데이트 성공 여부
         """
+        # 일부만 반영되고 실패하는 경우에도 이전 스냅샷을 쓰지 않도록 먼저 무효화
+        self._settings_snapshot = None
+
         try:
             # webhook_url 업데이트
             if "webhook_url" in settings:
@@ -496,7 +567,7 @@ class NotificationService:
             return True
 
         except Exception as e:
-            logger.error(f"알림 설정 업데이트 실패: {str(e)}")
+            logger.error("알림 설정 업데이트 실패: %s", e)
             return False
 
 
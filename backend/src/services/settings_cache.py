@@ -0,0 +1,80 @@
+"""
+시스템 설정 캐시
+
+싱글톤 Settings 행(id=1)을 프로세스 단위로 캐시합니다.
+설정은 거의 바뀌지 않으므로 조회마다 DB를 다시 읽지 않고, 설정 변경 API에서 캐시를 무효화합니다.
+무효화는 해당 프로세스에만 적용되므로, 다른 워커에서 바꾼 설정은 TTL이 지나면 반영됩니다.
+"""
+
+import asyncio
+import time
+from typing import Optional
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.settings import Settings
+from ..lib.settings_manager import SettingsManager
+
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 캐시 유지 시간 (초)
+SETTINGS_CACHE_TTL = 30
+
+_settings_cache: Optional[Settings] = None
+_settings_cached_at = 0.0
+# 무효화할 때마다 증가 - 로드 도중 무효화되면 읽어 온 (이전) 설정을 캐시하지 않음
+_settings_generation = 0
+_settings_lock = asyncio.Lock()
+
+
+def _is_cache_fresh() -> bool:
+    """캐시된 설정이 있고 TTL이 지나지 않았는지 확인"""
+    return (
+        _settings_cache is not None
+        and time.monotonic() - _settings_cached_at < SETTINGS_CACHE_TTL
+    )
+
+
+async def get_cached_settings(session: AsyncSession) -> Settings:
+    """
+    캐시된 시스템 설정 반환 (없으면 DB에서 로드)
+
+    Args:
+        session: 데이터베이스 세션
+
+    Returns:
+        시스템 설정 (세션에서 분리된 인스턴스 - 읽기 전용으로 사용)
+    """
+    global _settings_cache, _settings_cached_at
+
+    if _is_cache_fresh():
+        return _settings_cache
+
+    async with _settings_lock:
+        if _is_cache_fresh():
+            return _settings_cache
+
+        generation = _settings_generation
+        settings = await session.get(Settings, 1)
+        if settings is None:
+            # 설정 행이 아직 없으면 기본값 생성은 SettingsManager에 맡기고 캐시하지 않음
+            return await SettingsManager(session).get_settings()
+
+        # 다른 세션/요청에서도 재사용할 수 있도록 세션에서 분리
+        session.expunge(settings)
+        if generation == _settings_generation:
+            _settings_cache = settings
+            _settings_cached_at = time.monotonic()
+            logger.debug("시스템 설정 캐시 로드")
+
+    return settings
+
+
+def invalidate_settings_cache() -> None:
+    """시스템 설정 캐시 무효화 (설정 변경 후 호출)"""
+    global _settings_cache, _settings_generation
+    _settings_cache = None
+    _settings_generation += 1
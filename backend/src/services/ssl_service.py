@@ -5,20 +5,22 @@ SSL 인증서 일괄 체크, 만료 감지, 모니터링을 담당하는 서비
 """
 
 import asyncio
+import os
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Tuple
 import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_, func, update
+from sqlalchemy.orm import aliased
 from fastapi import Depends
 
 from ..models.website import Website
 from ..models.ssl_certificate import SSLCertificate, SSLStatus
 from ..lib.ssl_checker import SSLChecker, SSLCheckError
 from ..lib.website_manager import WebsiteManager
-from ..database import get_async_session
+from ..database import current_session, get_async_session
 
 
 # 로깅 설정
@@ -35,29 +37,38 @@ class SSLService:
 
     def __init__(
         self,
-        session: AsyncSession,
+        session: Optional[AsyncSession] = None,
         ssl_timeout: int = 10,
-        max_concurrent_checks: int = 5,
+        max_concurrent_checks: Optional[int] = None,
         retry_failed_checks: bool = True
     ):
         """
         Args:
-            session: 데이터베이스 세션
+            session: 데이터베이스 세션 (None이면 with_session으로 설정된 현재 작업 세션)
             ssl_timeout: SSL 체크 타임아웃 (초)
-            max_concurrent_checks: 최대 동시 체크 수
+            max_concurrent_checks: 최대 동시 체크 수 (None이면 MAX_CONCURRENT_CHECKS 환경변수, 기본 5)
             retry_failed_checks: 실패한 체크 재시도 여부
         """
+        if session is None:
+            session = current_session()
         self.session = session
         self.ssl_checker = SSLChecker(timeout=ssl_timeout)
         self.website_manager = WebsiteManager(session)
-        self.max_concurrent_checks = max_concurrent_checks
+        self.max_concurrent_checks = max_concurrent_checks or int(os.getenv("MAX_CONCURRENT_CHECKS", "5"))
         self.retry_failed_checks = retry_failed_checks
 
-    async def check_all_websites_ssl(self, active_only: bool = True) -> Dict[str, Any]:
+    async def check_all_websites_ssl(
+        self,
+        active_only: bool = True,
+        max_concurrent: Optional[int] = None,
+        websites: Optional[List[Website]] = None
+    ) -> Dict[str, Any]:
         """모든 웹사이트의 SSL 인증서 일괄 체크
 
         Args:
             active_only: 활성 웹사이트만 체크
+            max_concurrent: 최대 동시 체크 수 (None이면 max_concurrent_checks)
+            websites: 체크할 웹사이트 목록 (None이면 전체 조회)
 
         Returns:
             일괄 체크 결과
@@ -66,7 +77,8 @@ class SSLService:
 
         try:
             # 대상 웹사이트 조회
-            websites = await self.website_manager.get_all_websites(active_only=active_only)
+            if websites is None:
+                websites = await self.website_manager.get_all_websites(active_only=active_only)
 
             if not websites:
                 return {
@@ -80,7 +92,7 @@ class SSLService:
             logger.info(f"SSL 일괄 체크 시작: {len(websites)}개 웹사이트")
 
             # 동시 SSL 체크 수행
-            results = await self._perform_concurrent_ssl_checks(websites)
+            results = await self._perform_concurrent_ssl_checks(websites, max_concurrent)
 
             # 결과 처리 및 통계 생성
             end_time = datetime.utcnow()
@@ -111,43 +123,120 @@ class SSLService:
             logger.error(f"SSL 일괄 체크 실패: {str(e)}")
             raise SSLServiceError(f"SSL 일괄 체크 실패: {str(e)}")
 
-    async def _perform_concurrent_ssl_checks(self, websites: List[Website]) -> List[Dict[str, Any]]:
+    async def bulk_ssl_check(
+        self,
+        active_only: bool = True,
+        max_concurrent: Optional[int] = None,
+        due_only: bool = False
+    ) -> Dict[str, Any]:
+        """스케줄러/백그라운드 작업용 일괄 SSL 체크
+
+        Args:
+            active_only: 활성 웹사이트만 체크
+            max_concurrent: 최대 동시 체크 수 (None이면 max_concurrent_checks)
+            due_only: 재확인이 필요한 활성 웹사이트만 체크 (get_websites_due_for_check)
+
+        Returns:
+            일괄 체크 결과 (check_all_websites_ssl 결과 + total_websites)
+        """
+        websites = await self.get_websites_due_for_check() if due_only else None
+        result = await self.check_all_websites_ssl(
+            active_only=active_only,
+            max_concurrent=max_concurrent,
+            websites=websites
+        )
+        result["total_websites"] = result["total_processed"]
+        return result
+
+    async def get_websites_due_for_check(
+        self,
+        recheck_days: int = 28,
+        expiry_margin_days: int = 45
+    ) -> List[Website]:
+        """재확인이 필요한 활성 웹사이트 조회
+
+        가장 최근에 확인된 인증서가 recheck_days 이내에 유효로 확인되었고 만료까지
+        expiry_margin_days 넘게 남은 웹사이트는 제외합니다. 만료가 가까운 인증서, 오류 상태
+        (이전에 유효했던 인증서가 남아 있어도 그 이후 체크가 실패한 경우 포함),
+        아직 체크하지 않은 웹사이트는 매주 다시 체크하고, 안정적인 인증서도
+        recheck_days마다 한 번은 다시 받아 교체/폐기를 감지합니다.
+
+        Args:
+            recheck_days: 안정적인 인증서의 재확인 주기 (일)
+            expiry_margin_days: 매주 체크할 만료 임박 기준 (일)
+
+        Returns:
+            체크 대상 웹사이트 목록
+        """
+        now = datetime.now(timezone.utc)
+        # 유효 인증서보다 나중에 확인된 인증서(오류/만료 등)가 있으면 최신 상태가 아님
+        newer_certificate = aliased(SSLCertificate)
+        newer_check = select(newer_certificate.id).where(
+            newer_certificate.website_id == SSLCertificate.website_id,
+            newer_certificate.last_checked > SSLCertificate.last_checked,
+        )
+        fresh_certificate = select(SSLCertificate.id).where(
+            SSLCertificate.website_id == Website.id,
+            SSLCertificate.status == SSLStatus.VALID,
+            SSLCertificate.last_checked >= now - timedelta(days=recheck_days),
+            SSLCertificate.expiry_date >= now + timedelta(days=expiry_margin_days),
+            ~newer_check.exists(),
+        )
+        result = await self.session.execute(
+            select(Website).where(
+                Website.is_active.is_(True),
+                ~fresh_certificate.exists(),
+            )
+        )
+        return list(result.scalars().all())
+
+    async def _perform_concurrent_ssl_checks(
+        self,
+        websites: List[Website],
+        max_concurrent: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """동시 SSL 체크 수행
 
+        배치 단위로 기다리지 않고 항상 max_concurrent개의 체크가 진행되도록 하며,
+        결과는 완료된 순서대로 수집합니다 (느린 TLS 핸드셰이크가 다른 슬롯을 막지 않음).
+        체크 중에는 세션을 사용하지 않고, 모든 결과를 마지막에 한 트랜잭션으로 저장합니다.
+
         Args:
             websites: 체크할 웹사이트 목록
+            max_concurrent: 최대 동시 체크 수 (None이면 max_concurrent_checks)
 
         Returns:
-            체크 결과 목록
+            체크 결과 목록 (완료 순서)
         """
-        semaphore = asyncio.Semaphore(self.max_concurrent_checks)
+        semaphore = asyncio.Semaphore(max_concurrent or self.max_concurrent_checks)
 
-        async def check_single_website(website: Website) -> Dict[str, Any]:
+        async def check_single_website(
+            website: Website
+        ) -> Tuple[Website, Dict[str, Any], Optional[Dict[str, Any]]]:
             async with semaphore:
-                return await self._check_website_ssl_with_retry(website)
-
-        # 모든 웹사이트에 대해 동시 체크 수행
-        tasks = [check_single_website(website) for website in websites]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # 예외 처리된 결과 반환
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append({
-                    "website_id": str(websites[i].id),
-                    "url": websites[i].url,
-                    "success": False,
-                    "error": str(result),
-                    "checked_at": datetime.utcnow().isoformat()
-                })
-            else:
-                processed_results.append(result)
-
-        return processed_results
+                try:
+                    result, ssl_result = await self._run_ssl_check_with_retry(website)
+                    return website, result, ssl_result
+                except Exception as e:
+                    return website, {
+                        "website_id": str(website.id),
+                        "url": website.url,
+                        "success": False,
+                        "error": str(e),
+                        "checked_at": datetime.utcnow().isoformat()
+                    }, None
+
+        tasks = [asyncio.create_task(check_single_website(website)) for website in websites]
+        outcomes = []
+        for next_done in asyncio.as_completed(tasks):
+            outcomes.append(await next_done)
+
+        await self._save_check_results(outcomes)
+
+        return [result for _, result, _ in outcomes]
 
     async def _check_website_ssl_with_retry(self, website: Website) -> Dict[str, Any]:
-        """재시도 포함 웹사이트 SSL 체크
+        """재시도 포함 웹사이트 SSL 체크 및 결과 저장 (단일 웹사이트용)
 
         Args:
             website: 체크할 웹사이트
@@ -155,6 +244,22 @@ class SSLService:
         Returns:
             체크 결과
         """
+        result, ssl_result = await self._run_ssl_check_with_retry(website)
+        await self._save_check_results([(website, result, ssl_result)])
+        return result
+
+    async def _run_ssl_check_with_retry(
+        self,
+        website: Website
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """재시도 포함 웹사이트 SSL 체크 (DB 저장 없음)
+
+        Args:
+            website: 체크할 웹사이트
+
+        Returns:
+            (체크 결과, SSL 체크 원본 결과 - 실패 시 None)
+        """
         max_retries = 2 if self.retry_failed_checks else 1
         last_error = None
 
@@ -163,27 +268,23 @@ class SSLService:
                 # SSL 체크 수행
                 ssl_result = await self.ssl_checker.check_ssl_certificate(website.url)
 
-                # 성공 시 데이터베이스에 저장
-                ssl_certificate = await self._save_ssl_certificate_result(website, ssl_result)
-
+                # ssl_certificate는 저장 후 _save_check_results에서 채움
                 return {
                     "website_id": str(website.id),
                     "url": website.url,
                     "success": True,
-                    "ssl_certificate": ssl_certificate.to_dict() if ssl_certificate else None,
+                    "ssl_certificate": None,
                     "attempt": attempt + 1,
                     "checked_at": datetime.utcnow().isoformat()
-                }
+                }, ssl_result
 
             except SSLCheckError as e:
                 last_error = str(e)
                 if attempt < max_retries - 1:
                     logger.warning(f"SSL 체크 실패, 재시도: {website.url} (시도 {attempt + 1})")
                     await asyncio.sleep(1)  # 1초 대기 후 재시도
-                else:
-                    # 모든 재시도 실패 시 오류 상태로 저장
-                    await self._save_ssl_error_result(website, last_error)
 
+        # 모든 재시도 실패 - 오류 상태 저장은 _save_check_results에서 수행
         return {
             "website_id": str(website.id),
             "url": website.url,
@@ -191,75 +292,162 @@ class SSLService:
             "error": last_error,
             "attempts": max_retries,
             "checked_at": datetime.utcnow().isoformat()
+        }, None
+
+    async def _save_check_results(
+        self,
+        outcomes: List[Tuple[Website, Dict[str, Any], Optional[Dict[str, Any]]]]
+    ) -> None:
+        """체크 결과를 한 트랜잭션(커밋 1회)으로 저장하고 결과에 저장된 인증서 정보를 채움
+
+        기존 인증서 여부는 웹사이트별 조회 대신 한 번의 쿼리로 미리 조회합니다.
+        일괄 저장이 실패하면(예: 여러 웹사이트가 같은 인증서를 공유해 지문 유니크 충돌)
+        SAVEPOINT만 롤백하고 웹사이트별 SAVEPOINT로 다시 저장해 실패한 웹사이트만 제외합니다.
+        (전체 롤백과 달리 다른 웹사이트 객체가 만료되지 않음)
+
+        Args:
+            outcomes: (웹사이트, 체크 결과, SSL 체크 원본 결과 - 실패 시 None) 목록
+        """
+        if not outcomes:
+            return
+
+        existing_certs = await self._prefetch_existing_certs(
+            [website.id for website, _, ssl_result in outcomes if ssl_result is not None]
+        )
+
+        try:
+            async with self.session.begin_nested():
+                saved = await self._stage_check_results(outcomes, existing_certs)
+
+        except Exception as e:
+            logger.warning(f"SSL 체크 결과 일괄 저장 실패, 웹사이트별 저장으로 대체: {str(e)}")
+
+            saved = []
+            for outcome in outcomes:
+                try:
+                    async with self.session.begin_nested():
+                        staged = await self._stage_check_results([outcome], existing_certs)
+                    # SAVEPOINT가 롤백된 웹사이트의 인증서는 결과에 넣지 않음
+                    saved.extend(staged)
+                except Exception as e:
+                    logger.error(f"SSL 인증서 결과 저장 실패: {outcome[0].url} - {str(e)}")
+
+        await self.session.commit()
+
+        for result, ssl_certificate in saved:
+            if ssl_certificate is None:
+                continue
+            try:
+                result["ssl_certificate"] = ssl_certificate.to_dict()
+            except Exception as e:
+                logger.warning(f"SSL 인증서 정보 변환 실패: {result['url']} - {str(e)}")
+
+    async def _prefetch_existing_certs(
+        self,
+        website_ids: List[uuid.UUID]
+    ) -> Dict[Tuple[uuid.UUID, str], uuid.UUID]:
+        """웹사이트들의 기존 인증서를 한 번의 쿼리로 조회
+
+        Args:
+            website_ids: 웹사이트 ID 목록
+
+        Returns:
+            (웹사이트 ID, 지문) -> 인증서 ID 딕셔너리
+        """
+        if not website_ids:
+            return {}
+
+        result = await self.session.execute(
+            select(SSLCertificate.website_id, SSLCertificate.fingerprint, SSLCertificate.id)
+            .where(SSLCertificate.website_id.in_(website_ids))
+        )
+        return {
+            (website_id, fingerprint): cert_id
+            for website_id, fingerprint, cert_id in result
         }
 
-    async def _save_ssl_certificate_result(
+    async def _stage_check_results(
         self,
-        website: Website,
-        ssl_result: Dict[str, Any]
-    ) -> Optional[SSLCertificate]:
-        """SSL 체크 결과를 데이터베이스에 저장
+        outcomes: List[Tuple[Website, Dict[str, Any], Optional[Dict[str, Any]]]],
+        existing_certs: Dict[Tuple[uuid.UUID, str], uuid.UUID]
+    ) -> List[Tuple[Dict[str, Any], Optional[SSLCertificate]]]:
+        """체크 결과를 세션에 반영 (커밋하지 않음)
+
+        새 인증서는 세션에 추가하고, 기존 인증서는 기본 키 기준 일괄 UPDATE 한 번으로 갱신합니다.
 
         Args:
-            website: 웹사이트 객체
-            ssl_result: SSL 체크 결과
+            outcomes: (웹사이트, 체크 결과, SSL 체크 원본 결과 - 실패 시 None) 목록
+            existing_certs: _prefetch_existing_certs 결과
 
         Returns:
-            저장된 SSL 인증서 객체
+            (체크 결과, 갱신되거나 추가된 SSL 인증서 객체) 목록
         """
-        try:
+        staged: List[Tuple[Dict[str, Any], Optional[SSLCertificate]]] = []
+        updates: List[Dict[str, Any]] = []
+        updated: List[Tuple[Dict[str, Any], uuid.UUID]] = []
+
+        for website, result, ssl_result in outcomes:
+            if ssl_result is None:
+                if result.get("attempts"):
+                    # 재시도까지 모두 실패한 체크만 오류 상태로 기록
+                    self._stage_ssl_error_result(website, result.get("error"))
+                continue
+
             cert_info = ssl_result["certificate"]
 
             # 상태 결정
             status = self._determine_ssl_status(ssl_result)
 
-            # 기존 인증서와 중복 확인 (fingerprint 기준)
+            # 기존 인증서와 중복 확인 (fingerprint 기준, DB에는 소문자 16진수로 저장됨)
             fingerprint = cert_info["fingerprint"]
-            existing_cert = await self._find_existing_certificate(website.id, fingerprint)
+            existing_cert_id = existing_certs.get((website.id, fingerprint.strip().lower()))
 
-            if existing_cert:
-                # 기존 인증서 업데이트
-                existing_cert.last_checked = datetime.utcnow()
-                existing_cert.status = status
-                await self.session.commit()
-                return existing_cert
-            else:
-                # 새 인증서 생성
-                ssl_certificate = SSLCertificate(
-                    website_id=website.id,
-                    issuer=cert_info["issuer"],
-                    subject=cert_info["subject"],
-                    serial_number=cert_info["serial_number"],
-                    issued_date=cert_info["not_before"],
-                    expiry_date=cert_info["not_after"],
-                    fingerprint=fingerprint,
-                    status=status
-                )
+            if existing_cert_id is not None:
+                # 기존 인증서 업데이트 (아래에서 일괄 UPDATE)
+                updates.append({"id": existing_cert_id, "status": status})
+                updated.append((result, existing_cert_id))
+                continue
 
-                self.session.add(ssl_certificate)
-                await self.session.commit()
-                await self.session.refresh(ssl_certificate)
+            # 새 인증서 생성
+            ssl_certificate = SSLCertificate(
+                website_id=website.id,
+                issuer=cert_info["issuer"],
+                subject=cert_info["subject"],
+                serial_number=cert_info["serial_number"],
+                issued_date=cert_info["not_before"],
+                expiry_date=cert_info["not_after"],
+                fingerprint=fingerprint,
+                status=status
+            )
+            self.session.add(ssl_certificate)
+            staged.append((result, ssl_certificate))
 
-                logger.debug(f"새 SSL 인증서 저장됨: {website.url}")
-                return ssl_certificate
+        if updates:
+            # 기본 키 기준 ORM 일괄 UPDATE (executemany) - last_checked는 onupdate로 DB 시계 기준 갱신
+            await self.session.execute(update(SSLCertificate), updates)
 
-        except Exception as e:
-            await self.session.rollback()
-            logger.error(f"SSL 인증서 결과 저장 실패: {website.url} - {str(e)}")
-            return None
+            # 결과에 담을 갱신된 인증서를 한 번에 다시 로드 (세션에 있던 객체도 새 값으로 갱신)
+            reloaded = await self.session.execute(
+                select(SSLCertificate)
+                .where(SSLCertificate.id.in_([cert_id for _, cert_id in updated]))
+                .execution_options(populate_existing=True)
+            )
+            certs_by_id = {cert.id: cert for cert in reloaded.scalars()}
+            staged.extend((result, certs_by_id.get(cert_id)) for result, cert_id in updated)
 
-    async def _save_ssl_error_result(self, website: Website, error_message: str):
-        """SSL 오류 결과를 데이터베이스에 저장
+        return staged
+
+    def _stage_ssl_error_result(self, website: Website, error_message: Optional[str]) -> None:
+        """SSL 오류 결과를 세션에 추가 (커밋하지 않음, 생성 실패는 해당 웹사이트만 건너뜀)
 
         Args:
             website: 웹사이트 객체
             error_message: 오류 메시지
         """
         try:
-            # 기존 오류 인증서가 있는지 확인
             error_fingerprint = f"error_{website.id}_{int(datetime.utcnow().timestamp())}"
 
-            ssl_certificate = SSLCertificate(
+            self.session.add(SSLCertificate(
                 website_id=website.id,
                 issuer="Error",
                 subject=f"CN={website.url}",
@@ -268,43 +456,10 @@ class SSLService:
                 expiry_date=datetime.utcnow(),
                 fingerprint=error_fingerprint,
                 status=SSLStatus.INVALID
-            )
-
-            self.session.add(ssl_certificate)
-            await self.session.commit()
-
-            logger.debug(f"SSL 오류 결과 저장됨: {website.url} - {error_message}")
+            ))
 
         except Exception as e:
-            await self.session.rollback()
-            logger.error(f"SSL 오류 결과 저장 실패: {website.url} - {str(e)}")
-
-    async def _find_existing_certificate(
-        self,
-        website_id: uuid.UUID,
-        fingerprint: str
-    ) -> Optional[SSLCertificate]:
-        """기존 인증서 찾기
-
-        Args:
-            website_id: 웹사이트 ID
-            fingerprint: 인증서 지문
-
-        Returns:
-            기존 인증서 또는 None
-        """
-        try:
-            result = await self.session.execute(
-                select(SSLCertificate).where(
-                    and_(
-                        SSLCertificate.website_id == website_id,
-                        SSLCertificate.fingerprint == fingerprint
-                    )
-                )
-            )
-            return result.scalar_one_or_none()
-        except Exception:
-            return None
+            logger.error(f"SSL 오류 결과 저장 실패: {website.url} - {error_message} ({str(e)})")
 
     def _determine_ssl_status(self, ssl_result: Dict[str, Any]) -> SSLStatus:
         """SSL 체크 결과로부터 상태 결정
@@ -326,51 +481,73 @@ class SSLService:
         else:
             return SSLStatus.UNKNOWN
 
-    async def detect_expiring_certificates(self, days_list: List[int] = None) -> Dict[int, List[Dict]]:
+    async def detect_expiring_certificates(
+        self,
+        days_list: List[int] = None,
+        now: Optional[datetime] = None
+    ) -> Dict[int, List[Tuple[Website, SSLCertificate]]]:
         """만료 임박 인증서 감지
 
+        모든 일수 구간을 한 번의 쿼리로 조회한 뒤 만료일 기준으로 구간별로 나눕니다.
+
         Args:
             days_list: 체크할 일수 목록 (기본: [30, 7, 1])
+            now: 기준 시각 (UTC, None이면 현재 시각)
 
         Returns:
-            일수별 만료 임박 인증서 딕셔너리
+            일수별 (웹사이트, 인증서) 목록 딕셔너리
         """
         if days_list is None:
             days_list = [30, 7, 1]
 
+        if not days_list:
+            return {}
+
         try:
-            expiring_by_days = {}
-
-            for days in days_list:
-                target_date = datetime.utcnow() + timedelta(days=days)
-                start_date = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-                end_date = target_date.replace(hour=23, minute=59, second=59, microsecond=999999)
-
-                result = await self.session.execute(
-                    select(Website, SSLCertificate)
-                    .join(SSLCertificate, Website.id == SSLCertificate.website_id)
-                    .where(
-                        and_(
-                            Website.is_active == True,
-                            SSLCertificate.status == SSLStatus.VALID,
-                            SSLCertificate.expiry_date >= start_date,
-                            SSLCertificate.expiry_date <= end_date
-                        )
-                    )
-                    .order_by(SSLCertificate.expiry_date)
+            today = (now or datetime.utcnow()).replace(hour=0, minute=0, second=0, microsecond=0)
+            days_list = list(dict.fromkeys(days_list))  # 순서 유지 중복 제거
+
+            # 전체 범위(최소 ~ 최대 일수)를 선두 조건으로 두어 (status, expiry_date) 인덱스를
+            # 한 번의 범위 스캔으로 사용하고, 일수별 구간은 나머지 필터로 적용
+            range_start = today + timedelta(days=min(days_list))
+            range_end = today + timedelta(days=max(days_list) + 1)
+
+            # 일수별 구간: 오늘 + days일의 00:00:00 ~ 23:59:59.999999 (UTC)
+            windows = [
+                and_(
+                    SSLCertificate.expiry_date >= today + timedelta(days=days),
+                    SSLCertificate.expiry_date < today + timedelta(days=days + 1)
                 )
+                for days in days_list
+            ]
 
-                expiring_certs = []
-                for website, cert in result.all():
-                    expiring_certs.append({
-                        "website": website.to_dict(),
-                        "ssl_certificate": cert.to_dict(),
-                        "days_until_expiry": cert.days_until_expiry(),
-                        "urgency": cert.get_notification_urgency()
-                    })
-
-                expiring_by_days[days] = expiring_certs
+            result = await self.session.execute(
+                select(Website, SSLCertificate)
+                .join(SSLCertificate, Website.id == SSLCertificate.website_id)
+                .where(
+                    and_(
+                        Website.is_active == True,
+                        SSLCertificate.status == SSLStatus.VALID,
+                        SSLCertificate.expiry_date >= range_start,
+                        SSLCertificate.expiry_date < range_end,
+                        or_(*windows)
+                    )
+                )
+                .order_by(SSLCertificate.expiry_date)
+            )
 
+            expiring_by_days: Dict[int, List[Tuple[Website, SSLCertificate]]] = {
+                days: [] for days in days_list
+            }
+            for website, cert in result.all():
+                expiry_date = cert.expiry_date
+                if expiry_date.tzinfo is not None:
+                    expiry_date = expiry_date.astimezone(timezone.utc)
+                days = (expiry_date.date() - today.date()).days
+                if days in expiring_by_days:
+                    expiring_by_days[days].append((website, cert))
+
+            for days, expiring_certs in expiring_by_days.items():
                 logger.info(f"만료 임박 인증서 감지 ({days}일): {len(expiring_certs)}개")
 
             return expiring_by_days
@@ -408,7 +585,7 @@ class SSLService:
 
             status_distribution = {}
             for status, count in status_result.all():
-                status_distribution[status.value] = count
+                status_distribution[status] = count
 
             # 만료 임박 통계
             expiring_stats = await self._get_expiring_statistics()
@@ -20,6 +20,7 @@ from ..models.ssl_certificate import SSLCertificate, SSLStatus
 from ..lib.website_manager import WebsiteManager, WebsiteManagerError
 from ..lib.ssl_checker import SSLChecker, SSLCheckError
 from ..database import get_async_session
+from .notification_service import invalidate_website_ssl_cache
 
 
 # 로깅 설정
@@ -634,6 +635,7 @@ class WebsiteService:
                 result.update(ssl_result)
                 result["ssl_rechecked"] = True
 
+            invalidate_website_ssl_cache(website_id)
             logger.info(f"웹사이트 업데이트 완료: {website_id}")
             return result
 
@@ -688,7 +690,7 @@ class WebsiteService:
                         "issued_date": latest_ssl.issued_date.isoformat() if latest_ssl.issued_date else None,
                         "expiry_date": latest_ssl.expiry_date.isoformat() if latest_ssl.expiry_date else None,
                         "fingerprint": latest_ssl.fingerprint,
-                        "status": latest_ssl.status.value if hasattr(latest_ssl.status, 'value') else str(latest_ssl.status),
+                        "status": str(latest_ssl.status),
                         "last_checked": latest_ssl.last_checked.isoformat() if latest_ssl.last_checked else None,
                         "created_at": latest_ssl.created_at.isoformat() if latest_ssl.created_at else None,
                         "days_until_expiry": latest_ssl.days_until_expiry() if hasattr(latest_ssl, 'days_until_expiry') else None,
@@ -767,6 +769,7 @@ class WebsiteService:
             }
             result.update(ssl_result)
 
+            invalidate_website_ssl_cache(website_id)
             logger.info(f"수동 SSL 체크 완료: {website.url}")
             return result
 
@@ -940,7 +943,7 @@ class WebsiteService:
 
             status_stats = {}
             for status, count in status_result.all():
-                status_stats[status.value] = count
+                status_stats[status] = count
 
             # 만료 임박 통계
             now = datetime.now(timezone.utc)
@@ -987,6 +990,7 @@ class WebsiteService:
             success = await self.website_manager.delete_website(website_id)
 
             if success:
+                invalidate_website_ssl_cache(website_id)
                 logger.info(f"웹사이트 삭제 및 정리 완료: {website_id}")
 
             return success
@@ -0,0 +1,38 @@
+"""
+프론트엔드 라우트 단위 테스트
+
+- 대시보드/설정 페이지와 JS 자산이 제공된다
+- 프론트엔드 서빙이 /api 경로의 슬래시 리다이렉트를 가리지 않는다
+"""
+
+import httpx
+import pytest
+
+from backend.src import main as main_module
+
+
+@pytest.mark.unit
+class TestFrontendRoutes:
+    """프론트엔드 라우트 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_api_collection_without_slash_redirects(self, async_client: httpx.AsyncClient):
+        """GET /api/websites가 /api/websites/로 리다이렉트되는지 테스트"""
+        response = await async_client.get("/api/websites", follow_redirects=False)
+
+        assert response.status_code == 307
+        assert response.headers["location"].endswith("/api/websites/")
+
+    @pytest.mark.asyncio
+    async def test_pages_and_assets_served(self, async_client: httpx.AsyncClient):
+        """대시보드, 설정 페이지, JS 파일이 캐시 제어 헤더와 함께 제공되는지 테스트"""
+        if not main_module._FRONTEND_INDEX_EXISTS:
+            pytest.skip("프론트엔드 파일 없음")
+
+        for path in ("/", "/settings.html", "/js/api.js", "/static/js/api.js"):
+            response = await async_client.get(path)
+
+            assert response.status_code == 200, path
+            assert response.headers["cache-control"] == main_module._CACHE_HEADERS["Cache-Control"]
+
+        assert "text/html" in (await async_client.get("/")).headers["content-type"]
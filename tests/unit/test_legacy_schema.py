@@ -0,0 +1,85 @@
+"""
+기존(마이그레이션 이전) 스키마 호환성 단위 테스트
+
+- DB 기본값이 없는 last_checked 컬럼(NOT NULL)에도 인증서를 저장할 수 있다
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import AsyncGenerator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateTable
+
+from backend.src.database import Base
+from backend.src.models.website import Website
+from backend.src.models.ssl_certificate import SSLCertificate
+
+
+@pytest.fixture
+async def legacy_session() -> AsyncGenerator[AsyncSession, None]:
+    """last_checked에 DB 기본값이 없는 SQLite 스키마 세션 픽스처"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    # 기존 스키마: last_checked DATETIME NOT NULL (DEFAULT 없음)
+    ddl = str(CreateTable(SSLCertificate.__table__).compile(dialect=sqlite.dialect()))
+    legacy_ddl = ddl.replace(
+        "last_checked DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL",
+        "last_checked DATETIME NOT NULL",
+    )
+    assert legacy_ddl != ddl
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[Website.__table__])
+        await conn.execute(text(legacy_ddl))
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+
+    await engine.dispose()
+
+
+@pytest.mark.unit
+class TestLegacyLastChecked:
+    """DB 기본값이 없는 last_checked 컬럼 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_insert_without_db_default(self, legacy_session: AsyncSession):
+        """last_checked를 지정하지 않아도 INSERT 시 체크 시각이 채워지는지 테스트"""
+        now = datetime.now(timezone.utc)
+
+        # Given: 기존 스키마의 웹사이트
+        website = Website.create(url=f"https://legacy-{uuid.uuid4().hex[:8]}.com")
+        legacy_session.add(website)
+        await legacy_session.flush()
+
+        # When: last_checked 없이 인증서 저장
+        certificate = SSLCertificate(
+            website_id=website.id,
+            issuer="Test CA",
+            subject="CN=legacy.example.com",
+            serial_number="12345",
+            issued_date=now - timedelta(days=30),
+            expiry_date=now + timedelta(days=60),
+            fingerprint=uuid.uuid4().hex * 2,
+        )
+        legacy_session.add(certificate)
+        await legacy_session.commit()
+
+        # Then: NOT NULL 위반 없이 저장되고 체크 시각이 로드됨
+        assert certificate.last_checked is not None
+        stored = (
+            await legacy_session.execute(
+                text("SELECT last_checked FROM ssl_certificates WHERE fingerprint = :fp"),
+                {"fp": bytes.fromhex(certificate.fingerprint)},
+            )
+        ).scalar_one()
+        assert stored is not None
@@ -0,0 +1,90 @@
+"""
+알림 발송 기록 단위 테스트
+
+- 오류 알림은 웹사이트별 하루 한 번만 발송 권한을 얻는다
+- 발송 실패로 기록을 해제하면 같은 날 다시 발송 권한을 얻을 수 있다
+"""
+
+import uuid
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.models.website import Website
+from backend.src.models.notification_log import NotificationLog
+
+
+@pytest.fixture
+async def log_websites(db_session: AsyncSession) -> list[Website]:
+    """알림 대상 웹사이트 픽스처 (테스트마다 새로 생성)"""
+    websites = [
+        Website.create(url=f"https://notify-{uuid.uuid4().hex[:8]}.com", name=f"Notify {i}")
+        for i in range(2)
+    ]
+    db_session.add_all(websites)
+    await db_session.commit()
+    return websites
+
+
+@pytest.mark.unit
+class TestNotificationLogClaim:
+    """일일 발송 권한 선점 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_claim_daily_only_once_per_day(
+        self,
+        db_session: AsyncSession,
+        log_websites: list[Website],
+    ):
+        """같은 날 두 번째 선점은 이미 기록된 웹사이트를 제외하는지 테스트"""
+        first, second = log_websites
+        today = date(2026, 1, 5)
+
+        # Given: 첫 번째 웹사이트만 오늘 발송 권한을 선점
+        claimed = await NotificationLog.claim_daily(db_session, "error", [first.id], today)
+        await db_session.commit()
+        assert claimed == {first.id}
+
+        # When: 두 웹사이트 모두 다시 선점
+        claimed_again = await NotificationLog.claim_daily(
+            db_session, "error", [first.id, second.id], today
+        )
+        await db_session.commit()
+
+        # Then: 아직 기록이 없는 웹사이트만 선점됨
+        assert claimed_again == {second.id}
+
+        # And: 다음 날에는 다시 선점 가능
+        next_day = await NotificationLog.claim_daily(
+            db_session, "error", [first.id], date(2026, 1, 6)
+        )
+        await db_session.commit()
+        assert next_day == {first.id}
+
+    @pytest.mark.asyncio
+    async def test_release_daily_allows_reclaim(
+        self,
+        db_session: AsyncSession,
+        log_websites: list[Website],
+    ):
+        """발송 실패로 기록을 해제하면 같은 날 다시 선점되는지 테스트"""
+        website = log_websites[0]
+        today = date(2026, 1, 5)
+
+        # Given: 선점 후 발송 실패로 기록 해제
+        await NotificationLog.claim_daily(db_session, "error", [website.id], today)
+        await NotificationLog.release_daily(db_session, "error", [website.id], today)
+        await db_session.commit()
+
+        # When: 같은 날 다시 선점
+        claimed = await NotificationLog.claim_daily(db_session, "error", [website.id], today)
+        await db_session.commit()
+
+        # Then: 다시 발송 권한을 얻음
+        assert claimed == {website.id}
+
+    @pytest.mark.asyncio
+    async def test_claim_daily_empty_targets(self, db_session: AsyncSession):
+        """대상이 없으면 쿼리 없이 빈 집합 반환 테스트"""
+        assert await NotificationLog.claim_daily(db_session, "error", [], date(2026, 1, 5)) == set()
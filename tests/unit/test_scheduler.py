@@ -0,0 +1,85 @@
+"""
+스케줄러 수동 실행 결과 단위 테스트
+
+- 완료된 수동 실행 결과는 TRIGGER_RESULT_TTL 동안만 조회된다
+- 보관 개수를 넘으면 오래된 결과부터 정리된다
+"""
+
+import asyncio
+from typing import Any, Dict
+
+import pytest
+
+from backend.src import scheduler as scheduler_module
+from backend.src.scheduler import SchedulerService
+
+
+async def _finished_task(result: Dict[str, Any]) -> asyncio.Task:
+    """완료된 수동 실행 작업 생성"""
+    async def job() -> Dict[str, Any]:
+        return result
+
+    task = asyncio.create_task(job())
+    await task
+    return task
+
+
+@pytest.mark.unit
+class TestTriggerResults:
+    """수동 실행 결과 보관 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_running_then_finished(self):
+        """실행 중에는 running, 완료 후에는 결과가 조회되는지 테스트"""
+        scheduler = SchedulerService()
+
+        # Given: 실행 중인 수동 작업
+        pending = asyncio.get_running_loop().create_future()
+        scheduler._pending["task-1"] = pending
+        assert scheduler.get_trigger_result("task-1")["status"] == "running"
+        pending.cancel()
+
+        # When: 작업 완료 후 결과 보관
+        task = await _finished_task({"status": "completed"})
+        scheduler._store_trigger_result("task-1", task)
+
+        # Then: 완료 결과가 조회됨
+        assert scheduler.get_trigger_result("task-1") == {
+            "task_id": "task-1",
+            "status": "finished",
+            "result": {"status": "completed"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_result_expires_after_ttl(self):
+        """TTL이 지난 결과는 조회되지 않고 정리되는지 테스트"""
+        scheduler = SchedulerService()
+
+        # Given: TTL보다 오래전에 완료된 결과
+        task = await _finished_task({"status": "completed"})
+        scheduler._store_trigger_result("old-task", task)
+        finished_at, result = scheduler._results["old-task"]
+        scheduler._results["old-task"] = (
+            finished_at - scheduler_module.TRIGGER_RESULT_TTL - 1,
+            result,
+        )
+
+        # When/Then: 조회 시 만료되어 None
+        assert scheduler.get_trigger_result("old-task") is None
+        assert "old-task" not in scheduler._results
+
+    @pytest.mark.asyncio
+    async def test_oldest_results_pruned_over_limit(self, monkeypatch):
+        """보관 개수를 넘으면 가장 오래된 결과부터 정리되는지 테스트"""
+        monkeypatch.setattr(scheduler_module, "TRIGGER_RESULT_MAX", 2)
+        scheduler = SchedulerService()
+
+        # When: 보관 개수보다 많은 결과 저장
+        for index in range(3):
+            task = await _finished_task({"index": index})
+            scheduler._store_trigger_result(f"task-{index}", task)
+
+        # Then: 가장 오래된 결과만 정리됨
+        assert scheduler.get_trigger_result("task-0") is None
+        assert scheduler.get_trigger_result("task-1") is not None
+        assert scheduler.get_trigger_result("task-2") is not None
@@ -0,0 +1,91 @@
+"""
+시스템 설정 캐시 단위 테스트
+
+- TTL 동안 캐시된 설정을 재사용하고, 지나면 다시 로드한다
+- 로드 도중 무효화되면 읽어 온 설정을 캐시하지 않는다
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.models.settings import Settings
+from backend.src.services import settings_cache
+from backend.src.services.settings_cache import get_cached_settings, invalidate_settings_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_settings_cache():
+    """테스트 전후 설정 캐시 초기화"""
+    invalidate_settings_cache()
+    yield
+    invalidate_settings_cache()
+
+
+@pytest.fixture
+async def stored_settings(db_session: AsyncSession) -> Settings:
+    """저장된 시스템 설정 픽스처"""
+    settings = await db_session.get(Settings, 1)
+    if settings is None:
+        settings = Settings(id=1)
+        db_session.add(settings)
+        await db_session.commit()
+    return settings
+
+
+@pytest.mark.unit
+class TestSettingsCache:
+    """시스템 설정 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_cached_within_ttl(self, db_session: AsyncSession, stored_settings: Settings):
+        """TTL 안에서는 캐시된 설정 재사용 테스트"""
+        # When: 두 번 조회
+        first = await get_cached_settings(db_session)
+        second = await get_cached_settings(db_session)
+
+        # Then: 같은 인스턴스가 반환됨
+        assert first is second
+
+    @pytest.mark.asyncio
+    async def test_reloaded_after_ttl(
+        self,
+        db_session: AsyncSession,
+        stored_settings: Settings,
+        monkeypatch,
+    ):
+        """TTL이 지나면 DB에서 다시 로드하는지 테스트"""
+        # Given: 즉시 만료되는 캐시
+        monkeypatch.setattr(settings_cache, "SETTINGS_CACHE_TTL", 0)
+
+        # When: 두 번 조회
+        first = await get_cached_settings(db_session)
+        second = await get_cached_settings(db_session)
+
+        # Then: 두 번째 조회는 새로 로드한 인스턴스
+        assert first is not second
+        assert second.id == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_load_not_cached(
+        self,
+        db_session: AsyncSession,
+        stored_settings: Settings,
+        monkeypatch,
+    ):
+        """로드 도중 무효화되면 캐시에 저장하지 않는지 테스트"""
+        # Given: 조회 직후 다른 요청이 설정을 변경(무효화)하는 상황
+        original_get = db_session.get
+
+        async def get_then_invalidate(*args, **kwargs):
+            result = await original_get(*args, **kwargs)
+            invalidate_settings_cache()
+            return result
+
+        monkeypatch.setattr(db_session, "get", get_then_invalidate)
+
+        # When: 설정 조회
+        settings = await get_cached_settings(db_session)
+
+        # Then: 설정은 반환되지만 캐시에는 남지 않음
+        assert settings.id == 1
+        assert settings_cache._settings_cache is None
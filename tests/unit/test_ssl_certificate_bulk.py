@@ -0,0 +1,296 @@
+"""
+SSL 인증서 일괄 저장 단위 테스트
+
+- INSERT ... ON CONFLICT 문은 지문 충돌 시 체크 결과(status, last_checked, error_message)만 갱신한다
+- upsert_many / async_upsert는 새 지문은 추가하고 기존 지문은 같은 행을 갱신한다
+- bulk_copy는 SQLite에서 executemany로, PostgreSQL에서 COPY 레코드로 적재한다
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Dict
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from backend.src.models.website import Website
+from backend.src.models.ssl_certificate import SSLCertificate, SSLStatus
+
+
+def _cert_info(website_id: uuid.UUID, fingerprint: str, **overrides: Any) -> Dict[str, Any]:
+    """테스트용 인증서 정보 딕셔너리 생성"""
+    now = datetime.now(timezone.utc)
+    info = {
+        "website_id": website_id,
+        "issuer": "Test CA",
+        "subject": "CN=bulk.example.com",
+        "serial_number": "12345",
+        "issued_date": now - timedelta(days=30),
+        "expiry_date": now + timedelta(days=60),
+        "fingerprint": fingerprint,
+    }
+    info.update(overrides)
+    return info
+
+
+def _upsert_values(website_id: uuid.UUID) -> list[dict]:
+    """_upsert_statement에 전달할 컬럼별 값 목록 생성"""
+    now = datetime.now(timezone.utc)
+    record = SSLCertificate._bulk_record(_cert_info(website_id, uuid.uuid4().hex * 2), now)
+    values = dict(zip(SSLCertificate._BULK_COLUMNS, record))
+    values["id"] = uuid.uuid4()
+    return [values]
+
+
+@pytest.fixture
+async def bulk_website(db_session: AsyncSession) -> Website:
+    """일괄 저장 대상 웹사이트 픽스처 (테스트마다 새로 생성)"""
+    website = Website.create(url=f"https://bulk-{uuid.uuid4().hex[:8]}.com", name="Bulk Site")
+    db_session.add(website)
+    await db_session.commit()
+    return website
+
+
+@pytest.mark.unit
+class TestUpsertStatement:
+    """INSERT ... ON CONFLICT 문 생성 테스트"""
+
+    @pytest.mark.parametrize(
+        "dialect_name, dialect",
+        [("postgresql", postgresql.dialect()), ("sqlite", sqlite.dialect())],
+    )
+    def test_conflict_updates_check_result_only(self, dialect_name, dialect):
+        """지문 충돌 시 체크 결과 컬럼만 갱신하는지 테스트"""
+        # When: 방언별 문장 생성
+        stmt = SSLCertificate._upsert_statement(dialect_name, _upsert_values(uuid.uuid4()))
+        sql = str(stmt.compile(dialect=dialect))
+
+        # Then: 지문 기준 ON CONFLICT DO UPDATE
+        assert "ON CONFLICT (fingerprint) DO UPDATE SET" in sql
+        set_clause = sql.split("DO UPDATE SET", 1)[1]
+
+        # And: 체크 결과 컬럼만 excluded 값으로 갱신
+        for column in ("status", "last_checked", "error_message"):
+            assert f"{column} = excluded.{column}" in set_clause
+        for column in ("issuer", "subject", "expiry_date", "website_id", "id"):
+            assert f"{column} =" not in set_clause
+
+    def test_unsupported_dialect_rejected(self):
+        """ON CONFLICT를 지원하지 않는 DB는 ValueError 발생 테스트"""
+        with pytest.raises(ValueError):
+            SSLCertificate._upsert_statement("mysql", _upsert_values(uuid.uuid4()))
+
+
+@pytest.mark.unit
+class TestUpsertMany:
+    """upsert_many / async_upsert 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_insert_then_update_same_fingerprint(
+        self,
+        db_session: AsyncSession,
+        bulk_website: Website,
+    ):
+        """같은 지문은 새 행을 만들지 않고 체크 결과만 갱신하는지 테스트"""
+        fingerprint = uuid.uuid4().hex * 2
+
+        # Given: 유효 상태로 저장된 인증서
+        await SSLCertificate.async_upsert(db_session, _cert_info(bulk_website.id, fingerprint))
+        await db_session.commit()
+        original = (
+            await db_session.execute(
+                select(SSLCertificate.id).where(SSLCertificate.website_id == bulk_website.id)
+            )
+        ).scalar_one()
+
+        # When: 같은 지문이 만료 상태로 다시 저장됨 (발급자 등 다른 값은 무시되어야 함)
+        await SSLCertificate.async_upsert(
+            db_session,
+            _cert_info(
+                bulk_website.id,
+                fingerprint.upper(),
+                issuer="Other CA",
+                status=SSLStatus.EXPIRED,
+                error_message="expired",
+            ),
+        )
+        await db_session.commit()
+
+        # Then: 같은 행의 체크 결과만 갱신됨
+        rows = (
+            await db_session.execute(
+                select(
+                    SSLCertificate.id,
+                    SSLCertificate.issuer,
+                    SSLCertificate.status,
+                    SSLCertificate.error_message,
+                ).where(SSLCertificate.website_id == bulk_website.id)
+            )
+        ).all()
+        assert len(rows) == 1
+        cert_id, issuer, status, error_message = rows[0]
+        assert cert_id == original
+        assert issuer == "Test CA"
+        assert status == SSLStatus.EXPIRED
+        assert error_message == "expired"
+
+    @pytest.mark.asyncio
+    async def test_batches_rows(
+        self,
+        db_session: AsyncSession,
+        bulk_website: Website,
+    ):
+        """batch_size보다 많은 행도 모두 저장되는지 테스트"""
+        rows = [_cert_info(bulk_website.id, uuid.uuid4().hex * 2) for _ in range(5)]
+
+        # When: 2행씩 나눠 저장
+        count = await SSLCertificate.upsert_many(db_session, rows, batch_size=2)
+        await db_session.commit()
+
+        # Then: 5행 모두 저장됨
+        assert count == 5
+        saved = (
+            await db_session.execute(
+                select(SSLCertificate.id).where(SSLCertificate.website_id == bulk_website.id)
+            )
+        ).scalars().all()
+        assert len(saved) == 5
+
+    @pytest.mark.asyncio
+    async def test_invalid_rows_rejected_before_execute(
+        self,
+        db_session: AsyncSession,
+        bulk_website: Website,
+    ):
+        """지문/만료일이 유효하지 않으면 전송 전에 ValueError 발생 테스트"""
+        with pytest.raises(ValueError):
+            await SSLCertificate.upsert_many(
+                db_session, [_cert_info(bulk_website.id, "not-a-fingerprint")]
+            )
+
+        issued = datetime.now(timezone.utc)
+        with pytest.raises(ValueError):
+            await SSLCertificate.upsert_many(
+                db_session,
+                [
+                    _cert_info(
+                        bulk_website.id,
+                        uuid.uuid4().hex * 2,
+                        issued_date=issued,
+                        expiry_date=issued,
+                    )
+                ],
+            )
+
+
+class _FakeCopyConnection:
+    """copy_records_to_table 호출 인자를 기록하는 PostgreSQL 연결 대역"""
+
+    def __init__(self):
+        self.dialect = SimpleNamespace(name="postgresql")
+        self.calls: list = []
+
+        async def copy_records_to_table(table_name, records, columns):
+            self.calls.append((table_name, records, columns))
+
+        self._raw = SimpleNamespace(
+            driver_connection=SimpleNamespace(copy_records_to_table=copy_records_to_table)
+        )
+
+    async def get_raw_connection(self):
+        return self._raw
+
+
+@pytest.mark.unit
+class TestBulkCopy:
+    """bulk_copy 일괄 적재 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_sqlite_executemany(
+        self,
+        test_engine: AsyncEngine,
+        db_session: AsyncSession,
+        bulk_website: Website,
+    ):
+        """SQLite에서 executemany로 모든 행이 적재되는지 테스트"""
+        rows = [_cert_info(bulk_website.id, uuid.uuid4().hex * 2) for _ in range(3)]
+        rows[0]["status"] = SSLStatus.EXPIRED
+
+        # When: 연결 단위로 일괄 적재
+        async with test_engine.begin() as conn:
+            count = await SSLCertificate.bulk_copy(conn, rows)
+
+        # Then: 3행 모두 적재되고 id/상태/last_checked가 채워짐
+        assert count == 3
+        saved = (
+            await db_session.execute(
+                select(
+                    SSLCertificate.id,
+                    SSLCertificate.status,
+                    SSLCertificate.last_checked,
+                ).where(SSLCertificate.website_id == bulk_website.id)
+            )
+        ).all()
+        assert len(saved) == 3
+        assert all(cert_id is not None for cert_id, _, _ in saved)
+        assert sorted(status for _, status, _ in saved) == [
+            SSLStatus.EXPIRED,
+            SSLStatus.VALID,
+            SSLStatus.VALID,
+        ]
+        assert all(last_checked is not None for _, _, last_checked in saved)
+
+    @pytest.mark.asyncio
+    async def test_empty_rows(self, test_engine: AsyncEngine):
+        """적재할 행이 없으면 0 반환 테스트"""
+        async with test_engine.begin() as conn:
+            assert await SSLCertificate.bulk_copy(conn, []) == 0
+
+    @pytest.mark.asyncio
+    async def test_postgresql_copy_records_without_id(self):
+        """id가 모두 없으면 id 컬럼을 빼고 COPY 레코드를 만드는지 테스트"""
+        conn = _FakeCopyConnection()
+        website_id = uuid.uuid4()
+        fingerprint = uuid.uuid4().hex * 2
+        info = _cert_info(website_id, fingerprint.upper())
+
+        # When: PostgreSQL 연결로 적재
+        count = await SSLCertificate.bulk_copy(conn, [info])
+
+        # Then: id를 제외한 컬럼 순서로 COPY 호출
+        assert count == 1
+        assert len(conn.calls) == 1
+        table_name, records, columns = conn.calls[0]
+        assert table_name == SSLCertificate.__tablename__
+        assert columns == SSLCertificate._BULK_COLUMNS[1:]
+
+        # And: 지문은 bytes, 상태는 값 문자열, expiry_epoch는 만료일 기준으로 채워짐
+        record = dict(zip(columns, records[0]))
+        assert record["website_id"] == website_id
+        assert record["fingerprint"] == bytes.fromhex(fingerprint)
+        assert record["status"] == "valid"
+        assert record["expiry_epoch"] == int(info["expiry_date"].timestamp())
+        assert record["last_checked"] is not None
+
+    @pytest.mark.asyncio
+    async def test_postgresql_keeps_given_ids(self):
+        """id가 지정된 행이 있으면 id 컬럼을 유지하고 빈 id는 채우는지 테스트"""
+        conn = _FakeCopyConnection()
+        website_id = uuid.uuid4()
+        given_id = uuid.uuid4()
+        rows = [
+            _cert_info(website_id, uuid.uuid4().hex * 2, id=given_id),
+            _cert_info(website_id, uuid.uuid4().hex * 2),
+        ]
+
+        # When: PostgreSQL 연결로 적재
+        await SSLCertificate.bulk_copy(conn, rows)
+
+        # Then: 전체 컬럼으로 전송되고 id가 모두 채워짐
+        _, records, columns = conn.calls[0]
+        assert columns == SSLCertificate._BULK_COLUMNS
+        assert records[0][0] == given_id
+        assert isinstance(records[1][0], uuid.UUID)
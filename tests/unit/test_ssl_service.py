@@ -0,0 +1,189 @@
+"""
+SSL 모니터링 서비스 단위 테스트
+
+- 재확인 대상 웹사이트는 가장 최근 인증서 상태를 기준으로 선정된다
+- 체크 결과 일괄 저장이 실패하면 웹사이트별로 다시 저장해 실패한 웹사이트만 제외된다
+"""
+
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.models.website import Website
+from backend.src.models.ssl_certificate import SSLCertificate, SSLStatus
+from backend.src.services.ssl_service import SSLService
+
+
+def _make_certificate(
+    website: Website,
+    status: SSLStatus,
+    last_checked: datetime,
+    expires_in_days: int = 90,
+    fingerprint: Optional[str] = None,
+) -> SSLCertificate:
+    """테스트용 SSL 인증서 생성"""
+    certificate = SSLCertificate(
+        website_id=website.id,
+        issuer="Test CA",
+        subject=f"CN={website.url}",
+        serial_number="12345",
+        issued_date=datetime.utcnow() - timedelta(days=30),
+        expiry_date=datetime.utcnow() + timedelta(days=expires_in_days),
+        fingerprint=fingerprint or uuid.uuid4().hex * 2,
+        status=status,
+    )
+    certificate.last_checked = last_checked
+    return certificate
+
+
+async def _add_website(db_session: AsyncSession, name: str, is_active: bool = True) -> Website:
+    """테스트용 웹사이트 생성"""
+    website = Website.create(url=f"https://{name}-{uuid.uuid4().hex[:8]}.com", name=name)
+    website.is_active = is_active
+    db_session.add(website)
+    await db_session.flush()
+    return website
+
+
+def _make_outcome(website: Website, fingerprint: str, status: str = "valid"):
+    """테스트용 체크 결과 (웹사이트, 체크 결과, SSL 체크 원본 결과) 생성"""
+    result: Dict[str, Any] = {
+        "website_id": str(website.id),
+        "url": website.url,
+        "success": True,
+        "ssl_certificate": None,
+    }
+    ssl_result = {
+        "status": status,
+        "certificate": {
+            "issuer": "Test CA",
+            "subject": f"CN={website.url}",
+            "serial_number": "12345",
+            "not_before": datetime.utcnow() - timedelta(days=30),
+            "not_after": datetime.utcnow() + timedelta(days=60),
+            "fingerprint": fingerprint,
+        },
+    }
+    return website, result, ssl_result
+
+
+@pytest.mark.unit
+class TestWebsitesDueForCheck:
+    """재확인 대상 웹사이트 선정 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_due_websites_follow_latest_certificate(self, db_session: AsyncSession):
+        """최신 인증서 상태 기준 재확인 대상 선정 테스트"""
+        now = datetime.utcnow()
+
+        # Given: 최근 유효로 확인되고 만료가 먼 웹사이트
+        stable = await _add_website(db_session, "stable")
+        db_session.add(_make_certificate(stable, SSLStatus.VALID, now - timedelta(days=3)))
+
+        # And: 유효 인증서 이후의 체크에서 오류가 난 웹사이트
+        failed_later = await _add_website(db_session, "failed-later")
+        db_session.add(_make_certificate(failed_later, SSLStatus.VALID, now - timedelta(days=7)))
+        db_session.add(_make_certificate(failed_later, SSLStatus.INVALID, now - timedelta(days=1)))
+
+        # And: 만료가 가까운 웹사이트
+        expiring = await _add_website(db_session, "expiring")
+        db_session.add(
+            _make_certificate(expiring, SSLStatus.VALID, now - timedelta(days=3), expires_in_days=20)
+        )
+
+        # And: 재확인 주기가 지난 웹사이트, 아직 체크하지 않은 웹사이트, 비활성 웹사이트
+        stale = await _add_website(db_session, "stale")
+        db_session.add(_make_certificate(stale, SSLStatus.VALID, now - timedelta(days=40)))
+        unchecked = await _add_website(db_session, "unchecked")
+        inactive = await _add_website(db_session, "inactive", is_active=False)
+        await db_session.commit()
+
+        # When: 재확인 대상 조회
+        service = SSLService(session=db_session)
+        due_ids = {website.id for website in await service.get_websites_due_for_check()}
+
+        # Then: 최신 인증서가 안정적인 웹사이트와 비활성 웹사이트만 제외됨
+        assert stable.id not in due_ids
+        assert inactive.id not in due_ids
+        assert failed_later.id in due_ids
+        assert expiring.id in due_ids
+        assert stale.id in due_ids
+        assert unchecked.id in due_ids
+
+
+@pytest.mark.unit
+class TestSaveCheckResults:
+    """체크 결과 저장 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_shared_fingerprint_falls_back_per_website(
+        self,
+        db_session: AsyncSession,
+        monkeypatch,
+    ):
+        """같은 인증서를 공유하는 웹사이트가 있으면 충돌한 웹사이트만 제외되는지 테스트"""
+        # SQLite는 시간대 없는 datetime을 반환하므로 결과 변환은 지문만 담도록 단순화
+        monkeypatch.setattr(
+            SSLCertificate, "to_dict", lambda self: {"fingerprint": self.fingerprint}
+        )
+
+        # Given: 같은 지문의 인증서를 받은 두 웹사이트와 다른 인증서를 받은 웹사이트
+        shared_fingerprint = uuid.uuid4().hex * 2
+        first = await _add_website(db_session, "shared-first")
+        second = await _add_website(db_session, "shared-second")
+        other = await _add_website(db_session, "other")
+        await db_session.commit()
+
+        outcomes = [
+            _make_outcome(first, shared_fingerprint),
+            _make_outcome(second, shared_fingerprint),
+            _make_outcome(other, uuid.uuid4().hex * 2),
+        ]
+
+        # When: 체크 결과 저장
+        service = SSLService(session=db_session)
+        await service._save_check_results(outcomes)
+
+        # Then: 지문이 충돌한 두 번째 웹사이트만 저장되지 않음
+        rows = await db_session.execute(
+            select(SSLCertificate.website_id)
+            .where(SSLCertificate.website_id.in_([first.id, second.id, other.id]))
+        )
+        saved_website_ids = set(rows.scalars().all())
+        assert saved_website_ids == {first.id, other.id}
+
+        # And: 저장된 웹사이트의 결과에만 인증서 정보가 채워짐
+        results = [result for _, result, _ in outcomes]
+        assert results[0]["ssl_certificate"] == {"fingerprint": shared_fingerprint}
+        assert results[1]["ssl_certificate"] is None
+        assert results[2]["ssl_certificate"] is not None
+
+        # And: 롤백 후에도 다른 웹사이트 객체는 만료되지 않고 사용 가능
+        assert other.url.startswith("https://other-")
+
+    @pytest.mark.asyncio
+    async def test_existing_certificate_updated_in_place(self, db_session: AsyncSession):
+        """이미 저장된 인증서는 새로 추가하지 않고 상태만 갱신되는지 테스트"""
+        # Given: 유효 상태로 저장된 인증서
+        website = await _add_website(db_session, "existing")
+        certificate = _make_certificate(website, SSLStatus.VALID, datetime.utcnow() - timedelta(days=7))
+        db_session.add(certificate)
+        await db_session.commit()
+
+        # When: 같은 지문의 인증서가 만료 상태로 확인됨
+        service = SSLService(session=db_session)
+        await service._save_check_results(
+            [_make_outcome(website, certificate.fingerprint, status="expired")]
+        )
+
+        # Then: 인증서는 하나만 있고 상태가 갱신됨
+        rows = await db_session.execute(
+            select(SSLCertificate).where(SSLCertificate.website_id == website.id)
+        )
+        certificates = rows.scalars().all()
+        assert len(certificates) == 1
+        assert certificates[0].status == SSLStatus.EXPIRED
@@ -0,0 +1,218 @@
+"""
+Teams 웹훅 발송 단위 테스트
+
+- 공유 HTTP 클라이언트가 이벤트 루프별로 재사용/종료된다
+- 전송 오류와 429/5xx 응답은 재시도하고, 그 밖의 오류 응답은 바로 실패 처리한다
+- 연속 실패가 기준을 넘으면 서킷 브레이커가 발송을 중단한다
+"""
+
+import asyncio
+from typing import Callable, List
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.lib import notification_service as notification_lib
+from backend.src.lib.notification_service import NotificationService
+
+WEBHOOK_URL = "https://example.webhook.office.com/webhook"
+
+
+@pytest.fixture
+async def reset_http_client(monkeypatch):
+    """공유 HTTP 클라이언트 상태 초기화 픽스처"""
+    monkeypatch.setattr(notification_lib, "_http_client", None)
+    monkeypatch.setattr(notification_lib, "_http_client_loop", None)
+    yield
+    await notification_lib.close_http_client()
+
+
+@pytest.fixture
+async def mock_webhook(reset_http_client, monkeypatch):
+    """응답 순서를 지정할 수 있는 Teams 웹훅 목 (백오프 대기 없음)
+
+    응답 목록의 각 항목은 상태 코드(int) 또는 발생시킬 httpx 예외 클래스입니다.
+    """
+    requests: List[httpx.Request] = []
+    responses: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        outcome = responses.pop(0) if responses else 200
+        if isinstance(outcome, type) and issubclass(outcome, Exception):
+            raise outcome("webhook unavailable", request=request)
+        return httpx.Response(outcome)
+
+    loop = asyncio.get_running_loop()
+    monkeypatch.setattr(
+        notification_lib,
+        "_http_client",
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    monkeypatch.setattr(notification_lib, "_http_client_loop", loop)
+
+    original_sleep = asyncio.sleep
+
+    async def no_backoff(delay, *args, **kwargs):
+        await original_sleep(0)
+
+    monkeypatch.setattr(notification_lib.asyncio, "sleep", no_backoff)
+
+    # 서킷 브레이커 상태 초기화
+    monkeypatch.setitem(notification_lib._breaker, "fails", 0)
+    monkeypatch.setitem(notification_lib._breaker, "open_until", 0.0)
+
+    def respond_with(*outcomes) -> List[httpx.Request]:
+        responses.extend(outcomes)
+        return requests
+
+    return respond_with
+
+
+def _service(session: AsyncSession, retry_count: int = 3) -> NotificationService:
+    """웹훅 URL이 지정된 알림 서비스 생성"""
+    return NotificationService(session=session, webhook_url=WEBHOOK_URL, retry_count=retry_count)
+
+
+@pytest.mark.unit
+class TestTeamsWebhookRetry:
+    """Teams 웹훅 재시도 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_retries_server_errors_until_success(
+        self,
+        db_session: AsyncSession,
+        mock_webhook: Callable,
+    ):
+        """429/5xx 응답은 재시도 후 성공하는지 테스트"""
+        # Given: 429, 503 후 성공하는 웹훅
+        requests = mock_webhook(429, 503, 200)
+
+        # When: 메시지 발송
+        success = await _service(db_session)._post_teams_message({"text": "test"})
+
+        # Then: 세 번째 시도에서 성공
+        assert success is True
+        assert len(requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_client_error_not_retried(
+        self,
+        db_session: AsyncSession,
+        mock_webhook: Callable,
+    ):
+        """4xx 응답(429 제외)은 재시도하지 않는지 테스트"""
+        # Given: 400을 반환하는 웹훅
+        requests = mock_webhook(400, 200)
+
+        # When: 메시지 발송
+        success = await _service(db_session)._post_teams_message({"text": "test"})
+
+        # Then: 한 번만 시도하고 실패
+        assert success is False
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_retried_up_to_retry_count(
+        self,
+        db_session: AsyncSession,
+        mock_webhook: Callable,
+    ):
+        """타임아웃/연결 오류는 retry_count만큼 재시도하는지 테스트"""
+        # Given: 읽기 타임아웃 후 연결 오류가 나는 웹훅
+        requests = mock_webhook(httpx.ReadTimeout, httpx.ConnectError, 200)
+
+        # When: 재시도 2회로 발송
+        success = await _service(db_session, retry_count=2)._post_teams_message({"text": "test"})
+
+        # Then: 2회 시도 후 실패
+        assert success is False
+        assert len(requests) == 2
+
+        # When: 남은 응답(성공)으로 다시 발송
+        assert await _service(db_session, retry_count=2)._post_teams_message({"text": "test"}) is True
+
+
+@pytest.mark.unit
+class TestTeamsWebhookCircuitBreaker:
+    """Teams 웹훅 서킷 브레이커 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_breaker_opens_after_consecutive_failures(
+        self,
+        db_session: AsyncSession,
+        mock_webhook: Callable,
+    ):
+        """연속 실패 후 발송을 생략하고, 열림 시간이 지나면 복구되는지 테스트"""
+        threshold = notification_lib._BREAKER_FAILURE_THRESHOLD
+        service = _service(db_session)
+
+        # Given: 기준 횟수만큼 연속 실패 (400은 재시도 없이 실패)
+        requests = mock_webhook(*([400] * threshold))
+        for _ in range(threshold):
+            assert await service._send_teams_message({"text": "test"}) is False
+        assert len(requests) == threshold
+
+        # When: 브레이커가 열린 상태에서 발송
+        result = await service._send_teams_message({"text": "test"})
+
+        # Then: 웹훅을 호출하지 않고 실패 처리
+        assert result is False
+        assert len(requests) == threshold
+
+        # When: 열림 시간이 지난 뒤 발송 성공
+        notification_lib._breaker["open_until"] = 0.0
+        assert await service._send_teams_message({"text": "test"}) is True
+
+        # Then: 실패 횟수가 초기화됨
+        assert notification_lib._breaker["fails"] == 0
+
+
+@pytest.mark.unit
+class TestSharedHttpClient:
+    """공유 HTTP 클라이언트 수명 주기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_within_same_loop(self, reset_http_client):
+        """같은 이벤트 루프에서는 같은 클라이언트 재사용 테스트"""
+        # When: 같은 루프에서 두 번 조회
+        first = await notification_lib._get_http_client()
+        second = await notification_lib._get_http_client()
+
+        # Then: 같은 클라이언트가 반환됨
+        assert first is second
+        assert not first.is_closed
+
+    @pytest.mark.asyncio
+    async def test_client_from_other_loop_is_closed(self, reset_http_client):
+        """다른 이벤트 루프에서 만든 클라이언트는 교체 시 종료되는지 테스트"""
+        # Given: 다른 이벤트 루프에 묶인 기존 클라이언트
+        old_client = await notification_lib._get_http_client()
+        other_loop = asyncio.new_event_loop()
+        notification_lib._http_client_loop = other_loop
+
+        try:
+            # When: 현재 루프에서 클라이언트 조회
+            new_client = await notification_lib._get_http_client()
+        finally:
+            other_loop.close()
+
+        # Then: 새 클라이언트가 만들어지고 기존 클라이언트는 종료됨
+        assert new_client is not old_client
+        assert old_client.is_closed
+        assert notification_lib._http_client_loop is asyncio.get_running_loop()
+
+    @pytest.mark.asyncio
+    async def test_close_http_client_resets_state(self, reset_http_client):
+        """close_http_client 호출 시 클라이언트 종료 및 상태 초기화 테스트"""
+        # Given: 생성된 공유 클라이언트
+        client = await notification_lib._get_http_client()
+
+        # When: 종료
+        await notification_lib.close_http_client()
+
+        # Then: 클라이언트가 닫히고 다음 조회 시 새로 생성됨
+        assert client.is_closed
+        assert notification_lib._http_client is None
+        assert await notification_lib._get_http_client() is not client
@@ -0,0 +1,122 @@
+"""
+웹사이트 SSL 조회 캐시 단위 테스트
+
+- 수동 알림 대상 조회 결과는 TTL 동안 캐시된다
+- 웹사이트 수정/비활성화/삭제 후에는 캐시 항목이 제거되어 다음 조회가 DB를 다시 읽는다
+"""
+
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.models.website import Website
+from backend.src.models.ssl_certificate import SSLCertificate
+from backend.src.services import notification_service as notification_module
+from backend.src.services.notification_service import NotificationService
+from backend.src.services.website_service import WebsiteService
+
+
+class _FakeWebsiteManager:
+    """WebsiteManager 대역 (조회/수정/삭제만 세션에 직접 반영)"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_website_by_id(self, website_id):
+        return await self.session.get(Website, website_id)
+
+    async def update_website(self, website_id, url=None, name=None, is_active=None):
+        website = await self.session.get(Website, website_id)
+        if name is not None:
+            website.name = name
+        if is_active is not None:
+            website.is_active = is_active
+        await self.session.commit()
+        return SimpleNamespace(to_dict=lambda: {"id": str(website_id)})
+
+    async def delete_website(self, website_id):
+        await self.session.delete(await self.session.get(Website, website_id))
+        await self.session.commit()
+        return True
+
+
+@pytest.fixture
+async def cached_website(db_session: AsyncSession, monkeypatch) -> Website:
+    """인증서가 있는 웹사이트를 만들고 SSL 조회 캐시에 올려 두는 픽스처"""
+    monkeypatch.setattr(notification_module, "_website_ssl_cache", OrderedDict())
+
+    now = datetime.now(timezone.utc)
+    website = Website.create(url=f"https://cache-{uuid.uuid4().hex[:8]}.com", name="Cache Site")
+    db_session.add(website)
+    await db_session.flush()
+    db_session.add(
+        SSLCertificate(
+            website_id=website.id,
+            issuer="Test CA",
+            subject="CN=cache.example.com",
+            serial_number="12345",
+            issued_date=now - timedelta(days=30),
+            expiry_date=now + timedelta(days=60),
+            fingerprint=uuid.uuid4().hex * 2,
+        )
+    )
+    await db_session.commit()
+
+    cached = await NotificationService(session=db_session)._get_website_with_ssl(website.id)
+    assert cached is not None
+    assert website.id in notification_module._website_ssl_cache
+    return website
+
+
+def _website_service(session: AsyncSession) -> WebsiteService:
+    """WebsiteManager 대역을 사용하는 웹사이트 서비스 생성"""
+    service = WebsiteService(session)
+    service.website_manager = _FakeWebsiteManager(session)
+    return service
+
+
+@pytest.mark.unit
+class TestWebsiteSSLCacheInvalidation:
+    """웹사이트 변경 시 SSL 조회 캐시 무효화 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_deactivate_evicts_cache(
+        self,
+        db_session: AsyncSession,
+        cached_website: Website,
+    ):
+        """비활성화 후 캐시가 제거되고 다음 조회가 변경을 반영하는지 테스트"""
+        # When: 웹사이트 비활성화
+        await _website_service(db_session).update_website_with_ssl_recheck(
+            cached_website.id, is_active=False
+        )
+
+        # Then: 캐시 항목이 제거됨
+        assert cached_website.id not in notification_module._website_ssl_cache
+
+        # And: 다음 조회는 비활성 상태를 반환
+        website, _ = await NotificationService(session=db_session)._get_website_with_ssl(
+            cached_website.id
+        )
+        assert website.is_active is False
+
+    @pytest.mark.asyncio
+    async def test_delete_evicts_cache(
+        self,
+        db_session: AsyncSession,
+        cached_website: Website,
+    ):
+        """삭제 후 캐시가 제거되어 삭제된 웹사이트가 조회되지 않는지 테스트"""
+        # When: 웹사이트 삭제
+        assert await _website_service(db_session).delete_website_with_cleanup(cached_website.id)
+
+        # Then: 캐시 항목이 제거되고 조회 결과가 없음
+        assert cached_website.id not in notification_module._website_ssl_cache
+        assert (
+            await NotificationService(session=db_session)._get_website_with_ssl(cached_website.id)
+            is None
+        )